@@ -4,7 +4,8 @@ Visualizes agent autonomy levels as horizontal bars
 Shows: Which agents have what level of decision freedom
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
+from agents.font_registry import get_font
 
 
 class AutonomySpectrumRenderer:
@@ -38,14 +39,9 @@ class AutonomySpectrumRenderer:
         draw = ImageDraw.Draw(img)
 
         # Load fonts
-        try:
-            font_title = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 20)
-            font_label = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 12)
-            font_small = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 10)
-        except:
-            font_title = ImageFont.load_default()
-            font_label = ImageFont.load_default()
-            font_small = ImageFont.load_default()
+        font_title = get_font('display', 20)
+        font_label = get_font('display', 12)
+        font_small = get_font('display', 10)
 
         # Title
         draw.text((20, 20), "AGENT AUTONOMY", fill=self._hex_to_rgb(self.colors['text']), font=font_title)
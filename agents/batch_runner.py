@@ -0,0 +1,433 @@
+"""
+Batch Runner
+Render many YAML breakdowns in one process.
+
+Running arkify.py once per project pays interpreter startup, imports,
+font loading and icon-cache setup for every breakdown. The batch runner
+resolves a set of inputs (directories, globs, manifests), then renders
+them all with one pipeline (orchestrator or compositor) whose agents,
+fonts, icon cache and gradient cache are reused across jobs. With
+workers > 1 the jobs are spread over a RenderPool of warm processes.
+
+Inputs:
+    examples/                 every *.yaml / *.yml in the directory
+    'projects/**/*.yaml'      glob pattern (quote it in the shell)
+    nightly.txt               manifest: one path or glob per line, '#' comments,
+                              relative paths resolved against the manifest's directory
+
+Usage:
+    from agents.batch_runner import BatchRunner, resolve_inputs
+
+    runner = BatchRunner(pipeline='phase0', workers=8)
+    results = runner.run(resolve_inputs(['examples/']))
+    runner.print_report(results)
+"""
+
+import contextlib
+import glob
+import importlib
+import io
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+import yaml
+
+
+REQUIRED_FIELDS = ['name', 'hours', 'cost', 'tech_stack', 'learning']
+
+# Shown by the CLIs when required project fields are missing
+FIELD_HELP = {
+    'name': 'Project name',
+    'hours': 'Total hours spent',
+    'cost': 'Total cost in currency',
+    'tech_stack': 'List of technologies',
+    'learning': 'Key lesson learned',
+}
+YAML_SUFFIXES = ('.yaml', '.yml')
+
+# libyaml-backed loader when PyYAML was built with it (same results, ~10x faster)
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Pipeline name -> (module, class, required project fields)
+PIPELINES = {
+    'phase0': ('agents.orchestrator', 'MiniOrchestrator', REQUIRED_FIELDS),
+    'phase1': ('agents.orchestrator_phase1', 'OrchestratorPhase1', ['name', 'hours', 'cost', 'learning']),
+    'phase2': ('agents.layout_compositor_phase2', 'LayoutCompositorPhase2', ['name']),
+    'phase2.1': ('agents.layout_compositor_phase2_1', 'LayoutCompositorPhase21', ['name']),
+}
+
+# Pipelines whose agent picks its own output path (generate()); the others
+# are compose()d into output/<project-name>-<pipeline>.png
+ORCHESTRATED_PIPELINES = ('phase0', 'phase1')
+
+# Pipeline name -> tech stack drawn as icons when the project lists none (None: draws no icons)
+ICON_DEFAULTS = {
+    'phase0': [],
+    'phase1': [],
+    'phase2': None,
+    'phase2.1': ['Python', 'PIL', 'cairosvg', 'Git'],
+}
+
+
+def pipeline_icon_names(pipeline: str, project: Dict[str, Any]) -> List[str]:
+    """Technologies whose icons a pipeline draws for a project (renderers draw at most four)."""
+    defaults = ICON_DEFAULTS[pipeline]
+    if defaults is None:
+        return []
+    return list(project.get('tech_stack') or defaults)[:4]
+
+
+class JobResult(NamedTuple):
+    """Outcome of one batch job (a NamedTuple: importing dataclasses costs single-file startup ~7ms)."""
+    input_path: Path
+    output_path: Optional[Path]
+    seconds: float
+    error: Optional[str] = None
+    details: Optional[str] = None  # traceback for unexpected failures
+    cached: bool = False  # served from the render cache
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def resolve_inputs(sources: Iterable[str]) -> List[Path]:
+    """
+    Expand directories, globs and manifests into YAML paths.
+
+    Args:
+        sources: Directories, glob patterns, manifest files or YAML files
+
+    Returns:
+        Unique paths in first-seen order (directories and globs sorted)
+
+    Raises:
+        ValueError: If a source matches nothing
+    """
+    paths: List[Path] = []
+    seen = set()
+
+    def add(path: Path):
+        key = path.resolve()
+        if key not in seen:
+            seen.add(key)
+            paths.append(path)
+
+    for source in sources:
+        for path in _expand(source, Path('.')):
+            add(path)
+
+    return paths
+
+
+def _expand(source: str, base: Path) -> List[Path]:
+    path = Path(source)
+    if not path.is_absolute():
+        path = base / path
+
+    if path.is_dir():
+        return sorted(p for p in path.iterdir() if p.suffix in YAML_SUFFIXES and p.is_file())
+
+    if path.is_file():
+        if path.suffix in YAML_SUFFIXES:
+            return [path]
+        return _read_manifest(path)
+
+    if glob.has_magic(str(path)):
+        matches = sorted(Path(p) for p in glob.glob(str(path), recursive=True))
+        matches = [p for p in matches if p.suffix in YAML_SUFFIXES and p.is_file()]
+        if matches:
+            return matches
+
+    raise ValueError(f"No YAML inputs found for '{source}'")
+
+
+def _read_manifest(manifest: Path) -> List[Path]:
+    """One path or glob per line; blank lines and '#' comments ignored."""
+    paths: List[Path] = []
+    for line in manifest.read_text().splitlines():
+        entry = line.split('#', 1)[0].strip()
+        if entry:
+            paths.extend(_expand(entry, manifest.parent))
+    return paths
+
+
+class MissingFieldsError(ValueError):
+    """Required project fields are missing (names in .missing)."""
+
+    def __init__(self, missing: List[str]):
+        self.missing = missing
+        super().__init__(f"Missing required fields: {', '.join(missing)}")
+
+
+def field_help(fields: Iterable[str]) -> List[str]:
+    """'  - field: description' lines for CLI error messages."""
+    return [f"  - {field}: {FIELD_HELP.get(field, '')}" for field in fields]
+
+
+def load_project(input_path: Path, required_fields: List[str] = REQUIRED_FIELDS) -> Dict[str, Any]:
+    """
+    Load and validate one project YAML.
+
+    Raises:
+        ValueError: If the file cannot be parsed or is not a project mapping
+        MissingFieldsError: If required fields are missing
+    """
+    try:
+        with open(input_path, 'r') as f:
+            project_data = yaml.load(f, Loader=YAML_LOADER)
+    except (OSError, yaml.YAMLError) as e:
+        raise ValueError(f"Error loading YAML: {e}")
+
+    return validate_project(project_data, required_fields)
+
+
+def validate_project(project_data: Any, required_fields: List[str] = REQUIRED_FIELDS) -> Dict[str, Any]:
+    """
+    Check parsed project data ({'project': {...}}) for required fields.
+
+    Raises:
+        ValueError: If the data is not a mapping or required fields are missing
+    """
+    if not isinstance(project_data, dict):
+        raise ValueError("Project data is not a mapping")
+
+    project = project_data.get('project', {})
+    if not isinstance(project, dict):
+        raise ValueError("'project' is not a mapping")
+
+    missing_fields = [f for f in required_fields if f not in project]
+    if missing_fields:
+        raise MissingFieldsError(missing_fields)
+
+    return project_data
+
+
+class Pipeline:
+    """
+    Uniform render call over the orchestrators and compositors.
+
+    Orchestrators (phase0, phase1) pick their own output path from the
+    project name; compositors (phase2, phase2.1) are given
+    output/<project-name>-<pipeline>.png, so no two pipelines write the
+    same file. With use_cache, unchanged inputs are served
+    from the render cache (see agents/render_cache.py); the agent is only
+    imported and built on the first cache miss, so a cached render never
+    loads the renderers.
+    """
+
+    def __init__(self,
+                 name: str = 'phase0',
+                 output_dir: str = 'output',
+                 use_cache: bool = True,
+                 draft: bool = False):
+        """
+        Args:
+            name: Key of PIPELINES
+            output_dir: Output directory for compositor pipelines
+            use_cache: Serve repeated renders from output/.render_cache
+            draft: Save without PNG optimization (faster, larger files; not
+                stored in the render cache)
+
+        Raises:
+            ValueError: If the pipeline name is unknown
+        """
+        if name not in PIPELINES:
+            raise ValueError(f"Unknown pipeline '{name}' (choose from {', '.join(PIPELINES)})")
+
+        self.module_name, self.class_name, self.required_fields = PIPELINES[name]
+        self.name = name
+        self.output_dir = Path(output_dir)
+        self.draft = draft
+        self.last_cached = False
+        self._agent = None
+
+        self.cache = None
+        if use_cache:
+            from agents.render_cache import RenderCache
+            self.cache = RenderCache()
+
+    @property
+    def agent(self):
+        """Orchestrator or compositor (imported and built on first use)."""
+        if self._agent is None:
+            self._agent = getattr(importlib.import_module(self.module_name), self.class_name)()
+            compositor = getattr(self._agent, 'layout_compositor', self._agent)
+            compositor.engine.draft = self.draft
+        return self._agent
+
+    def warm(self):
+        """Build the agent now instead of on the first cache miss (render workers)."""
+        return self.agent
+
+    def render(self, project_data: Dict[str, Any]) -> Path:
+        """Render one project (or restore it from the render cache), returning the output path."""
+        self.last_cached = False
+        if self.cache is None:
+            return self._render(project_data)
+
+        output_path = self.cache.restore(self._cache_key(project_data), self._compositor_output(project_data))
+        if output_path is not None:
+            self.last_cached = True
+            print(f"  ♻️  Unchanged input, reused cached render: {output_path}")
+            return output_path
+
+        output_path = self._render(project_data)
+        if not self.draft:
+            # Keyed again after rendering: icons this render fetched are cached now
+            self.cache.put(self._cache_key(project_data), output_path)
+        return output_path
+
+    def _cache_key(self, project_data: Dict[str, Any]) -> Optional[str]:
+        return self.cache.key(self.name, project_data, pipeline_icon_names(self.name, project_data['project']))
+
+    def _compositor_output(self, project_data: Dict[str, Any]) -> Optional[Path]:
+        """Output path of compositor pipelines (None for orchestrators, which choose their own)."""
+        if self.name in ORCHESTRATED_PIPELINES:
+            return None
+        project_name = str(project_data['project']['name']).lower().replace(' ', '-')
+        return self.output_dir / f"{project_name}-{self.name}.png"
+
+    def _render(self, project_data: Dict[str, Any]) -> Path:
+        if self.name in ORCHESTRATED_PIPELINES:
+            return Path(self.agent.generate(project_data))
+
+        project = project_data['project']
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        output_path = self._compositor_output(project_data)
+        if not self.agent.compose(project, str(output_path)):
+            raise RuntimeError(f"{type(self.agent).__name__}.compose() failed")
+        return output_path
+
+    def render_file(self, input_path: Path, quiet: bool = False) -> JobResult:
+        """Load, validate and render one project file (errors captured)."""
+        start = time.perf_counter()
+        try:
+            project_data = load_project(input_path, self.required_fields)
+            output = contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext()
+            with output:
+                output_path = self.render(project_data)
+        except ValueError as e:
+            return JobResult(input_path, None, time.perf_counter() - start, error=str(e))
+        except Exception as e:
+            import traceback
+            return JobResult(input_path, None, time.perf_counter() - start,
+                             error=f"{type(e).__name__}: {e}", details=traceback.format_exc())
+
+        return JobResult(input_path, output_path, time.perf_counter() - start, cached=self.last_cached)
+
+
+class BatchRunner:
+    """
+    Render many projects with one (reused) pipeline.
+
+    A failing job is recorded and the batch continues (unless fail_fast).
+    """
+
+    def __init__(self,
+                 pipeline: str = 'phase0',
+                 quiet: bool = False,
+                 fail_fast: bool = False,
+                 workers: int = 1,
+                 use_cache: bool = True):
+        """
+        Args:
+            pipeline: Key of PIPELINES ('phase0', 'phase1', 'phase2', 'phase2.1')
+            quiet: Suppress per-agent progress output of each job
+            fail_fast: Stop at the first failing job
+            workers: Render processes (1 = render in this process)
+            use_cache: Serve unchanged inputs from the render cache
+        """
+        self.pipeline_name = pipeline
+        self.quiet = quiet
+        self.fail_fast = fail_fast
+        self.workers = workers
+        self.use_cache = use_cache
+        self._pipeline: Optional[Pipeline] = None
+
+    @property
+    def pipeline(self) -> Pipeline:
+        """In-process pipeline (created on first use)."""
+        if self._pipeline is None:
+            self._pipeline = Pipeline(self.pipeline_name, use_cache=self.use_cache)
+        return self._pipeline
+
+    def run(self, input_paths: List[Path]) -> List[JobResult]:
+        """
+        Render all inputs.
+
+        Jobs are reported in completion order (input order when workers == 1).
+
+        Returns:
+            One JobResult per input (fewer if fail_fast stopped early)
+        """
+        results: List[JobResult] = []
+        outputs: Dict[Path, Path] = {}
+        total = len(input_paths)
+
+        if self.workers > 1:
+            from agents.render_pool import RenderPool
+            pool = RenderPool(self.pipeline_name, workers=self.workers, quiet=self.quiet,
+                              use_cache=self.use_cache)
+            jobs = pool.imap(input_paths)
+        else:
+            pool = None
+            jobs = (self.run_one(input_path) for input_path in input_paths)
+
+        try:
+            for i, result in enumerate(jobs, 1):
+                input_path = result.input_path
+                results.append(result)
+
+                status = f"{'♻️ ' if result.cached else '✅'} {result.output_path}" if result.ok else f"❌ {result.error}"
+                print(f"[{i}/{total}] {input_path} ({result.seconds:.2f}s) {status}")
+
+                if result.ok:
+                    previous = outputs.get(result.output_path)
+                    if previous is not None:
+                        print(f"    ⚠️  Overwrote output of {previous} (same project name)")
+                    outputs[result.output_path] = input_path
+                elif self.fail_fast:
+                    break
+        finally:
+            if pool is not None:
+                pool.close(cancel=True)
+
+        return results
+
+    def run_one(self, input_path: Path) -> JobResult:
+        """Load, validate and render one project in this process."""
+        return self.pipeline.render_file(input_path, quiet=self.quiet)
+
+    @staticmethod
+    def print_report(results: List[JobResult]):
+        """Print timing summary and failure report."""
+        failed = [r for r in results if not r.ok]
+        seconds = [r.seconds for r in results if r.ok]
+
+        print("\n" + "=" * 60)
+        print(f"  📊 BATCH SUMMARY: {len(results) - len(failed)}/{len(results)} rendered")
+        print("=" * 60)
+
+        if seconds:
+            total = sum(seconds)
+            ordered = sorted(seconds)
+            print(f"  Total render time: {total:.2f}s")
+            cached = sum(1 for r in results if r.ok and r.cached)
+            if cached:
+                print(f"  Render cache:      {cached}/{len(seconds)} unchanged, reused")
+            print(f"  Per job:           mean {total / len(seconds):.2f}s, "
+                  f"median {ordered[len(ordered) // 2]:.2f}s, max {ordered[-1]:.2f}s")
+
+            slowest = sorted((r for r in results if r.ok), key=lambda r: r.seconds, reverse=True)[:5]
+            print("  Slowest:")
+            for r in slowest:
+                print(f"    {r.seconds:6.2f}s  {r.input_path}")
+
+        if failed:
+            print(f"\n  ❌ FAILURES ({len(failed)}):")
+            for r in failed:
+                print(f"    {r.input_path}: {r.error}")
+                if r.details:
+                    for line in r.details.rstrip().splitlines():
+                        print(f"        {line}")
@@ -0,0 +1,318 @@
+"""
+Chart Renderer
+Pillow-native charts in the Future Dust design system.
+
+graph_generator used to build a matplotlib figure for every two-bar
+chart, encode it as PNG and decode it again. These charts draw straight
+onto a Pillow canvas with the shared fonts (font_registry) and palette,
+in milliseconds and without importing matplotlib. Curves and rings are
+drawn supersampled and downscaled, so they are anti-aliased like the
+matplotlib output.
+
+Charts (draw_* paint into a box on an existing canvas, render_* return
+a new image):
+    draw_bar_chart       horizontal bars with value labels and an x axis
+    draw_comparison      Expected vs Reality bars
+    draw_progress_ring   ring filled to a fraction, label in the middle
+    draw_sparkline       trend line with an end-point marker
+
+Usage:
+    from agents.chart_renderer import ChartStyle, draw_progress_ring, render_comparison
+
+    img = render_comparison(2, 5, 'Days', labels=('2 days', '5 days'))
+    draw_progress_ring(panel, (20, 20, 140, 140), 0.8, label='80%')
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from PIL import Image, ImageColor, ImageDraw
+
+from agents.font_registry import get_font
+
+
+Box = Tuple[int, int, int, int]
+
+SUPERSAMPLE = 4
+
+
+@dataclass
+class ChartStyle:
+    """Colors and typography of a chart (Future Dust palette)."""
+    background: str = '#22223B'
+    text: str = '#F2F4F8'
+    text_dim: str = '#C7C7C7'
+    value_text: str = '#FFFFFF'
+    expected: str = '#6B7280'
+    reality: str = '#06FFA5'
+    track: str = '#4A4E69'
+    font_family: str = 'helvetica'
+    font_size: int = 24
+
+    @classmethod
+    def from_colors(cls, colors: Optional[Dict[str, str]]) -> 'ChartStyle':
+        """Style from a graph_generator colors dict ('expected', 'reality', 'background', 'text')."""
+        style = cls()
+        for key, value in (colors or {}).items():
+            if hasattr(style, key):
+                setattr(style, key, value)
+        return style
+
+    def font(self, scale: float = 1.0, weight: str = 'regular'):
+        return get_font(self.font_family, max(1, round(self.font_size * scale)), weight)
+
+
+def nice_ticks(maximum: float, target: int = 5) -> List[float]:
+    """
+    Axis ticks from 0 covering maximum, on a 1/2/2.5/5 x 10^k step.
+
+    Returns:
+        Tick values (at least [0, step])
+    """
+    if maximum <= 0:
+        return [0, 1]
+    raw_step = maximum / target
+    magnitude = 10 ** math.floor(math.log10(raw_step))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw_step)
+    count = math.ceil(maximum / step - 1e-9)
+    return [i * step for i in range(count + 1)]
+
+
+def _format_tick(value: float) -> str:
+    return f"{value:g}"
+
+
+def draw_bar_chart(canvas: Image.Image,
+                   box: Box,
+                   labels: Sequence[str],
+                   values: Sequence[float],
+                   colors: Sequence[str],
+                   value_labels: Optional[Sequence[str]] = None,
+                   xlabel: Optional[str] = None,
+                   style: Optional[ChartStyle] = None):
+    """
+    Draw horizontal bars with an x axis (first label at the bottom, like matplotlib barh).
+
+    Args:
+        canvas: Image to draw on
+        box: (x0, y0, x1, y1) chart area
+        labels: Category label per bar
+        values: Bar lengths (axis starts at 0)
+        colors: Fill color per bar
+        value_labels: Text inside each bar's end (default: the value)
+        xlabel: Axis title under the ticks
+        style: Colors and fonts
+    """
+    style = style or ChartStyle()
+    draw = ImageDraw.Draw(canvas)
+    x0, y0, x1, y1 = box
+    label_font = style.font()
+    value_font = style.font(1.2, 'bold')
+    value_labels = value_labels or [_format_tick(v) for v in values]
+
+    ticks = nice_ticks(max(values, default=0))
+    pad = style.font_size // 2
+    line_height = style.font_size + pad
+
+    # Plot area: category labels on the left, ticks and axis title below
+    left = x0 + max((label_font.getlength(label) for label in labels), default=0) + 2 * pad
+    bottom = y1 - line_height - (line_height if xlabel else 0) - pad
+    right = x1 - label_font.getlength(_format_tick(ticks[-1])) / 2 - pad
+    top = y0 + pad
+    scale = (right - left) / ticks[-1]
+
+    draw.line([(left, top), (left, bottom)], fill=style.text, width=2)
+    draw.line([(left, bottom), (right, bottom)], fill=style.text, width=2)
+    for tick in ticks:
+        x = left + tick * scale
+        draw.line([(x, bottom), (x, bottom + pad // 2)], fill=style.text, width=2)
+        draw.text((x, bottom + pad), _format_tick(tick), font=label_font, fill=style.text, anchor='mt')
+    if xlabel:
+        draw.text(((left + right) / 2, y1 - pad), xlabel, font=label_font, fill=style.text, anchor='mb')
+
+    band = (bottom - top) / max(len(values), 1)
+    for i, (label, value, color, value_label) in enumerate(zip(labels, values, colors, value_labels)):
+        center = bottom - band * (i + 0.5)
+        bar_half = band * 0.3
+        bar_right = left + max(value, 0) * scale
+        draw.rectangle([left, center - bar_half, bar_right, center + bar_half], fill=color)
+        draw.text((left - pad, center), label, font=label_font, fill=style.text, anchor='rm')
+
+        # Value inside the bar end; next to it when the bar is too short
+        text_width = value_font.getlength(value_label)
+        if bar_right - left > text_width + 2 * pad:
+            draw.text((left + (bar_right - left) * 0.95, center), value_label,
+                      font=value_font, fill=style.value_text, anchor='rm')
+        else:
+            draw.text((bar_right + pad, center), value_label, font=value_font, fill=style.text, anchor='lm')
+
+
+def draw_comparison(canvas: Image.Image,
+                    box: Box,
+                    expected: float,
+                    reality: float,
+                    xlabel: Optional[str] = None,
+                    labels: Optional[Tuple[str, str]] = None,
+                    style: Optional[ChartStyle] = None):
+    """
+    Draw an Expected vs Reality bar pair.
+
+    Args:
+        expected, reality: Values
+        xlabel: Axis title (e.g. 'Days')
+        labels: Value labels for the two bars (default: the values)
+    """
+    style = style or ChartStyle()
+    draw_bar_chart(canvas, box, ['Expected', 'Reality'], [expected, reality],
+                   [style.expected, style.reality], labels, xlabel, style)
+
+
+def _supersampled(canvas: Image.Image, box: Box, paint: Callable[[ImageDraw.ImageDraw, int, int, int], None]):
+    """
+    Paint into box at SUPERSAMPLE x resolution and composite the downscaled result.
+
+    paint(draw, width, height, scale) draws on a transparent layer.
+    """
+    x0, y0, x1, y1 = (int(round(v)) for v in box)
+    width, height = x1 - x0, y1 - y0
+    if width <= 0 or height <= 0:
+        return
+    layer = Image.new('RGBA', (width * SUPERSAMPLE, height * SUPERSAMPLE), (0, 0, 0, 0))
+    paint(ImageDraw.Draw(layer), width * SUPERSAMPLE, height * SUPERSAMPLE, SUPERSAMPLE)
+    layer = layer.resize((width, height), Image.LANCZOS)
+    canvas.paste(layer, (x0, y0), layer)
+
+
+def draw_progress_ring(canvas: Image.Image,
+                       box: Box,
+                       fraction: float,
+                       label: Optional[str] = None,
+                       color: Optional[str] = None,
+                       thickness: float = 0.14,
+                       style: Optional[ChartStyle] = None):
+    """
+    Draw a ring filled clockwise from 12 o'clock to fraction (0..1).
+
+    Args:
+        box: Square-ish area (the ring is centered in it)
+        fraction: Filled share, clamped to 0..1 (values > 1 draw a full ring)
+        label: Text in the ring center (default: the percentage)
+        color: Fill color (default: style.reality)
+        thickness: Ring width as a fraction of the diameter
+    """
+    style = style or ChartStyle()
+    color = color or style.reality
+    fraction = min(max(fraction, 0.0), 1.0)
+    x0, y0, x1, y1 = box
+    diameter = min(x1 - x0, y1 - y0)
+    cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+    ring_box = (cx - diameter / 2, cy - diameter / 2, cx + diameter / 2, cy + diameter / 2)
+
+    def paint(draw, width, height, scale):
+        ring_width = max(scale, round(diameter * thickness * scale))
+        bounds = [0, 0, width - 1, height - 1]
+        draw.ellipse(bounds, outline=style.track, width=ring_width)
+        if fraction >= 1.0:
+            draw.ellipse(bounds, outline=color, width=ring_width)
+        elif fraction > 0:
+            draw.arc(bounds, -90, -90 + 360 * fraction, fill=color, width=ring_width)
+
+    _supersampled(canvas, ring_box, paint)
+
+    label = f"{round(fraction * 100)}%" if label is None else label
+    font = get_font(style.font_family, max(1, round(diameter * 0.22)), 'bold')
+    ImageDraw.Draw(canvas).text((cx, cy), label, font=font, fill=style.text, anchor='mm')
+
+
+def draw_sparkline(canvas: Image.Image,
+                   box: Box,
+                   values: Sequence[float],
+                   color: Optional[str] = None,
+                   width: float = 3,
+                   fill: bool = True,
+                   style: Optional[ChartStyle] = None):
+    """
+    Draw a trend line scaled to box, with a dot on the last value.
+
+    Args:
+        values: Series (at least two points to draw a line)
+        color: Line color (default: style.reality)
+        width: Line width in pixels
+        fill: Shade the area under the line
+    """
+    style = style or ChartStyle()
+    color = color or style.reality
+    if len(values) < 2:
+        return
+
+    low, high = min(values), max(values)
+    span = (high - low) or 1.0
+    dot = width * 1.5
+
+    def paint(draw, w, h, scale):
+        margin = dot * scale
+        points = [(margin + i * (w - 2 * margin) / (len(values) - 1),
+                   h - margin - (value - low) / span * (h - 2 * margin))
+                  for i, value in enumerate(values)]
+        if fill:
+            draw.polygon(points + [(points[-1][0], h), (points[0][0], h)],
+                         fill=ImageColor.getrgb(color)[:3] + (48,))
+        draw.line(points, fill=color, width=round(width * scale), joint='curve')
+        x, y = points[-1]
+        draw.ellipse([x - margin, y - margin, x + margin, y + margin], fill=color)
+
+    _supersampled(canvas, box, paint)
+
+
+def _new_canvas(size: Tuple[int, int], style: ChartStyle) -> Image.Image:
+    return Image.new('RGB', size, style.background)
+
+
+def render_bar_chart(labels: Sequence[str],
+                     values: Sequence[float],
+                     colors: Sequence[str],
+                     value_labels: Optional[Sequence[str]] = None,
+                     xlabel: Optional[str] = None,
+                     size: Tuple[int, int] = (900, 600),
+                     style: Optional[ChartStyle] = None) -> Image.Image:
+    """Horizontal bar chart as a new image (see draw_bar_chart)."""
+    style = style or ChartStyle()
+    img = _new_canvas(size, style)
+    margin = style.font_size
+    draw_bar_chart(img, (margin, margin, size[0] - margin, size[1] - margin),
+                   labels, values, colors, value_labels, xlabel, style)
+    return img
+
+
+def render_comparison(expected: float,
+                      reality: float,
+                      xlabel: Optional[str] = None,
+                      labels: Optional[Tuple[str, str]] = None,
+                      size: Tuple[int, int] = (900, 600),
+                      style: Optional[ChartStyle] = None) -> Image.Image:
+    """Expected vs Reality chart as a new image (see draw_comparison)."""
+    style = style or ChartStyle()
+    return render_bar_chart(['Expected', 'Reality'], [expected, reality],
+                            [style.expected, style.reality], labels, xlabel, size, style)
+
+
+def render_progress_ring(fraction: float,
+                         label: Optional[str] = None,
+                         size: int = 240,
+                         style: Optional[ChartStyle] = None) -> Image.Image:
+    """Progress ring as a new square image (see draw_progress_ring)."""
+    style = style or ChartStyle()
+    img = _new_canvas((size, size), style)
+    margin = size // 16
+    draw_progress_ring(img, (margin, margin, size - margin, size - margin), fraction, label, style=style)
+    return img
+
+
+def render_sparkline(values: Sequence[float],
+                     size: Tuple[int, int] = (300, 80),
+                     style: Optional[ChartStyle] = None) -> Image.Image:
+    """Sparkline as a new image (see draw_sparkline)."""
+    style = style or ChartStyle()
+    img = _new_canvas(size, style)
+    draw_sparkline(img, (0, 0, size[0], size[1]), values, style=style)
+    return img
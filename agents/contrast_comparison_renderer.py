@@ -4,7 +4,8 @@ Visualizes before/after contrast improvements
 Shows: Side-by-side comparison with actual visual difference
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
+from agents.font_registry import get_font
 
 
 class ContrastComparisonRenderer:
@@ -42,16 +43,10 @@ class ContrastComparisonRenderer:
         draw = ImageDraw.Draw(img)
 
         # Load fonts
-        try:
-            font_title = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 20)
-            font_large = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 32)
-            font_label = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 14)
-            font_small = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 12)
-        except:
-            font_title = ImageFont.load_default()
-            font_large = ImageFont.load_default()
-            font_label = ImageFont.load_default()
-            font_small = ImageFont.load_default()
+        font_title = get_font('display', 20)
+        font_large = get_font('display', 32)
+        font_label = get_font('display', 14)
+        font_small = get_font('display', 12)
 
         # Title
         draw.text((20, 20), "CONTRAST JOURNEY", fill='#FFFFFF', font=font_title)
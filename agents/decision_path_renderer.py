@@ -4,7 +4,8 @@ Visualizes decision journeys with multiple attempts (fails → success)
 Shows: TRY 1 ❌ → TRY 2 ❌ → TRY 3 ❌ → TRY 4 ✅
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
+from agents.font_registry import get_font
 import os
 
 
@@ -41,16 +42,10 @@ class DecisionPathRenderer:
         draw = ImageDraw.Draw(img)
 
         # Load fonts - INCREASED SIZES for readability
-        try:
-            font_title = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 22)
-            font_label = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 16)
-            font_small = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 13)
-            font_icon = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 32)  # Big icons
-        except:
-            font_title = ImageFont.load_default()
-            font_label = ImageFont.load_default()
-            font_small = ImageFont.load_default()
-            font_icon = ImageFont.load_default()
+        font_title = get_font('display', 22)
+        font_label = get_font('display', 16)
+        font_small = get_font('display', 13)
+        font_icon = get_font('display', 32)  # Big icons
 
         # Title
         title = decision_data.get('name', 'DECISION PATH').upper()
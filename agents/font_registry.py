@@ -0,0 +1,237 @@
+"""
+Font Registry
+Process-wide font lookup and FreeTypeFont cache.
+
+Every agent, renderer and compositor used to open its own TrueType faces
+through try/except chains of macOS paths. The registry probes the font
+search path once (macOS system fonts, then fontconfig / DejaVu on Linux)
+and hands out shared FreeTypeFont objects keyed by (family, size, weight),
+so a full render opens each face exactly once.
+
+Usage:
+    from agents.font_registry import get_font
+
+    font = get_font('display', 20)
+    font_bold = get_font('arial', 32, weight='bold')
+"""
+
+import os
+import shutil
+import subprocess
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from PIL import ImageFont
+
+
+# Preferred font files per (family, weight): (file name, ttc face index).
+# Generic fallbacks ('sans', 'mono') are resolved via fontconfig or DejaVu.
+FAMILY_CANDIDATES: Dict[str, Dict[str, List[Tuple[str, int]]]] = {
+    'helvetica': {
+        'regular': [('Helvetica.ttc', 0)],
+        'bold': [('Helvetica.ttc', 1)],
+    },
+    'display': {
+        'regular': [('SFNSDisplay.ttf', 0), ('SFNS.ttf', 0)],
+        'bold': [('SFNSDisplay-Bold.otf', 0), ('SFNS.ttf', 0)],
+    },
+    'arial': {
+        'regular': [('Arial.ttf', 0)],
+        'bold': [('Arial Bold.ttf', 0)],
+    },
+    'mono': {
+        'regular': [('Monaco.dfont', 0), ('Menlo.ttc', 0)],
+        'bold': [('Menlo.ttc', 1)],
+    },
+    'emoji': {
+        'regular': [('Apple Color Emoji.ttc', 0)],
+        'bold': [('Apple Color Emoji.ttc', 0)],
+    },
+}
+
+# Generic family each named family falls back to
+GENERIC_FAMILY = {
+    'helvetica': 'sans',
+    'display': 'sans',
+    'arial': 'sans',
+    'mono': 'mono',
+    'emoji': 'sans',
+}
+
+# DejaVu files used when fontconfig is not available
+DEJAVU_FILES = {
+    ('sans', 'regular'): 'DejaVuSans.ttf',
+    ('sans', 'bold'): 'DejaVuSans-Bold.ttf',
+    ('mono', 'regular'): 'DejaVuSansMono.ttf',
+    ('mono', 'bold'): 'DejaVuSansMono-Bold.ttf',
+}
+
+DEFAULT_SEARCH_DIRS = [
+    '/System/Library/Fonts',
+    '/System/Library/Fonts/Supplemental',
+    '/Library/Fonts',
+    '~/Library/Fonts',
+    '/usr/share/fonts',
+    '/usr/local/share/fonts',
+    '~/.local/share/fonts',
+    '~/.fonts',
+    'C:/Windows/Fonts',
+]
+
+
+class FontRegistry:
+    """
+    Resolve font families to files once and cache FreeTypeFont objects.
+
+    Thread-safe: fonts may be requested from parallel renderers.
+    """
+
+    def __init__(self, search_dirs: Optional[List[str]] = None):
+        """
+        Args:
+            search_dirs: Directories to index (default: common macOS/Linux/Windows paths)
+        """
+        self.search_dirs = search_dirs or DEFAULT_SEARCH_DIRS
+
+        self._index: Optional[Dict[str, str]] = None  # lowercase file name -> path
+        self._resolved: Dict[Tuple[str, str], Optional[Tuple[str, int]]] = {}
+        self._fonts: Dict[Tuple[str, int, str], ImageFont.ImageFont] = {}
+        self._lock = threading.RLock()
+
+        self.faces_opened = 0
+
+    def get(self, family: str, size: int, weight: str = 'regular') -> ImageFont.ImageFont:
+        """
+        Get a (shared) font object.
+
+        Args:
+            family: 'helvetica', 'display', 'arial', 'mono', 'emoji' or a font file path
+            size: Point size
+            weight: 'regular' | 'bold'
+
+        Returns:
+            FreeTypeFont (or Pillow's default font if nothing is installed)
+        """
+        key = (family, size, weight)
+        font = self._fonts.get(key)
+        if font is not None:
+            return font
+
+        with self._lock:
+            font = self._fonts.get(key)
+            if font is None:
+                font = self._open(family, size, weight)
+                self._fonts[key] = font
+            return font
+
+    def resolve(self, family: str, weight: str = 'regular') -> Optional[Tuple[str, int]]:
+        """
+        Resolve a family to (font file path, face index).
+
+        Returns:
+            (path, index) or None if no matching font is installed
+        """
+        key = (family, weight)
+        with self._lock:
+            if key not in self._resolved:
+                self._resolved[key] = self._probe(family, weight)
+            return self._resolved[key]
+
+    def clear(self):
+        """Forget cached fonts and the probed search path."""
+        with self._lock:
+            self._index = None
+            self._resolved.clear()
+            self._fonts.clear()
+            self.faces_opened = 0
+
+    # === Internals ===
+
+    def _open(self, family: str, size: int, weight: str) -> ImageFont.ImageFont:
+        resolved = self.resolve(family, weight)
+        if resolved is not None:
+            path, index = resolved
+            try:
+                font = ImageFont.truetype(path, size, index=index)
+                self.faces_opened += 1
+                return font
+            except OSError:
+                pass
+
+        # Last resort: Pillow's built-in font (scalable on Pillow >= 10.1)
+        try:
+            return ImageFont.load_default(size)
+        except TypeError:
+            return ImageFont.load_default()
+
+    def _probe(self, family: str, weight: str) -> Optional[Tuple[str, int]]:
+        # Explicit font file path
+        if os.path.sep in family or family.lower().endswith(('.ttf', '.ttc', '.otf', '.dfont')):
+            return (family, 0) if os.path.exists(family) else None
+
+        index = self._file_index()
+
+        for file_name, face in FAMILY_CANDIDATES.get(family, {}).get(weight, []):
+            path = index.get(file_name.lower())
+            if path:
+                return path, face
+
+        generic = GENERIC_FAMILY.get(family, 'sans')
+        path = self._fontconfig_match(generic, weight)
+        if path is None:
+            path = index.get(DEJAVU_FILES.get((generic, weight), 'DejaVuSans.ttf').lower())
+        if path is None and weight != 'regular':
+            return self._probe(family, 'regular')
+
+        return (path, 0) if path else None
+
+    def _file_index(self) -> Dict[str, str]:
+        """Walk the search path once, mapping file names to paths."""
+        if self._index is not None:
+            return self._index
+
+        index: Dict[str, str] = {}
+        for directory in self.search_dirs:
+            root_dir = Path(os.path.expanduser(directory))
+            if not root_dir.is_dir():
+                continue
+            for root, _, files in os.walk(root_dir):
+                for name in files:
+                    index.setdefault(name.lower(), os.path.join(root, name))
+
+        self._index = index
+        return index
+
+    def _fontconfig_match(self, generic: str, weight: str) -> Optional[str]:
+        """Ask fontconfig for the best file of a generic family (Linux)."""
+        if shutil.which('fc-match') is None:
+            return None
+
+        pattern = f"{generic}:bold" if weight == 'bold' else generic
+        try:
+            result = subprocess.run(
+                ['fc-match', '--format=%{file}', pattern],
+                capture_output=True, text=True, timeout=5
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
+
+        path = result.stdout.strip()
+        if result.returncode != 0 or not path.lower().endswith(('.ttf', '.ttc', '.otf')):
+            return None
+        return path if os.path.exists(path) else None
+
+
+# Process-wide registry shared by all agents and renderers
+font_registry = FontRegistry()
+
+
+def get_font(family: str, size: int, weight: str = 'regular') -> ImageFont.ImageFont:
+    """Get a shared font from the process-wide registry."""
+    return font_registry.get(family, size, weight)
+
+
+if __name__ == '__main__':
+    for family in FAMILY_CANDIDATES:
+        for weight in ('regular', 'bold'):
+            print(f"{family:10s} {weight:8s} -> {font_registry.resolve(family, weight)}")
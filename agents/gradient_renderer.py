@@ -2,17 +2,202 @@
 Gradient Renderer Agent
 Creates smooth linear gradients for Canva-style visual depth.
 Supports horizontal, vertical, and diagonal gradients.
-Pure PIL implementation - no numpy required.
+
+Gradients are built as whole arrays instead of per-pixel Python loops:
+axis-aligned gradients are a 1-D ramp stretched to 2-D with Pillow,
+diagonal gradients are computed with NumPy when available (pure PIL
+fallback otherwise). Output is byte-identical to the per-pixel version.
+
+Rendered gradients are memoized in a process-wide GradientCache (bounded
+LRU, optional on-disk tier of raw RGB buffers), so repeated presets at the
+same size cost one memcpy.
 """
 
-from PIL import Image, ImageDraw
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from PIL import Image
 import math
+import threading
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+DIRECTIONS = ('vertical', 'horizontal', 'diagonal-tl-br', 'diagonal-tr-bl')
+
+
+class GradientCache:
+    """
+    Bounded LRU of rendered gradient images.
+
+    Keyed by (start_rgb, end_rgb, width, height, direction), so preset and
+    custom-color gradients share one cache. Memory is bounded by max_bytes
+    (raw RGB size of the stored images). With cache_dir set, raw RGB
+    buffers are also written to disk and reloaded on in-memory misses.
+
+    Callers always receive a copy - cached images are never handed out.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, cache_dir: Optional[Path] = None):
+        """
+        Args:
+            max_bytes: Memory ceiling for cached images (0 disables caching,
+                including the disk tier)
+            cache_dir: Optional directory for raw RGB buffers
+        """
+        self.max_bytes = max_bytes
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+        self._entries: "OrderedDict[Tuple, Image.Image]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def configure(self, max_bytes: Optional[int] = None, cache_dir: Optional[Path] = None):
+        """Change memory ceiling and/or disk directory (evicts if needed)."""
+        with self._lock:
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            if cache_dir is not None:
+                self.cache_dir = Path(cache_dir)
+            self._evict()
+
+    def get(self, key: Tuple) -> Optional[Image.Image]:
+        """Return a copy of the cached gradient, or None on miss."""
+        with self._lock:
+            if self.max_bytes == 0:
+                # Caching disabled: the disk tier is skipped too
+                self.misses += 1
+                return None
+            img = self._entries.get(key)
+            if img is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return img.copy()
+
+        img = self._load_from_disk(key)
+        with self._lock:
+            if img is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._store(key, img)
+        return img.copy()
+
+    def put(self, key: Tuple, img: Image.Image):
+        """Store a rendered gradient (the caller keeps its own image)."""
+        if self.max_bytes == 0:
+            return
+        stored = img.copy()
+        with self._lock:
+            self._store(key, stored)
+        self._save_to_disk(key, stored)
+
+    def clear(self):
+        """Drop all in-memory entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.disk_hits = self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current memory use."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+            }
+
+    # === Internals (call with lock held) ===
+
+    def _store(self, key: Tuple, img: Image.Image):
+        size = self._image_bytes(img)
+        if size > self.max_bytes:
+            return
+
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= self._image_bytes(old)
+
+        self._entries[key] = img
+        self._bytes += size
+        self._evict()
+
+    def _evict(self):
+        while self._entries and self._bytes > self.max_bytes:
+            _, img = self._entries.popitem(last=False)
+            self._bytes -= self._image_bytes(img)
+
+    @staticmethod
+    def _image_bytes(img: Image.Image) -> int:
+        return img.width * img.height * 3
+
+    # === Disk tier ===
+
+    def _disk_path(self, key: Tuple) -> Path:
+        start_rgb, end_rgb, width, height, direction = key
+        start_hex = '%02x%02x%02x' % start_rgb
+        end_hex = '%02x%02x%02x' % end_rgb
+        return self.cache_dir / f"{width}x{height}_{direction}_{start_hex}_{end_hex}.rgb"
+
+    def _load_from_disk(self, key: Tuple) -> Optional[Image.Image]:
+        if self.cache_dir is None:
+            return None
+
+        path = self._disk_path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+
+        width, height = key[2], key[3]
+        if len(data) != width * height * 3:
+            return None
+
+        return Image.frombytes('RGB', (width, height), data)
+
+    def _save_to_disk(self, key: Tuple, img: Image.Image):
+        if self.cache_dir is None:
+            return
+
+        path = self._disk_path(key)
+        if path.exists():
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f'.{threading.get_ident()}.tmp')
+            tmp_path.write_bytes(img.tobytes())
+            tmp_path.replace(path)
+        except OSError:
+            pass
+
+
+# Process-wide cache shared by every GradientRenderer
+shared_gradient_cache = GradientCache()
 
 
 class GradientRenderer:
     """Renders smooth gradient backgrounds"""
 
-    def __init__(self):
+    def __init__(self, cache: Optional[GradientCache] = None):
+        """
+        Args:
+            cache: Gradient cache to use (default: shared process-wide cache)
+        """
+        self.cache = cache if cache is not None else shared_gradient_cache
+
         self.gradients = {
             'fail': ['#E63946', '#D62839'],         # Red gradient
             'success': ['#06FFA5', '#00D981'],      # Green gradient
@@ -39,17 +224,27 @@ class GradientRenderer:
         start_rgb = self._hex_to_rgb(color_start)
         end_rgb = self._hex_to_rgb(color_end)
 
+        if direction not in DIRECTIONS:
+            direction = 'vertical'
+
+        # Check cache
+        key = (start_rgb, end_rgb, width, height, direction)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
         # Create gradient image
         if direction == 'vertical':
-            return self._vertical_gradient(width, height, start_rgb, end_rgb)
+            img = self._vertical_gradient(width, height, start_rgb, end_rgb)
         elif direction == 'horizontal':
-            return self._horizontal_gradient(width, height, start_rgb, end_rgb)
+            img = self._horizontal_gradient(width, height, start_rgb, end_rgb)
         elif direction == 'diagonal-tl-br':
-            return self._diagonal_gradient_tlbr(width, height, start_rgb, end_rgb)
-        elif direction == 'diagonal-tr-bl':
-            return self._diagonal_gradient_trbl(width, height, start_rgb, end_rgb)
+            img = self._diagonal_gradient_tlbr(width, height, start_rgb, end_rgb)
         else:
-            return self._vertical_gradient(width, height, start_rgb, end_rgb)
+            img = self._diagonal_gradient_trbl(width, height, start_rgb, end_rgb)
+
+        self.cache.put(key, img)
+        return img
 
     def create_preset_gradient(self, width, height, preset_name, direction='vertical'):
         """
@@ -71,69 +266,97 @@ class GradientRenderer:
 
     def _vertical_gradient(self, width, height, start_rgb, end_rgb):
         """Vertical gradient (top to bottom)"""
-        img = Image.new('RGB', (width, height))
-        draw = ImageDraw.Draw(img)
+        if width <= 0 or height <= 0:
+            return Image.new('RGB', (width, height))
 
-        for y in range(height):
-            ratio = y / height
-            r = int(start_rgb[0] + (end_rgb[0] - start_rgb[0]) * ratio)
-            g = int(start_rgb[1] + (end_rgb[1] - start_rgb[1]) * ratio)
-            b = int(start_rgb[2] + (end_rgb[2] - start_rgb[2]) * ratio)
-
-            draw.line([(0, y), (width, y)], fill=(r, g, b))
-
-        return img
+        ramp = self._ramp(height, start_rgb, end_rgb)
+        column = Image.frombytes('RGB', (1, height), ramp)
+        return column.resize((width, height), Image.Resampling.NEAREST)
 
     def _horizontal_gradient(self, width, height, start_rgb, end_rgb):
         """Horizontal gradient (left to right)"""
-        img = Image.new('RGB', (width, height))
-        draw = ImageDraw.Draw(img)
+        if width <= 0 or height <= 0:
+            return Image.new('RGB', (width, height))
 
-        for x in range(width):
-            ratio = x / width
-            r = int(start_rgb[0] + (end_rgb[0] - start_rgb[0]) * ratio)
-            g = int(start_rgb[1] + (end_rgb[1] - start_rgb[1]) * ratio)
-            b = int(start_rgb[2] + (end_rgb[2] - start_rgb[2]) * ratio)
-
-            draw.line([(x, 0), (x, height)], fill=(r, g, b))
-
-        return img
+        ramp = self._ramp(width, start_rgb, end_rgb)
+        row = Image.frombytes('RGB', (width, 1), ramp)
+        return row.resize((width, height), Image.Resampling.NEAREST)
 
     def _diagonal_gradient_tlbr(self, width, height, start_rgb, end_rgb):
         """Diagonal gradient (top-left to bottom-right)"""
-        img = Image.new('RGB', (width, height))
-        pixels = img.load()
-        max_dist = math.sqrt(width**2 + height**2)
+        return self._corner_gradient(width, height, start_rgb, end_rgb, from_right=False)
 
-        for y in range(height):
-            for x in range(width):
-                dist = math.sqrt(x**2 + y**2)
-                ratio = dist / max_dist
-                r = int(start_rgb[0] + (end_rgb[0] - start_rgb[0]) * ratio)
-                g = int(start_rgb[1] + (end_rgb[1] - start_rgb[1]) * ratio)
-                b = int(start_rgb[2] + (end_rgb[2] - start_rgb[2]) * ratio)
+    def _diagonal_gradient_trbl(self, width, height, start_rgb, end_rgb):
+        """Diagonal gradient (top-right to bottom-left)"""
+        return self._corner_gradient(width, height, start_rgb, end_rgb, from_right=True)
 
-                pixels[x, y] = (r, g, b)
+    def _ramp(self, length, start_rgb, end_rgb):
+        """
+        Build a 1-D RGB ramp as raw bytes.
 
-        return img
+        Uses the same float math as the original line-by-line renderer
+        (ratio = i / length, truncated to int) so output stays identical.
+        """
+        ramp = bytearray(length * 3)
+        deltas = [end_rgb[c] - start_rgb[c] for c in range(3)]
+
+        for i in range(length):
+            ratio = i / length
+            offset = i * 3
+            for c in range(3):
+                ramp[offset + c] = int(start_rgb[c] + deltas[c] * ratio)
+
+        return bytes(ramp)
+
+    def _corner_gradient(self, width, height, start_rgb, end_rgb, from_right):
+        """
+        Gradient by distance from the top-left (or top-right) corner.
+
+        Args:
+            from_right: Measure distance from the top-right corner
+                        (x distance is width - x, as in the original loop)
+
+        Returns:
+            PIL Image with gradient
+        """
+        if width <= 0 or height <= 0:
+            return Image.new('RGB', (width, height))
 
-    def _diagonal_gradient_trbl(self, width, height, start_rgb, end_rgb):
-        """Diagonal gradient (top-right to bottom-left)"""
-        img = Image.new('RGB', (width, height))
-        pixels = img.load()
         max_dist = math.sqrt(width**2 + height**2)
 
-        for y in range(height):
-            for x in range(width):
-                dist = math.sqrt((width - x)**2 + y**2)
-                ratio = dist / max_dist
-                r = int(start_rgb[0] + (end_rgb[0] - start_rgb[0]) * ratio)
-                g = int(start_rgb[1] + (end_rgb[1] - start_rgb[1]) * ratio)
-                b = int(start_rgb[2] + (end_rgb[2] - start_rgb[2]) * ratio)
+        if not HAS_NUMPY:
+            return self._corner_gradient_pure(width, height, start_rgb, end_rgb,
+                                              from_right, max_dist)
 
-                pixels[x, y] = (r, g, b)
+        xs = np.arange(width, dtype=np.float64)
+        if from_right:
+            xs = width - xs
+        ys = np.arange(height, dtype=np.float64)[:, None]
 
-        return img
+        ratio = np.sqrt(xs * xs + ys * ys) / max_dist
+
+        pixels = np.empty((height, width, 3), dtype=np.uint8)
+        for c in range(3):
+            pixels[:, :, c] = start_rgb[c] + (end_rgb[c] - start_rgb[c]) * ratio
+
+        return Image.fromarray(pixels, 'RGB')
+
+    def _corner_gradient_pure(self, width, height, start_rgb, end_rgb, from_right, max_dist):
+        """Pure PIL fallback for _corner_gradient (no numpy)"""
+        deltas = [end_rgb[c] - start_rgb[c] for c in range(3)]
+        x_dists = [(width - x) if from_right else x for x in range(width)]
+        buf = bytearray(width * height * 3)
+
+        offset = 0
+        for y in range(height):
+            for dx in x_dists:
+                ratio = math.sqrt(dx**2 + y**2) / max_dist
+                buf[offset] = int(start_rgb[0] + deltas[0] * ratio)
+                buf[offset + 1] = int(start_rgb[1] + deltas[1] * ratio)
+                buf[offset + 2] = int(start_rgb[2] + deltas[2] * ratio)
+                offset += 3
+
+        return Image.frombytes('RGB', (width, height), bytes(buf))
 
     def _hex_to_rgb(self, hex_color):
         """Convert hex to RGB tuple"""
@@ -161,3 +384,4 @@ if __name__ == '__main__':
             print(f"✅ Generated: {filename}")
 
     print(f"\n🎨 Generated {len(presets) * len(directions)} gradient test images")
+    print(f"   Cache: {renderer.cache.stats()}")
@@ -3,17 +3,47 @@ Graph Generator Agent
 
 Creates comparison charts for Expected vs Reality.
 Simple, Lovable, Complete - Phase 1 implementation.
+
+Charts are drawn natively with Pillow (agents.chart_renderer) by
+default. backend='matplotlib' keeps the original high-fidelity figures;
+matplotlib is then imported on the first chart, not at module import
+(it costs more than the rest of a render's startup combined).
+
+matplotlib figures are built once per color scheme (ComparisonFigure)
+and reused: each chart only updates the bars, value labels and x range,
+and the Agg canvas buffer is read straight into a Pillow image (no PNG
+encode/decode). generate_comparison_batch() renders many charts, e.g.
+one per project in a batch, on one figure.
 """
 
-import matplotlib
-matplotlib.use('Agg')  # Non-GUI backend
-import matplotlib.pyplot as plt
 from PIL import Image
-import io
 import re
+import threading
+
+from agents.chart_renderer import ChartStyle, render_comparison
+
+
+BACKENDS = ('pillow', 'matplotlib')
+
+# Default colors (Future Dust palette)
+DEFAULT_COLORS = {
+    "expected": "#6B7280",  # Gray (dimmed)
+    "reality": "#06FFA5",   # Electric green (vivid)
+    "background": "#22223B", # Dark background
+    "text": "#F2F4F8"       # Off-white text
+}
 
+CHART_KINDS = ('timeline', 'cost')
 
-def generate_timeline_comparison(expected_timeline, reality_timeline, colors=None):
+
+def _agg_classes():
+    """Import matplotlib's Figure and Agg canvas on first use (no pyplot state)."""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    return Figure, FigureCanvasAgg
+
+
+def generate_timeline_comparison(expected_timeline, reality_timeline, colors=None, backend='pillow'):
     """
     Generate Expected vs Reality timeline bar chart.
 
@@ -21,74 +51,15 @@ def generate_timeline_comparison(expected_timeline, reality_timeline, colors=Non
         expected_timeline: String like "2 days" or "2-3 days"
         reality_timeline: String like "5 days"
         colors: Dict with 'expected' and 'reality' color codes
+        backend: 'pillow' (native, default) or 'matplotlib' (high-fidelity)
 
     Returns:
-        PIL Image object
+        PIL Image object (RGBA)
     """
+    return _comparison_chart('timeline', expected_timeline, reality_timeline, colors, backend)
 
-    # Default colors (Future Dust palette)
-    if colors is None:
-        colors = {
-            "expected": "#6B7280",  # Gray (dimmed)
-            "reality": "#06FFA5",   # Electric green (vivid)
-            "background": "#22223B", # Dark background
-            "text": "#F2F4F8"       # Off-white text
-        }
-
-    # Parse days
-    expected_days = _parse_days(expected_timeline)
-    reality_days = _parse_days(reality_timeline)
-
-    # Create figure
-    fig, ax = plt.subplots(figsize=(6, 4), facecolor=colors["background"])
-    ax.set_facecolor(colors["background"])
-
-    # Data
-    labels = ['Expected', 'Reality']
-    values = [expected_days, reality_days]
-    bar_colors = [colors["expected"], colors["reality"]]
-
-    # Create horizontal bars
-    bars = ax.barh(labels, values, color=bar_colors, height=0.6)
-
-    # Add value labels on bars
-    for i, (bar, value) in enumerate(zip(bars, values)):
-        width = bar.get_width()
-        label = expected_timeline if i == 0 else reality_timeline
-        ax.text(width * 0.95, bar.get_y() + bar.get_height()/2,
-                f'  {label}',
-                ha='right', va='center',
-                color='white',
-                fontsize=14,
-                fontweight='bold')
-
-    # Style
-    ax.set_xlabel('Days', color=colors["text"], fontsize=12)
-    ax.tick_params(colors=colors["text"])
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
-    ax.spines['bottom'].set_color(colors["text"])
-    ax.spines['left'].set_color(colors["text"])
-
-    # Set y-axis labels
-    ax.set_yticks(range(len(labels)))
-    ax.set_yticklabels(labels, color=colors["text"], fontsize=12)
-
-    # Tight layout
-    plt.tight_layout()
-
-    # Convert to PIL Image
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', dpi=150, facecolor=colors["background"])
-    buf.seek(0)
-    img = Image.open(buf)
-
-    plt.close(fig)
-
-    return img
-
-
-def generate_cost_comparison(expected_cost, reality_cost, colors=None):
+
+def generate_cost_comparison(expected_cost, reality_cost, colors=None, backend='pillow'):
     """
     Generate Expected vs Reality cost bar chart.
 
@@ -96,66 +67,164 @@ def generate_cost_comparison(expected_cost, reality_cost, colors=None):
         expected_cost: Number (EUR)
         reality_cost: Number (EUR)
         colors: Dict with color codes
+        backend: 'pillow' (native, default) or 'matplotlib' (high-fidelity)
+
+    Returns:
+        PIL Image object (RGBA)
+    """
+    return _comparison_chart('cost', expected_cost, reality_cost, colors, backend)
+
+
+def generate_comparison_batch(charts, colors=None, backend='pillow'):
+    """
+    Generate many comparison charts in one go.
+
+    With the matplotlib backend all charts are drawn on one reused figure.
+
+    Args:
+        charts: Iterable of (kind, expected, reality) with kind 'timeline' or 'cost'
+        colors: Dict with color codes (shared by all charts)
+        backend: 'pillow' (native, default) or 'matplotlib' (high-fidelity)
 
     Returns:
-        PIL Image object
+        List of PIL Images (RGBA), one per chart
+    """
+    colors = _chart_colors(colors)
+    if backend == 'matplotlib':
+        figure = ComparisonFigure(colors)
+        try:
+            return [figure.render(*_chart_data(kind, expected, reality))
+                    for kind, expected, reality in charts]
+        finally:
+            figure.close()
+    return [_comparison_chart(kind, expected, reality, colors, backend)
+            for kind, expected, reality in charts]
+
+
+def _chart_colors(colors):
+    return dict(DEFAULT_COLORS, **(colors or {}))
+
+
+def _chart_data(kind, expected, reality):
+    """(values, value labels, x axis title) of a comparison chart."""
+    if kind == 'timeline':
+        return [_parse_days(expected), _parse_days(reality)], [str(expected), str(reality)], 'Days'
+    if kind == 'cost':
+        return [expected, reality], [f'€{expected}', f'€{reality}'], 'Cost (EUR)'
+    raise ValueError(f"Unknown chart kind '{kind}' (choose from {', '.join(CHART_KINDS)})")
+
+
+def _comparison_chart(kind, expected, reality, colors, backend):
+    """Two-bar Expected vs Reality chart (900x600 RGBA) on the chosen backend."""
+    colors = _chart_colors(colors)
+    values, value_labels, xlabel = _chart_data(kind, expected, reality)
+
+    if backend == 'pillow':
+        # RGBA like the matplotlib backend's buffer, so callers see one mode
+        return render_comparison(values[0], values[1], xlabel, labels=tuple(value_labels),
+                                 size=(900, 600), style=ChartStyle.from_colors(colors)).convert('RGBA')
+    if backend == 'matplotlib':
+        return comparison_figure(colors).render(values, value_labels, xlabel)
+    raise ValueError(f"Unknown chart backend '{backend}' (choose from {', '.join(BACKENDS)})")
+
+
+class ComparisonFigure:
+    """
+    Reusable matplotlib Expected vs Reality figure (Agg, no pyplot).
+
+    Figure, axes, spines, ticks and labels are styled once; render() only
+    updates the data artists and copies the canvas RGBA buffer.
     """
 
-    # Default colors
-    if colors is None:
-        colors = {
-            "expected": "#6B7280",
-            "reality": "#06FFA5",
-            "background": "#22223B",
-            "text": "#F2F4F8"
-        }
-
-    # Create figure
-    fig, ax = plt.subplots(figsize=(6, 4), facecolor=colors["background"])
-    ax.set_facecolor(colors["background"])
-
-    # Data
-    labels = ['Expected', 'Reality']
-    values = [expected_cost, reality_cost]
-    bar_colors = [colors["expected"], colors["reality"]]
-
-    # Create horizontal bars
-    bars = ax.barh(labels, values, color=bar_colors, height=0.6)
-
-    # Add value labels on bars
-    for bar, value in zip(bars, values):
-        width = bar.get_width()
-        ax.text(width * 0.95, bar.get_y() + bar.get_height()/2,
-                f'  €{value}',
-                ha='right', va='center',
-                color='white',
-                fontsize=14,
-                fontweight='bold')
-
-    # Style
-    ax.set_xlabel('Cost (EUR)', color=colors["text"], fontsize=12)
-    ax.tick_params(colors=colors["text"])
-    ax.spines['top'].set_visible(False)
-    ax.spines['right'].set_visible(False)
-    ax.spines['bottom'].set_color(colors["text"])
-    ax.spines['left'].set_color(colors["text"])
-
-    # Set y-axis labels
-    ax.set_yticks(range(len(labels)))
-    ax.set_yticklabels(labels, color=colors["text"], fontsize=12)
-
-    # Tight layout
-    plt.tight_layout()
-
-    # Convert to PIL Image
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', dpi=150, facecolor=colors["background"])
-    buf.seek(0)
-    img = Image.open(buf)
-
-    plt.close(fig)
-
-    return img
+    def __init__(self, colors=None, figsize=(6, 4), dpi=150):
+        """
+        Args:
+            colors: Dict with 'expected', 'reality', 'background', 'text'
+            figsize: Figure size in inches
+            dpi: Resolution (6x4 in at 150 dpi = 900x600 px)
+        """
+        Figure, FigureCanvasAgg = _agg_classes()
+        colors = _chart_colors(colors)
+        self._lock = threading.Lock()
+
+        self.figure = Figure(figsize=figsize, dpi=dpi, facecolor=colors["background"])
+        self.canvas = FigureCanvasAgg(self.figure)
+        ax = self.figure.add_subplot()
+        ax.set_facecolor(colors["background"])
+
+        # Data artists (updated per chart)
+        labels = ['Expected', 'Reality']
+        self.bars = ax.barh(labels, [1, 1], color=[colors["expected"], colors["reality"]], height=0.6)
+        self.value_texts = [
+            ax.text(0, bar.get_y() + bar.get_height()/2, '',
+                    ha='right', va='center',
+                    color='white',
+                    fontsize=14,
+                    fontweight='bold')
+            for bar in self.bars
+        ]
+
+        # Style
+        ax.set_xlabel('Days', color=colors["text"], fontsize=12)
+        ax.tick_params(colors=colors["text"])
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+        ax.spines['bottom'].set_color(colors["text"])
+        ax.spines['left'].set_color(colors["text"])
+
+        # Set y-axis labels
+        ax.set_yticks(range(len(labels)))
+        ax.set_yticklabels(labels, color=colors["text"], fontsize=12)
+
+        self.axes = ax
+        self.figure.tight_layout()
+
+    def render(self, values, value_labels, xlabel):
+        """
+        Draw one chart.
+
+        Args:
+            values: [expected, reality] bar lengths
+            value_labels: Text at the end of each bar
+            xlabel: Axis title
+
+        Returns:
+            PIL Image (RGBA)
+        """
+        with self._lock:
+            for bar, text, value, label in zip(self.bars, self.value_texts, values, value_labels):
+                bar.set_width(value)
+                text.set_x(value * 0.95)
+                text.set_text(f'  {label}')
+            self.axes.set_xlabel(xlabel)
+
+            # Same range barh autoscaling gives: 0 (sticky) to max + 5% margin
+            self.axes.set_xlim(0, max(max(values), 0) * 1.05 or 1)
+
+            self.canvas.draw()
+            width, height = self.canvas.get_width_height()
+            return Image.frombuffer('RGBA', (width, height), self.canvas.buffer_rgba(),
+                                    'raw', 'RGBA', 0, 1).copy()
+
+    def close(self):
+        """Release the figure's artists."""
+        self.figure.clear()
+
+
+# Process-wide figures per color scheme (single-chart matplotlib calls)
+_figures = {}
+_figures_lock = threading.Lock()
+
+
+def comparison_figure(colors=None):
+    """Shared ComparisonFigure for a color scheme (created on first use)."""
+    colors = _chart_colors(colors)
+    key = tuple(sorted(colors.items()))
+    with _figures_lock:
+        figure = _figures.get(key)
+        if figure is None:
+            figure = _figures[key] = ComparisonFigure(colors)
+        return figure
 
 
 def _parse_days(timeline_str):
@@ -0,0 +1,210 @@
+"""
+Icon Atlas
+Sprite sheets of rasterized icons for multi-icon panels.
+
+Tech stack panels used to open, rasterize and composite every icon on
+its own. An atlas packs the rasterized icons of a tech stack (or a whole
+slug catalog) into one RGBA sheet with a coordinate index; panels then
+place icons by crop-and-paste from that single decoded image.
+
+    sheet (RGBA)                index
+    ┌────┬────┬────┐            {'python': (0, 0, 64, 64),
+    │ py │ gh │ ts │             'github': (64, 0, 64, 64), ...}
+    ├────┼────┼────┤
+    │ ...          │
+    └──────────────┘
+
+Atlases are memoized per (icon files, size) in the process-wide
+icon_atlases cache. For batch runs, a catalog atlas covering every slug
+can be built (or loaded from disk) once and registered; panels whose
+icons it covers crop from it instead of building their own.
+
+Usage:
+    from agents.icon_atlas import icon_atlases
+
+    atlas = icon_atlases.for_icons(icons, size=60)
+    atlas.paste(canvas, 'python', (x, y))
+"""
+
+import json
+import math
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from PIL import Image
+
+from agents.icon_rasterizer import icon_rasterizer
+
+
+class IconAtlas:
+    """One RGBA sheet of equally sized icons plus a slug → box index."""
+
+    def __init__(self, sheet: Image.Image, index: Dict[str, Tuple[int, int, int, int]], size: int):
+        """
+        Args:
+            sheet: RGBA sprite sheet
+            index: slug -> (x, y, width, height) on the sheet
+            size: Icon size in pixels (square cells)
+        """
+        self.sheet = sheet
+        self.index = index
+        self.size = size
+
+    def __contains__(self, slug: str) -> bool:
+        return slug in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def crop(self, slug: str) -> Optional[Image.Image]:
+        """RGBA image of one icon, or None if it is not on the sheet."""
+        box = self.index.get(slug)
+        if box is None:
+            return None
+        x, y, w, h = box
+        return self.sheet.crop((x, y, x + w, y + h))
+
+    def paste(self, canvas: Image.Image, slug: str, position: Tuple[int, int]) -> bool:
+        """
+        Composite one icon onto canvas (alpha as mask).
+
+        Returns:
+            False if the slug is not on the sheet (caller draws a fallback)
+        """
+        icon_img = self.crop(slug)
+        if icon_img is None:
+            return False
+        canvas.paste(icon_img, position, mask=icon_img.split()[3])
+        return True
+
+    def save(self, path: str):
+        """Write the sheet (PNG) and its index (same name, .json)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.sheet.save(path, 'PNG', optimize=True)
+        path.with_suffix('.json').write_text(json.dumps(
+            {'size': self.size, 'index': self.index}, indent=2, sort_keys=True))
+
+    @classmethod
+    def load(cls, path: str) -> 'IconAtlas':
+        """
+        Load an atlas written by save().
+
+        Raises:
+            ValueError: If the sheet or its index cannot be read
+        """
+        path = Path(path)
+        try:
+            meta = json.loads(path.with_suffix('.json').read_text())
+            with Image.open(path) as sheet:
+                sheet = sheet.convert('RGBA')
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Not an icon atlas: {path} ({e})")
+
+        index = {slug: tuple(box) for slug, box in meta['index'].items()}
+        return cls(sheet, index, meta['size'])
+
+
+def build_atlas(icons: List[Dict[str, Any]], size: int) -> IconAtlas:
+    """
+    Rasterize icons and pack them into one sheet.
+
+    Args:
+        icons: Icon metadata from IconFetcher ('slug' and 'path')
+        size: Icon size in pixels
+
+    Returns:
+        IconAtlas (icons that cannot be rasterized are left out)
+    """
+    rasters: Dict[str, Image.Image] = {}
+    for icon in icons:
+        slug = icon['slug']
+        if slug not in rasters:
+            img = icon_rasterizer.rasterize(icon['path'], size)
+            if img is not None:
+                rasters[slug] = img
+
+    # Uniform cells: a near-square grid is the tightest packing
+    columns = max(1, math.ceil(math.sqrt(len(rasters))))
+    rows = max(1, math.ceil(len(rasters) / columns))
+    sheet = Image.new('RGBA', (columns * size, rows * size), (0, 0, 0, 0))
+
+    index: Dict[str, Tuple[int, int, int, int]] = {}
+    for i, (slug, img) in enumerate(rasters.items()):
+        x, y = (i % columns) * size, (i // columns) * size
+        sheet.paste(img, (x, y))
+        index[slug] = (x, y, size, size)
+
+    return IconAtlas(sheet, index, size)
+
+
+class IconAtlasCache:
+    """
+    Memoized atlases per (icon files, size), plus registered catalogs.
+
+    Thread-safe: shared by parallel panel renderers.
+    """
+
+    def __init__(self, max_atlases: int = 32):
+        """
+        Args:
+            max_atlases: Per-stack atlases kept in memory
+        """
+        self.max_atlases = max_atlases
+        self._atlases: "OrderedDict[Tuple, IconAtlas]" = OrderedDict()
+        self._catalogs: List[IconAtlas] = []
+        self._lock = threading.Lock()
+
+    def for_icons(self, icons: List[Dict[str, Any]], size: int) -> IconAtlas:
+        """
+        Atlas containing the given icons at size.
+
+        A registered catalog is used if it covers every slug; otherwise a
+        (memoized) atlas is built for exactly these icons.
+        """
+        slugs = {icon['slug'] for icon in icons}
+
+        with self._lock:
+            for catalog in self._catalogs:
+                if catalog.size == size and slugs.issubset(catalog.index):
+                    return catalog
+
+        key = (size, tuple(sorted(self._file_key(icon) for icon in icons)))
+        with self._lock:
+            atlas = self._atlases.get(key)
+            if atlas is not None:
+                self._atlases.move_to_end(key)
+                return atlas
+
+        atlas = build_atlas(icons, size)
+
+        with self._lock:
+            self._atlases[key] = atlas
+            while len(self._atlases) > self.max_atlases:
+                self._atlases.popitem(last=False)
+        return atlas
+
+    def register(self, atlas: IconAtlas):
+        """Use a catalog atlas (e.g. IconAtlas.load()) for every stack it covers."""
+        with self._lock:
+            self._catalogs.append(atlas)
+
+    def clear(self):
+        """Drop memoized atlases and registered catalogs."""
+        with self._lock:
+            self._atlases.clear()
+            self._catalogs.clear()
+
+    @staticmethod
+    def _file_key(icon: Dict[str, Any]) -> Tuple[str, str, int]:
+        try:
+            mtime = os.stat(icon['path']).st_mtime_ns
+        except OSError:
+            mtime = 0
+        return icon['slug'], icon['path'], mtime
+
+
+# Process-wide atlas cache shared by all panels and compositors
+icon_atlases = IconAtlasCache()
@@ -0,0 +1,236 @@
+"""
+Icon Bundle
+Offline icon bundles for render nodes without network access.
+
+A bundle is a single compressed zip file:
+
+    manifest.json        {'version', 'created_at', 'icons': {slug: member}, 'missing': [slug]}
+    icons/{slug}.svg     SimpleIcons SVGs (deflated)
+
+The zip central directory is the index, so IconFetcher reads single
+icons by random access without extracting the bundle. Slugs listed under
+'missing' did not exist on the CDN when the bundle was packed and are
+answered with fallbacks (no network call). Manifest slugs that are not
+SimpleIcons slugs ([a-z0-9]+) are skipped, so unpack() only writes inside
+the cache directory.
+
+Usage:
+    from agents.icon_bundle import pack_icon_bundle, collect_tech_names
+
+    pack_icon_bundle('icons.zip', collect_tech_names(['examples/']))
+    fetcher = IconFetcher(bundle_path='icons.zip')   # or ARKIFY_ICON_BUNDLE=icons.zip
+"""
+
+import json
+import re
+import threading
+import time
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+import yaml
+
+
+BUNDLE_VERSION = 1
+MANIFEST_NAME = 'manifest.json'
+
+# SimpleIcons slug alphabet; manifest slugs become file names on unpack
+SLUG_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+_bundles: Dict[tuple, 'IconBundle'] = {}
+_bundles_lock = threading.Lock()
+
+
+def open_bundle(path: str) -> 'IconBundle':
+    """Shared IconBundle for path (reopened if the file changed)."""
+    resolved = Path(path).resolve()
+    key = (str(resolved), resolved.stat().st_mtime_ns)
+    with _bundles_lock:
+        bundle = _bundles.get(key)
+        if bundle is None:
+            bundle = IconBundle(resolved)
+            _bundles[key] = bundle
+        return bundle
+
+
+class IconBundle:
+    """
+    Read-only random access to a packed icon bundle.
+
+    Thread-safe: one open zip handle shared by concurrent fetches.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Bundle file written by pack_icon_bundle()
+
+        Raises:
+            ValueError: If the file is not a valid icon bundle
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+        try:
+            self._zip = zipfile.ZipFile(self.path)
+            manifest = json.loads(self._zip.read(MANIFEST_NAME))
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+            raise ValueError(f"Not an icon bundle: {self.path} ({e})")
+
+        self.created_at: float = manifest.get('created_at', 0)
+        self._icons: Dict[str, str] = {}
+        for slug, member in manifest.get('icons', {}).items():
+            if isinstance(slug, str) and SLUG_PATTERN.fullmatch(slug):
+                self._icons[slug] = member
+            else:
+                print(f"    ⚠️  Skipping invalid icon slug {slug!r} in {self.path}")
+        self._missing = set(manifest.get('missing', []))
+
+    def has(self, slug: str) -> bool:
+        """Whether the bundle contains an SVG for slug."""
+        return slug in self._icons
+
+    def is_missing(self, slug: str) -> bool:
+        """Whether slug was recorded as not existing on the CDN."""
+        return slug in self._missing
+
+    def read(self, slug: str) -> Optional[bytes]:
+        """SVG bytes for slug, or None if it is not bundled."""
+        member = self._icons.get(slug)
+        if member is None:
+            return None
+        with self._lock:
+            return self._zip.read(member)
+
+    def slugs(self) -> List[str]:
+        """Bundled slugs (sorted)."""
+        return sorted(self._icons)
+
+    def missing(self) -> List[str]:
+        """Known-missing slugs (sorted)."""
+        return sorted(self._missing)
+
+    def unpack(self, cache_dir: str) -> int:
+        """
+        Extract all SVGs into an icon cache directory.
+
+        Returns:
+            Number of icons written
+        """
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for slug in self._icons:
+            (cache_dir / f"{slug}.svg").write_bytes(self.read(slug))
+        return len(self._icons)
+
+    def close(self):
+        """Close the underlying zip file."""
+        with self._lock:
+            self._zip.close()
+
+
+def collect_tech_names(sources: Iterable[str]) -> List[str]:
+    """
+    Collect technology names from YAML files, directories and plain names.
+
+    Args:
+        sources: YAML files, directories of YAML files (searched
+                 recursively) or technology names / slugs
+
+    Returns:
+        Unique names in first-seen order
+    """
+    names: List[str] = []
+
+    def add(name):
+        if isinstance(name, str) and name.strip() and name not in names:
+            names.append(name)
+
+    for source in sources:
+        path = Path(source)
+        if path.is_dir():
+            files = sorted(list(path.rglob('*.yaml')) + list(path.rglob('*.yml')))
+        elif path.suffix in ('.yaml', '.yml') and path.exists():
+            files = [path]
+        else:
+            add(source)
+            continue
+
+        for yaml_file in files:
+            try:
+                data = yaml.safe_load(yaml_file.read_text()) or {}
+            except (OSError, yaml.YAMLError) as e:
+                print(f"    ⚠️  Skipping {yaml_file}: {e}")
+                continue
+            project = data.get('project', data) if isinstance(data, dict) else {}
+            for name in project.get('tech_stack', []) or []:
+                add(name)
+
+    return names
+
+
+def pack_icon_bundle(output_path: str,
+                     tech_names: List[str],
+                     fetcher=None) -> Dict[str, Any]:
+    """
+    Warm the icon cache for tech_names and write one bundle file.
+
+    Args:
+        output_path: Bundle file to write (zip)
+        tech_names: Technology names or SimpleIcons slugs
+        fetcher: IconFetcher to warm (default: a fresh IconFetcher)
+
+    Returns:
+        Summary: {'path', 'icons', 'missing', 'failed', 'bytes'}
+    """
+    if fetcher is None:
+        from agents.icon_fetcher import IconFetcher
+        fetcher = IconFetcher()
+
+    icons = fetcher.fetch_many(tech_names)
+
+    bundled: Dict[str, str] = {}
+    missing: List[str] = []
+    failed: List[str] = []
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(f"{output_path.name}.tmp")
+
+    with zipfile.ZipFile(tmp_path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=9) as zf:
+        for icon in icons:
+            slug = icon['slug']
+            if slug in bundled or slug in missing:
+                continue
+
+            if icon['source'] != 'fallback':
+                member = f"icons/{slug}.svg"
+                zf.write(icon['path'], member)
+                bundled[slug] = member
+                continue
+
+            entry = fetcher.index.get(slug)
+            known_missing = fetcher.bundle is not None and fetcher.bundle.is_missing(slug)
+            if known_missing or (entry is not None and entry['status'] != 200):
+                missing.append(slug)
+            elif slug not in failed:
+                # Network error / timeout: not recorded as missing
+                failed.append(slug)
+
+        manifest = {
+            'version': BUNDLE_VERSION,
+            'created_at': time.time(),
+            'icons': bundled,
+            'missing': missing,
+        }
+        zf.writestr(MANIFEST_NAME, json.dumps(manifest, indent=2, sort_keys=True))
+
+    tmp_path.replace(output_path)
+
+    return {
+        'path': str(output_path),
+        'icons': sorted(bundled),
+        'missing': missing,
+        'failed': failed,
+        'bytes': output_path.stat().st_size,
+    }
@@ -4,20 +4,147 @@ Phase 0: Fetch logos from SimpleIcons CDN
 
 Fetches brand logos for tech stack visualization.
 No API key needed - uses public CDN.
+
+Cold-cache icons are fetched concurrently (thread pool over one pooled
+HTTP session) with a per-batch deadline; any icon that misses the deadline
+or fails falls back to initials without stalling the others.
+
+The cache directory carries an index (index.json) recording fetch time,
+HTTP status and ETag/Last-Modified per slug. Known-missing slugs are
+answered from the index without network calls until their negative TTL
+expires; stale icons are revalidated with conditional GETs.
+
+For render nodes without network access, an offline bundle (see
+agents/icon_bundle.py) can be passed as bundle_path or via the
+ARKIFY_ICON_BUNDLE environment variable; bundled icons are read by zip
+random access before any CDN request is made.
 """
 
-import requests
 from pathlib import Path
-from typing import List, Dict, Any
-from urllib.parse import quote
-from PIL import Image
-import io
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
+import hashlib
+import json
+import os
+import threading
+import time
+
+# PIL, fonts and the rasterizer are imported by fetch_icon(): the render
+# cache only needs slugs and cache lookups (icon_versions)
+if TYPE_CHECKING:
+    import requests
+    from PIL import Image
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _shared_session(pool_size: int) -> 'requests.Session':
+    """
+    Process-wide pooled HTTP session (keep-alive to the icon CDN).
+
+    requests is imported here, on the first network call, so renders
+    served entirely from the icon cache never load it.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+            _session.mount('http://', adapter)
+            _session.mount('https://', adapter)
+        return _session
 
-try:
-    import cairosvg
-    HAS_CAIROSVG = True
-except ImportError:
-    HAS_CAIROSVG = False
+
+# Responses recorded as negative cache entries (slug does not exist)
+NEGATIVE_STATUSES = (404, 410)
+
+
+class IconCacheIndex:
+    """
+    JSON manifest of the icon cache.
+
+    One entry per slug: {'status', 'fetched_at', 'etag', 'last_modified'}.
+    Entries with a non-200 status are negative results.
+
+    Thread-safe; save() merges with the file on disk so concurrent
+    processes sharing a cache directory don't drop each other's entries.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Location of the index file
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = self._read()
+        self._dirty = set()
+
+    def get(self, slug: str) -> Optional[Dict[str, Any]]:
+        """Entry for a slug, or None if it was never fetched."""
+        with self._lock:
+            return self._entries.get(slug)
+
+    def record(self,
+               slug: str,
+               status: int,
+               etag: Optional[str] = None,
+               last_modified: Optional[str] = None,
+               fetched_at: Optional[float] = None):
+        """Record the outcome of a fetch (or revalidation)."""
+        with self._lock:
+            self._entries[slug] = {
+                'status': status,
+                'fetched_at': time.time() if fetched_at is None else fetched_at,
+                'etag': etag,
+                'last_modified': last_modified,
+            }
+            self._dirty.add(slug)
+
+    @staticmethod
+    def is_fresh(entry: Dict[str, Any], ttl: float, negative_ttl: float) -> bool:
+        """Whether an entry can be used without contacting the CDN."""
+        max_age = ttl if entry['status'] == 200 else negative_ttl
+        return time.time() - entry['fetched_at'] < max_age
+
+    def save(self):
+        """Write pending changes (atomic replace)."""
+        with self._lock:
+            if not self._dirty:
+                return
+
+            merged = self._read()
+            merged.update({slug: self._entries[slug] for slug in self._dirty})
+
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_name(f"{self.path.name}.{threading.get_ident()}.tmp")
+                tmp_path.write_text(json.dumps(merged, indent=2, sort_keys=True))
+                tmp_path.replace(self.path)
+            except OSError as e:
+                print(f"    ⚠️  Could not write icon cache index: {e}")
+                return
+
+            self._entries = merged
+            self._dirty.clear()
+
+    def reload(self):
+        """Pick up entries written by other processes (pending changes are kept)."""
+        entries = self._read()
+        with self._lock:
+            entries.update({slug: self._entries[slug] for slug in self._dirty})
+            self._entries = entries
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
 
 
 class IconFetcher:
@@ -29,13 +156,54 @@ class IconFetcher:
     Phase 4: Add brand color extraction
     """
 
-    def __init__(self):
-        """Initialize icon fetcher with cache."""
-        self.cache_dir = Path('output/.icon_cache')
+    def __init__(self,
+                 cache_dir: str = 'output/.icon_cache',
+                 simpleicons_base: str = "https://cdn.simpleicons.org",
+                 max_workers: int = 8,
+                 request_timeout: float = 5.0,
+                 batch_timeout: float = 8.0,
+                 ttl: float = 7 * 24 * 3600,
+                 negative_ttl: float = 24 * 3600,
+                 bundle_path: Optional[str] = None):
+        """
+        Initialize icon fetcher with cache.
+
+        Args:
+            cache_dir: Directory for cached SVGs
+            simpleicons_base: CDN base URL (point at a local server for tests)
+            max_workers: Concurrent downloads per batch
+            request_timeout: Timeout for a single icon request (seconds)
+            batch_timeout: Deadline for a whole fetch_many() batch (seconds)
+            ttl: Age after which a cached icon is revalidated (seconds)
+            negative_ttl: How long a missing slug is remembered (seconds)
+            bundle_path: Offline icon bundle (default: $ARKIFY_ICON_BUNDLE)
+        """
+        self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         # SimpleIcons CDN base URL
-        self.simpleicons_base = "https://cdn.simpleicons.org"
+        self.simpleicons_base = simpleicons_base.rstrip('/')
+
+        # Concurrency settings
+        self.max_workers = max_workers
+        self.request_timeout = request_timeout
+        self.batch_timeout = batch_timeout
+        self._session = None
+
+        # Cache index: freshness, validators and negative entries
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.index = IconCacheIndex(self.cache_dir / 'index.json')
+
+        # Offline bundle, consulted before the CDN
+        self.bundle = None
+        bundle_path = bundle_path or os.environ.get('ARKIFY_ICON_BUNDLE')
+        if bundle_path:
+            from agents.icon_bundle import open_bundle
+            try:
+                self.bundle = open_bundle(bundle_path)
+            except (OSError, ValueError) as e:
+                print(f"    ⚠️  Icon bundle unavailable, using CDN: {e}")
 
         # Technology name normalization
         # Maps common names to SimpleIcons slugs
@@ -55,6 +223,13 @@ class IconFetcher:
             'github api': 'github',
         }
 
+    @property
+    def session(self) -> 'requests.Session':
+        """Shared HTTP session (created on first download)."""
+        if self._session is None:
+            self._session = _shared_session(self.max_workers)
+        return self._session
+
     def fetch(self, tech_stack: List[str]) -> List[Dict[str, Any]]:
         """
         Fetch icons for technology stack.
@@ -65,13 +240,70 @@ class IconFetcher:
         Returns:
             List of icon metadata dictionaries
         """
-        icons = []
+        return self.fetch_many(tech_stack[:4])  # Limit to 4 for 2x2 grid
+
+    def fetch_many(self, tech_names: List[str], timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch many icons at once.
+
+        Fresh cached icons and known-missing slugs resolve immediately; the
+        rest are downloaded (or revalidated) concurrently. Each request is
+        capped at the remaining batch time; icons not resolved by the
+        deadline use a stale cached copy if there is one, else initials.
+
+        Args:
+            tech_names: Technology names
+            timeout: Batch deadline in seconds (default: self.batch_timeout)
+
+        Returns:
+            Icon metadata dictionaries, in input order
+        """
+        if timeout is None:
+            timeout = self.batch_timeout
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(tech_names)
+        pending: Dict[str, List[int]] = {}  # slug -> indexes waiting on it
+
+        for i, tech in enumerate(tech_names):
+            slug = self._slug(tech)
+            cached = self._cached_icon(tech, slug)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.setdefault(slug, []).append(i)
+
+        if pending:
+            # Only cold-cache batches need the thread pool
+            from concurrent.futures import ThreadPoolExecutor, wait
+
+            deadline = time.monotonic() + timeout
+            executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending)))
+            futures = {
+                slug: executor.submit(self._download, tech_names[indexes[0]], slug, deadline)
+                for slug, indexes in pending.items()
+            }
+            wait(futures.values(), timeout=timeout)
+            executor.shutdown(wait=False, cancel_futures=True)
 
-        for tech in tech_stack[:4]:  # Limit to 4 for 2x2 grid
-            icon_data = self._fetch_icon(tech)
-            icons.append(icon_data)
+            for slug, indexes in pending.items():
+                future = futures[slug]
+                downloaded = None
+                if future.done() and not future.cancelled():
+                    downloaded = future.result()
+                else:
+                    print(f"    ⚠️  Icon '{slug}' missed the {timeout:.0f}s batch deadline")
 
-        return icons
+                if downloaded is None:
+                    downloaded = self._stale_icon(tech_names[indexes[0]], slug)
+
+                for i in indexes:
+                    if downloaded is not None:
+                        results[i] = dict(downloaded, name=tech_names[i])
+                    else:
+                        results[i] = self._create_fallback_icon(tech_names[i], slug)
+
+        self.index.save()
+        return results
 
     def _fetch_icon(self, tech_name: str) -> Dict[str, Any]:
         """
@@ -83,42 +315,214 @@ class IconFetcher:
         Returns:
             Icon metadata dictionary
         """
-        # Normalize name
+        slug = self._slug(tech_name)
+
+        # Check cache first
+        cached = self._cached_icon(tech_name, slug)
+        if cached is not None:
+            return cached
+
+        downloaded = self._download(tech_name, slug) or self._stale_icon(tech_name, slug)
+        self.index.save()
+        if downloaded is not None:
+            return downloaded
+        return self._create_fallback_icon(tech_name, slug)
+
+    def icon_versions(self, tech_names: List[str]) -> Optional[Dict[str, str]]:
+        """
+        Fingerprint of the icons a fetch of tech_names would draw, without network calls.
+
+        Cached SVGs count by content (stale or not: revalidation rarely
+        changes them). Icons that are neither cached, bundled nor known to
+        be missing would be downloaded, or drawn as a stand-in fallback if
+        the CDN is unreachable, so they have no version yet.
+
+        Returns:
+            slug -> SHA-1 of the SVG ('missing' for known-missing slugs), or
+            None if any icon is unresolved
+        """
+        self.index.reload()
+        versions: Dict[str, str] = {}
+
+        for tech in tech_names:
+            slug = self._slug(tech)
+            entry = self.index.get(slug)
+            if entry is not None and entry['status'] != 200:
+                versions[slug] = 'missing'
+                continue
+            try:
+                versions[slug] = hashlib.sha1((self.cache_dir / f"{slug}.svg").read_bytes()).hexdigest()
+                continue
+            except OSError:
+                pass
+
+            if self.bundle is not None:
+                if self.bundle.is_missing(slug):
+                    versions[slug] = 'missing'
+                    continue
+                svg_bytes = self.bundle.read(slug)
+                if svg_bytes is not None:
+                    versions[slug] = hashlib.sha1(svg_bytes).hexdigest()
+                    continue
+
+            return None
+
+        return versions
+
+    def _slug(self, tech_name: str) -> str:
+        """Normalize a technology name to a SimpleIcons slug."""
         normalized = tech_name.lower().strip()
-        slug = self.name_mapping.get(normalized, normalized)
+        return self.name_mapping.get(normalized, normalized)
 
-        # Try to fetch from SimpleIcons CDN
-        svg_url = f"{self.simpleicons_base}/{slug}"
+    def _cached_icon(self, tech_name: str, slug: str) -> Optional[Dict[str, Any]]:
+        """
+        Resolve an icon from the cache without touching the network.
+
+        Returns:
+            Icon metadata for a fresh cached SVG or a bundled icon, fallback
+            metadata for a known-missing slug, or None if the CDN has to be asked
+        """
         cache_path = self.cache_dir / f"{slug}.svg"
+        entry = self.index.get(slug)
 
-        # Check cache first
-        if cache_path.exists():
+        if entry is None and cache_path.exists():
+            # SVG cached before the index existed: age it from its mtime
+            self.index.record(slug, 200, fetched_at=cache_path.stat().st_mtime)
+            entry = self.index.get(slug)
+
+        if entry is not None and self.index.is_fresh(entry, self.ttl, self.negative_ttl):
+            if entry['status'] != 200:
+                # Known-missing slug: no network call
+                return self._create_fallback_icon(tech_name, slug)
+
+            if cache_path.exists():
+                return {
+                    'name': tech_name,
+                    'slug': slug,
+                    'path': str(cache_path),
+                    'source': 'cache'
+                }
+
+        return self._bundled_icon(tech_name, slug)
+
+    def _bundled_icon(self, tech_name: str, slug: str) -> Optional[Dict[str, Any]]:
+        """
+        Resolve an icon from the offline bundle.
+
+        Only the requested member is read (zip random access); it is written
+        to the cache directory because renderers take SVG file paths.
+        """
+        if self.bundle is None:
+            return None
+
+        if self.bundle.is_missing(slug):
+            return self._create_fallback_icon(tech_name, slug)
+
+        svg_bytes = self.bundle.read(slug)
+        if svg_bytes is None:
+            return None
+
+        cache_path = self.cache_dir / f"{slug}.svg"
+        try:
+            if not cache_path.exists() or cache_path.read_bytes() != svg_bytes:
+                tmp_path = cache_path.with_name(f"{cache_path.name}.{threading.get_ident()}.tmp")
+                tmp_path.write_bytes(svg_bytes)
+                tmp_path.replace(cache_path)
+        except OSError as e:
+            print(f"    ⚠️  Could not cache bundled icon '{slug}': {e}")
+            return None
+
+        self.index.record(slug, 200)
+        return {
+            'name': tech_name,
+            'slug': slug,
+            'path': str(cache_path),
+            'source': 'bundle'
+        }
+
+    def _stale_icon(self, tech_name: str, slug: str) -> Optional[Dict[str, Any]]:
+        """Cached SVG past its TTL (used when revalidation fails)."""
+        cache_path = self.cache_dir / f"{slug}.svg"
+        entry = self.index.get(slug)
+        if entry is not None and entry['status'] == 200 and cache_path.exists():
             return {
                 'name': tech_name,
                 'slug': slug,
                 'path': str(cache_path),
-                'source': 'cache'
+                'source': 'stale'
             }
+        return None
+
+    def _download(self, tech_name: str, slug: str, deadline: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Download one SVG from the CDN into the cache.
+
+        If a (stale) copy is cached, the request is conditional on its
+        ETag / Last-Modified, and a 304 just refreshes the index entry.
+
+        Returns:
+            Icon metadata, or None if the icon does not exist / request failed
+        """
+        svg_url = f"{self.simpleicons_base}/{slug}"
+        cache_path = self.cache_dir / f"{slug}.svg"
+
+        request_timeout = self.request_timeout
+        if deadline is not None:
+            request_timeout = max(0.1, min(request_timeout, deadline - time.monotonic()))
+
+        headers = {}
+        entry = self.index.get(slug)
+        if entry is not None and entry['status'] == 200 and cache_path.exists():
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
 
-        # Fetch from CDN
         try:
-            response = requests.get(svg_url, timeout=5)
-            if response.status_code == 200:
-                # Save to cache
-                cache_path.write_bytes(response.content)
+            response = self.session.get(svg_url, timeout=request_timeout, headers=headers)
+
+            if response.status_code == 304 and headers:
+                # Unchanged upstream: keep the SVG, restart its TTL
+                self.index.record(slug, 200,
+                                  etag=response.headers.get('ETag', entry.get('etag')),
+                                  last_modified=response.headers.get('Last-Modified',
+                                                                     entry.get('last_modified')))
                 return {
                     'name': tech_name,
                     'slug': slug,
                     'path': str(cache_path),
-                    'source': 'simpleicons'
+                    'source': 'cache'
                 }
-            else:
-                # Icon not found, use fallback
-                return self._create_fallback_icon(tech_name, slug)
+
+            if response.status_code in NEGATIVE_STATUSES:
+                # Icon not found: remember it, caller uses fallback
+                self.index.record(slug, response.status_code)
+                return None
+
+            if response.status_code != 200:
+                # Transient error (5xx, rate limit): not cached, retried next run
+                return None
+
+            # Save to cache (atomic, so concurrent readers never see partial files)
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(response.content)
+            tmp_path.replace(cache_path)
+
+            self.index.record(slug, 200,
+                              etag=response.headers.get('ETag'),
+                              last_modified=response.headers.get('Last-Modified'))
+
+            return {
+                'name': tech_name,
+                'slug': slug,
+                'path': str(cache_path),
+                'source': 'simpleicons'
+            }
 
         except Exception as e:
             print(f"    ⚠️  Could not fetch icon for '{tech_name}': {e}")
-            return self._create_fallback_icon(tech_name, slug)
+            return None
 
     def _create_fallback_icon(self, tech_name: str, slug: str) -> Dict[str, Any]:
         """
@@ -140,10 +544,16 @@ class IconFetcher:
         fill="white" text-anchor="middle">{initials}</text>
 </svg>'''
 
-        # Save fallback (ensure parent directory exists)
+        # Save fallback (ensure parent directory exists); unchanged files are
+        # not rewritten so their mtime keeps identifying the icon's content
         cache_path = self.cache_dir / f"{slug}_fallback.svg"
         cache_path.parent.mkdir(parents=True, exist_ok=True)
-        cache_path.write_text(svg_content)
+        try:
+            unchanged = cache_path.read_text() == svg_content
+        except OSError:
+            unchanged = False
+        if not unchanged:
+            cache_path.write_text(svg_content)
 
         return {
             'name': tech_name,
@@ -152,7 +562,7 @@ class IconFetcher:
             'source': 'fallback'
         }
 
-    def fetch_icon(self, tech_name: str, size: int = 64) -> Image.Image:
+    def fetch_icon(self, tech_name: str, size: int = 64) -> 'Image.Image':
         """
         Fetch icon and return as PIL Image.
 
@@ -163,35 +573,19 @@ class IconFetcher:
         Returns:
             PIL Image object (RGBA mode)
         """
+        from agents.icon_rasterizer import icon_rasterizer
+
         # Get icon metadata
         icon_data = self._fetch_icon(tech_name)
-        svg_path = Path(icon_data['path'])
 
-        # Convert SVG to PNG using cairosvg
-        if HAS_CAIROSVG:
-            try:
-                # Read SVG content
-                svg_content = svg_path.read_text()
-
-                # Convert to PNG in memory
-                png_data = cairosvg.svg2png(
-                    bytestring=svg_content.encode('utf-8'),
-                    output_width=size,
-                    output_height=size
-                )
-
-                # Load as PIL Image
-                img = Image.open(io.BytesIO(png_data))
-                return img.convert('RGBA')
-
-            except Exception as e:
-                # Fallback to text-based placeholder
-                return self._create_text_placeholder(tech_name, size)
-        else:
-            # No cairosvg available, use text placeholder
+        # Rasterize via the content-addressed cache (cairosvg only on a miss)
+        img = icon_rasterizer.rasterize(icon_data['path'], size)
+        if img is None:
+            # SVG could not be rendered, use text placeholder
             return self._create_text_placeholder(tech_name, size)
+        return img
 
-    def _create_text_placeholder(self, tech_name: str, size: int) -> Image.Image:
+    def _create_text_placeholder(self, tech_name: str, size: int) -> 'Image.Image':
         """
         Create a simple text-based placeholder when SVG rendering fails.
 
@@ -202,7 +596,8 @@ class IconFetcher:
         Returns:
             PIL Image with text initials
         """
-        from PIL import ImageDraw, ImageFont
+        from PIL import Image, ImageDraw
+        from agents.font_registry import get_font
 
         # Create blank image
         img = Image.new('RGBA', (size, size), (102, 126, 234, 255))  # Purple background
@@ -212,10 +607,7 @@ class IconFetcher:
         initials = tech_name[:2].upper()
 
         # Try to use a decent font
-        try:
-            font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", int(size * 0.45))
-        except:
-            font = ImageFont.load_default()
+        font = get_font('helvetica', int(size * 0.45))
 
         # Center text
         bbox = draw.textbbox((0, 0), initials, font=font)
@@ -0,0 +1,204 @@
+"""
+Icon Rasterizer
+SVG → PNG rasterization with a content-addressed cache.
+
+Every icon placement used to call cairosvg.svg2png again, even when the
+SVG and size had not changed. The rasterizer keeps a second cache tier next
+to output/.icon_cache:
+
+    memory LRU of decoded Images  →  output/.icon_cache/raster/*.png  →  cairosvg
+
+Keys are SVG content hash + output size + background colour, so a changed
+SVG never serves a stale raster, and repeat renders skip cairo entirely
+(rasters on disk are usable even where cairosvg is not installed).
+cairosvg itself is only imported on the first cache miss.
+"""
+
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from PIL import Image
+
+_cairosvg = None
+_cairosvg_probed = False
+_cairosvg_lock = threading.Lock()
+
+
+def load_cairosvg():
+    """Import cairosvg on first use; None if it (or libcairo) is unavailable."""
+    global _cairosvg, _cairosvg_probed
+    with _cairosvg_lock:
+        if not _cairosvg_probed:
+            try:
+                import cairosvg
+                _cairosvg = cairosvg
+            except (ImportError, OSError):
+                _cairosvg = None
+            _cairosvg_probed = True
+        return _cairosvg
+
+
+class IconRasterizer:
+    """
+    Rasterize SVG icons once per (content, size, background).
+
+    Thread-safe: shared by all compositors and panel agents.
+    """
+
+    def __init__(self, cache_dir: str = 'output/.icon_cache/raster', max_entries: int = 256):
+        """
+        Args:
+            cache_dir: Directory for rasterized PNGs
+            max_entries: Decoded images kept in memory
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+
+        self._images: "OrderedDict[Tuple, Image.Image]" = OrderedDict()
+        self._hashes: Dict[str, Tuple[int, int, str]] = {}  # path -> (mtime_ns, size, sha)
+        self._lock = threading.Lock()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.renders = 0
+
+    def rasterize(self,
+                  svg_path: str,
+                  size: int,
+                  background: Optional[str] = None) -> Optional[Image.Image]:
+        """
+        Get a rasterized icon.
+
+        Args:
+            svg_path: Path to the SVG file
+            size: Output size in pixels (square)
+            background: Hex colour to flatten onto (RGB result),
+                        or None to keep transparency (RGBA result)
+
+        Returns:
+            PIL Image (a copy the caller may modify), or None if the SVG
+            is missing or cannot be rasterized
+        """
+        digest = self._content_hash(svg_path)
+        if digest is None:
+            return None
+
+        key = (digest, size, background)
+
+        with self._lock:
+            img = self._images.get(key)
+            if img is not None:
+                self._images.move_to_end(key)
+                self.memory_hits += 1
+                return img.copy()
+
+        img = self._load_from_disk(key)
+        if img is not None:
+            with self._lock:
+                self.disk_hits += 1
+        else:
+            img = self._render(svg_path, size, background)
+            if img is None:
+                return None
+            self._save_to_disk(key, img)
+            with self._lock:
+                self.renders += 1
+
+        with self._lock:
+            self._images[key] = img
+            while len(self._images) > self.max_entries:
+                self._images.popitem(last=False)
+
+        return img.copy()
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters."""
+        with self._lock:
+            return {
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'renders': self.renders,
+                'entries': len(self._images),
+            }
+
+    # === Internals ===
+
+    def _content_hash(self, svg_path: str) -> Optional[str]:
+        """SHA-256 of the SVG, memoized by (mtime, size)."""
+        path = str(svg_path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+
+        memo = self._hashes.get(path)
+        if memo is not None and memo[0] == st.st_mtime_ns and memo[1] == st.st_size:
+            return memo[2]
+
+        try:
+            data = Path(path).read_bytes()
+        except OSError:
+            return None
+
+        digest = hashlib.sha256(data).hexdigest()
+        self._hashes[path] = (st.st_mtime_ns, st.st_size, digest)
+        return digest
+
+    def _render(self, svg_path: str, size: int, background: Optional[str]) -> Optional[Image.Image]:
+        cairosvg = load_cairosvg()
+        if cairosvg is None:
+            return None
+
+        try:
+            png_bytes = cairosvg.svg2png(
+                url=str(svg_path),
+                output_width=size,
+                output_height=size
+            )
+            icon_img = Image.open(io.BytesIO(png_bytes)).convert('RGBA')
+        except Exception as e:
+            print(f"    ⚠️  Could not rasterize '{svg_path}': {e}")
+            return None
+
+        if background is None:
+            return icon_img
+
+        # Flatten transparency onto the panel colour
+        bg = Image.new('RGB', icon_img.size, background)
+        bg.paste(icon_img, mask=icon_img.split()[3])
+        return bg
+
+    def _disk_path(self, key: Tuple) -> Path:
+        digest, size, background = key
+        bg = background.lstrip('#').lower() if background else 'alpha'
+        return self.cache_dir / f"{digest[:32]}_{size}_{bg}.png"
+
+    def _load_from_disk(self, key: Tuple) -> Optional[Image.Image]:
+        path = self._disk_path(key)
+        if not path.exists():
+            return None
+
+        try:
+            with Image.open(path) as img:
+                img.load()
+                return img.copy()
+        except OSError:
+            return None
+
+    def _save_to_disk(self, key: Tuple, img: Image.Image):
+        path = self._disk_path(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            img.save(tmp_path, 'PNG')
+            tmp_path.replace(path)
+        except OSError:
+            pass
+
+
+# Process-wide rasterizer shared by all agents and compositors
+icon_rasterizer = IconRasterizer()
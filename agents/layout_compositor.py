@@ -17,8 +17,35 @@ Creates a simple but professional 2x2 grid layout:
 from pathlib import Path
 from typing import Dict, Any
 from PIL import Image, ImageDraw, ImageFont, ImageColor
-import io
-import cairosvg
+
+from .font_registry import get_font
+from .icon_rasterizer import icon_rasterizer
+from .layout_engine import LayoutEngine, LayoutSpec, PanelBinding, Slot
+from .panel_cache import icon_file_versions
+from .text_layout import text_layout
+
+
+LAYOUT = LayoutSpec(
+    name='phase0',
+    columns=(400, 400),
+    rows=(400, 400),
+    background='#f8f9fa',
+    slots=(
+        Slot('header', 0, 0),       # Top-left: Header + Stats
+        Slot('tech_stack', 1, 0),   # Top-right: Tech Stack
+        Slot('structure', 0, 1),    # Bottom-left: Project Structure
+        Slot('learning', 1, 1),     # Bottom-right: Learning
+    ),
+)
+
+# Layout data fields each panel reads (panel bitmaps are cached on these)
+PANEL_INPUTS = {
+    'header': ['name', 'tagline', 'kpis.hours_display', 'kpis.cost_display'],
+    'tech_stack': ['icons'],
+    'structure': ['kpis.agents_created', 'kpis.files_created', 'kpis.lines_of_code',
+                  'kpis.total_commits', 'kpis.generation_time'],
+    'learning': ['learning'],
+}
 
 
 class LayoutCompositor:
@@ -28,14 +55,19 @@ class LayoutCompositor:
     Phase 0: Static PNG only
     Phase 3: Add animation support
     Phase 6: Multi-platform outputs
+
+    The grid is the LAYOUT spec, rendered by the layout engine. Panels
+    are memoized in the panel cache on the fields they read
+    (PANEL_INPUTS); re-composing after an edit redraws only the panels
+    whose data changed.
     """
 
     def __init__(self):
         """Initialize compositor with design system."""
 
-        # Canvas settings
-        self.canvas_size = (800, 800)  # Square for now
-        self.panel_size = (400, 400)   # Each panel is 400x400
+        # Canvas settings (from the layout spec)
+        self.canvas_size = LAYOUT.size                       # 800x800, square for now
+        self.panel_size = LAYOUT.placement('header').size    # Each panel is 400x400
 
         # Design system (indie hacker purple gradient theme)
         self.colors = {
@@ -52,6 +84,13 @@ class LayoutCompositor:
         # Typography (using default fonts for now)
         self.fonts = self._load_fonts()
 
+        self.engine = LayoutEngine(LAYOUT, {
+            'header': self._binding(self._draw_panel_1, 'header'),
+            'tech_stack': self._binding(self._draw_panel_2, 'tech_stack', external=icon_file_versions),
+            'structure': self._binding(self._draw_panel_3, 'structure'),
+            'learning': self._binding(self._draw_panel_4, 'learning'),
+        }, owner=self.colors)
+
     def compose(self, layout_data: Dict[str, Any]) -> Path:
         """
         Compose 2x2 grid layout.
@@ -62,15 +101,8 @@ class LayoutCompositor:
         Returns:
             Path to generated PNG file
         """
-        # Create canvas
-        canvas = Image.new('RGB', self.canvas_size, self.colors['background'])
-        draw = ImageDraw.Draw(canvas)
-
         # Draw 4 panels
-        self._draw_panel_1(canvas, draw, layout_data)  # Top-left: Header + Stats
-        self._draw_panel_2(canvas, draw, layout_data)  # Top-right: Tech Stack
-        self._draw_panel_3(canvas, draw, layout_data)  # Bottom-left: Time/Cost
-        self._draw_panel_4(canvas, draw, layout_data)  # Bottom-right: Learning
+        canvas = self.engine.compose(layout_data)
 
         # Save output
         output_dir = Path('output')
@@ -80,13 +112,12 @@ class LayoutCompositor:
         project_name = layout_data['name'].lower().replace(' ', '-')
         output_path = output_dir / f"{project_name}.png"
 
-        canvas.save(output_path, 'PNG', quality=95, optimize=True)
+        self.engine.save(canvas, output_path)
 
         return output_path
 
-    def _draw_panel_1(self, canvas: Image, draw: ImageDraw, data: Dict):
+    def _draw_panel_1(self, canvas: Image, draw: ImageDraw, data: Dict, x: int = 0, y: int = 0):
         """Draw Panel 1: Project Header + Key Stats."""
-        x, y = 0, 0
         w, h = self.panel_size
 
         # Panel background
@@ -114,9 +145,8 @@ class LayoutCompositor:
         self._draw_stat_box(draw, x + 50, stats_y, hours_text, "Time", w - 100)
         self._draw_stat_box(draw, x + 50, stats_y + 100, cost_text, "Cost", w - 100)
 
-    def _draw_panel_2(self, canvas: Image, draw: ImageDraw, data: Dict):
+    def _draw_panel_2(self, canvas: Image, draw: ImageDraw, data: Dict, x: int = 0, y: int = 0):
         """Draw Panel 2: Tech Stack Icons."""
-        x, y = self.panel_size[0], 0
         w, h = self.panel_size
 
         # Panel background
@@ -149,9 +179,8 @@ class LayoutCompositor:
             self._draw_text(draw, icon['name'], (icon_x + icon_size//2, label_y),
                            self.fonts['tiny'], self.colors['text_light'], align='center')
 
-    def _draw_panel_3(self, canvas: Image, draw: ImageDraw, data: Dict):
+    def _draw_panel_3(self, canvas: Image, draw: ImageDraw, data: Dict, x: int = 0, y: int = 0):
         """Draw Panel 3: Project Architecture Stats."""
-        x, y = 0, self.panel_size[1]
         w, h = self.panel_size
 
         # Panel background
@@ -195,9 +224,8 @@ class LayoutCompositor:
             self._draw_text(draw, metric, (x + 60, metric_y), self.fonts['medium'],
                            self.colors['text'], align='left')
 
-    def _draw_panel_4(self, canvas: Image, draw: ImageDraw, data: Dict):
+    def _draw_panel_4(self, canvas: Image, draw: ImageDraw, data: Dict, x: int = 0, y: int = 0):
         """Draw Panel 4: Key Learning."""
-        x, y = self.panel_size[0], self.panel_size[1]
         w, h = self.panel_size
 
         # Panel background
@@ -216,6 +244,18 @@ class LayoutCompositor:
 
     # === Helper Methods ===
 
+    def _binding(self, draw_panel, panel: str, external=None) -> PanelBinding:
+        """
+        Bind a panel to draw_panel(canvas, draw, data, x, y), drawn in place.
+
+        Text that runs past the panel edge is kept as before (see
+        PanelBinding.draw); other panels are cached as bitmaps.
+        """
+        def draw(canvas: Image, data: Dict, placement) -> None:
+            draw_panel(canvas, ImageDraw.Draw(canvas), data, placement.x, placement.y)
+
+        return PanelBinding(inputs=PANEL_INPUTS[panel], external=external, draw=draw)
+
     def _draw_panel_background(self, draw: ImageDraw, x: int, y: int, w: int, h: int):
         """Draw panel background with border."""
         # White background
@@ -247,36 +287,11 @@ class LayoutCompositor:
     def _draw_wrapped_text(self, draw: ImageDraw, text: str, x: int, y: int,
                           max_width: int, font, color: str):
         """Draw text with word wrapping."""
-        words = text.split()
-        lines = []
-        current_line = []
-
-        for word in words:
-            current_line.append(word)
-            line_text = ' '.join(current_line)
-
-            try:
-                bbox = draw.textbbox((0, 0), line_text, font=font)
-                line_width = bbox[2] - bbox[0]
-            except:
-                line_width = len(line_text) * 10  # Rough estimate
-
-            if line_width > max_width:
-                if len(current_line) > 1:
-                    current_line.pop()
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-                else:
-                    lines.append(line_text)
-                    current_line = []
-
-        if current_line:
-            lines.append(' '.join(current_line))
+        boxes = text_layout.wrap(text, font, max_width)
 
         # Draw lines
         line_height = 35
-        for i, line in enumerate(lines):
-            draw.text((x, y + i * line_height), line, font=font, fill=color)
+        text_layout.draw(draw, boxes, x, y, font, color, line_height)
 
     def _draw_stat_box(self, draw: ImageDraw, x: int, y: int, value: str, label: str, width: int):
         """Draw a stat box with value and label."""
@@ -297,21 +312,10 @@ class LayoutCompositor:
             if not icon_path.exists():
                 raise FileNotFoundError(f"Icon file not found: {icon_path}")
 
-            # Convert SVG to PNG using cairosvg
-            png_bytes = cairosvg.svg2png(
-                url=str(icon_path),
-                output_width=size,
-                output_height=size
-            )
-
-            # Load PNG into PIL Image
-            icon_img = Image.open(io.BytesIO(png_bytes))
-
-            # Convert RGBA to RGB with white background
-            if icon_img.mode == 'RGBA':
-                bg = Image.new('RGB', icon_img.size, (255, 255, 255))
-                bg.paste(icon_img, mask=icon_img.split()[3])  # Use alpha channel as mask
-                icon_img = bg
+            # Rasterize with white background (cached by SVG hash/size/bg)
+            icon_img = icon_rasterizer.rasterize(str(icon_path), size, background='#ffffff')
+            if icon_img is None:
+                raise RuntimeError("SVG could not be rasterized")
 
             # Paste onto canvas
             canvas.paste(icon_img, (x, y))
@@ -339,16 +343,4 @@ class LayoutCompositor:
             'huge': 48
         }
 
-        fonts = {}
-        for name, size in font_sizes.items():
-            try:
-                # Try to load system font
-                if 'bold' in name:
-                    fonts[name] = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", size)
-                else:
-                    fonts[name] = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", size)
-            except:
-                # Fallback to default font
-                fonts[name] = ImageFont.load_default()
-
-        return fonts
+        return {name: get_font('helvetica', size) for name, size in font_sizes.items()}
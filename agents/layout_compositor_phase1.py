@@ -5,18 +5,50 @@ Layout Compositor Agent - Phase 1
 Simple, Lovable, Complete
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from PIL import Image, ImageDraw, ImageFont
-import io
 
-# Try to import cairosvg for proper SVG rendering
-try:
-    import cairosvg
-    HAS_CAIRO = True
-except ImportError:
-    HAS_CAIRO = False
-    print("⚠️  cairosvg not available - icons will be placeholder boxes")
+from .font_registry import get_font
+from .icon_atlas import icon_atlases
+from .icon_rasterizer import icon_rasterizer, load_cairosvg
+from .layout_engine import LayoutEngine, LayoutSpec, PanelBinding, Slot
+from .panel_cache import icon_file_versions
+from .text_layout import text_layout
+
+
+DEFAULT_PANEL_ORDER = ('header', 'results', 'tech_stack', 'expected', 'reality', 'learning')
+
+# Cells below the header, filled in story order: row 1, then row 2
+GRID_CELLS = [(0, 1), (1, 1), (2, 1), (0, 2), (1, 2), (2, 2)]
+
+
+# Layout data fields each panel reads (panel bitmaps are cached on these)
+PANEL_INPUTS = {
+    'header': ['name', 'tagline', 'hours', 'cost', 'results.users',
+               'kpis.hours_display', 'kpis.cost_display', 'kpis.cost_per_hour_display'],
+    'results': ['results'],
+    'tech_stack': ['icons'],
+    'expected': ['expectations'],
+    'reality': ['reality'],
+    'learning': ['learning', 'reality.challenges'],
+}
+
+
+@lru_cache(maxsize=32)
+def phase1_layout(panel_order: Tuple[str, ...] = DEFAULT_PANEL_ORDER) -> LayoutSpec:
+    """
+    3x3 grid for a story's panel order: the header spans row 0, the other
+    panels fill GRID_CELLS in order (unknown panel ids leave their cell empty).
+    """
+    data_panels = [panel for panel in panel_order if panel != 'header']
+    slots = [Slot('header', 0, 0, col_span=3)]
+    slots += [Slot(panel, col, row)
+              for panel, (col, row) in zip(data_panels, GRID_CELLS)
+              if panel in PANEL_INPUTS]
+    return LayoutSpec(name='phase1', columns=(300, 300, 300), rows=(400, 400, 400),
+                      background='#22223B', slots=tuple(slots))
 
 
 class LayoutCompositorPhase1:
@@ -26,14 +58,21 @@ class LayoutCompositorPhase1:
     Canvas: 900x1200px (3 columns x 3 rows)
     Panels: 300x400px each
     Header: 900x400px (spans 3 columns)
+
+    The grid comes from phase1_layout() for the story's panel order and is
+    rendered by the layout engine. Each panel is drawn on its own bitmap
+    and memoized in the panel cache on the fields it reads (PANEL_INPUTS),
+    so re-composing after an edit only redraws the panels whose data
+    changed.
     """
 
     def __init__(self):
         """Initialize with Future Dust design system."""
 
-        # Canvas settings
-        self.canvas_size = (900, 1200)  # 3x3 grid, 4:5 ratio
-        self.panel_size = (300, 400)    # Each panel
+        # Canvas settings (from the layout spec)
+        layout = phase1_layout()
+        self.canvas_size = layout.size                          # 3x3 grid, 4:5 ratio
+        self.panel_size = layout.placement('results').size      # Each panel
 
         # Future Dust Palette (2025 Color of the Year)
         # Apple Iteration 2: PERFECT CONTRAST RATIOS (WCAG 2.1 AA compliant)
@@ -53,6 +92,18 @@ class LayoutCompositorPhase1:
         # Typography
         self.fonts = self._load_fonts()
 
+        # cairosvg is probed lazily; warn once if icons fall back
+        self._warned_no_cairo = False
+
+        self.engine = LayoutEngine(layout, {
+            'header': self._binding(self._draw_header_panel, 'header'),
+            'results': self._binding(self._draw_results_panel, 'results'),
+            'tech_stack': self._binding(self._draw_tech_stack_panel, 'tech_stack', external=icon_file_versions),
+            'expected': self._binding(self._draw_expected_panel, 'expected'),
+            'reality': self._binding(self._draw_reality_panel, 'reality'),
+            'learning': self._binding(self._draw_learning_panel, 'learning'),
+        }, owner=self.colors)
+
     def compose(self, layout_data: Dict[str, Any], panel_order: list = None) -> Path:
         """
         Compose 3x3 grid layout.
@@ -65,43 +116,11 @@ class LayoutCompositorPhase1:
             Path to generated PNG
         """
 
-        # Create canvas with dark background
-        canvas = Image.new('RGB', self.canvas_size, self.gradient_bg)
+        # Row 1: Header (spanning); rows 2 & 3: data panels in story order
+        layout = phase1_layout(DEFAULT_PANEL_ORDER if panel_order is None else tuple(panel_order))
+        canvas = self.engine.compose(layout_data, layout)
         draw = ImageDraw.Draw(canvas)
 
-        # Default panel order if not provided
-        if panel_order is None:
-            panel_order = ['header', 'results', 'tech_stack',
-                          'expected', 'reality', 'learning']
-
-        # Draw panels based on order
-        # Row 1: Header (spanning)
-        self._draw_header_panel(canvas, draw, layout_data)
-
-        # Row 2 & 3: Data panels
-        # Map panel names to draw functions
-        panel_renderers = {
-            'results': self._draw_results_panel,
-            'tech_stack': self._draw_tech_stack_panel,
-            'expected': self._draw_expected_panel,
-            'reality': self._draw_reality_panel,
-            'learning': self._draw_learning_panel,
-        }
-
-        # Grid positions (excluding header which is row 0)
-        grid_positions = [
-            (0, 1), (1, 1), (2, 1),  # Row 2
-            (0, 2), (1, 2), (2, 2),  # Row 3
-        ]
-
-        # Draw panels (skip 'header' from panel_order)
-        data_panels = [p for p in panel_order if p != 'header']
-        for panel_id, (col, row) in zip(data_panels, grid_positions):
-            if panel_id in panel_renderers:
-                x = col * self.panel_size[0]
-                y = row * self.panel_size[1]
-                panel_renderers[panel_id](canvas, draw, layout_data, x, y)
-
         # Geographic context (subtle, bottom-right corner)
         geo_text = "📍 Tyrol/Innsbruck • Oct 22, 2025 • 8h"
         geo_x = self.canvas_size[0] - 320  # Right-aligned with margin
@@ -116,7 +135,7 @@ class LayoutCompositorPhase1:
         project_name = layout_data['name'].lower().replace(' ', '-')
         output_path = output_dir / f"{project_name}-phase1.png"
 
-        canvas.save(output_path, 'PNG', quality=95, optimize=True, dpi=(300, 300))
+        self.engine.save(canvas, output_path, dpi=(300, 300))
 
         return output_path
 
@@ -257,6 +276,10 @@ class LayoutCompositorPhase1:
         start_x = x + (w - grid_spacing) // 2 - 30
         start_y = y + 100
 
+        # All icons of the panel come from one sprite sheet
+        atlas = icon_atlases.for_icons([icon for icon in icons if 'slug' in icon and 'path' in icon],
+                                       icon_size)
+
         for i, icon in enumerate(icons):
             row = i // 2
             col = i % 2
@@ -265,7 +288,7 @@ class LayoutCompositorPhase1:
             icon_y = start_y + row * 120
 
             # Draw icon (SVG or fallback)
-            self._draw_icon(canvas, icon, icon_x, icon_y, icon_size)
+            self._draw_icon(canvas, icon, icon_x, icon_y, icon_size, atlas=atlas)
 
             # Tech name below icon (smaller)
             name_y = icon_y + icon_size + 8
@@ -273,48 +296,33 @@ class LayoutCompositorPhase1:
             self._draw_text(draw, tech_name, (icon_x + icon_size//2, name_y), self.fonts['tiny'],
                            self.colors['cosmic_white'], align='center')
 
-    def _draw_icon(self, canvas: Image, icon: Dict, x: int, y: int, size: int):
-        """Draw technology icon from SVG (with fallback)."""
-        if not HAS_CAIRO:
-            # Fallback: colored box with initials
-            draw = ImageDraw.Draw(canvas)
-            draw.rectangle([x, y, x + size, y + size], fill=self.colors['future_dust'])
-            initials = icon.get('name', 'XX')[:2].upper()
-            self._draw_text(draw, initials, (x + size//2, y + size//3),
-                           self.fonts['small_bold'], self.colors['cosmic_white'], align='center')
-            return
-
+    def _draw_icon(self, canvas: Image, icon: Dict, x: int, y: int, size: int, atlas=None):
+        """Draw technology icon from the panel's atlas or SVG (with fallback)."""
         try:
+            if atlas is not None and atlas.paste(canvas, icon.get('slug'), (x, y)):
+                return
+
             icon_path = Path(icon['path'])
 
             if not icon_path.exists():
                 raise FileNotFoundError(f"Icon not found: {icon_path}")
 
-            # Convert SVG to PNG
-            png_bytes = cairosvg.svg2png(
-                url=str(icon_path),
-                output_width=size,
-                output_height=size
-            )
-
-            # Load PNG
-            icon_img = Image.open(io.BytesIO(png_bytes))
-
-            # Handle RGBA → RGB
-            if icon_img.mode == 'RGBA':
-                bg = Image.new('RGB', icon_img.size, self.colors['deep_space'])
-                # Convert hex to RGB tuple
-                bg_color = tuple(int(self.colors['deep_space'][i:i+2], 16) for i in (1, 3, 5))
-                bg = Image.new('RGB', icon_img.size, bg_color)
-                bg.paste(icon_img, mask=icon_img.split()[3])
-                icon_img = bg
+            # Rasterized + flattened onto deep_space (cached by SVG hash/size/bg)
+            icon_img = icon_rasterizer.rasterize(str(icon_path), size,
+                                                 background=self.colors['deep_space'])
+            if icon_img is None:
+                raise RuntimeError("SVG could not be rasterized (cairosvg unavailable?)")
 
             # Paste onto canvas
             canvas.paste(icon_img, (x, y))
 
         except Exception as e:
             # Fallback on any error
-            print(f"    ⚠️  Icon render failed for '{icon.get('name')}': {e}")
+            if load_cairosvg() is not None:
+                print(f"    ⚠️  Icon render failed for '{icon.get('name')}': {e}")
+            elif not self._warned_no_cairo:
+                print("⚠️  cairosvg not available - icons will be placeholder boxes (unless cached)")
+                self._warned_no_cairo = True
             draw = ImageDraw.Draw(canvas)
             draw.rectangle([x, y, x + size, y + size], fill=self.colors['future_dust'])
             initials = icon.get('name', 'XX')[:2].upper()
@@ -470,6 +478,22 @@ class LayoutCompositorPhase1:
 
     # === Helper Methods ===
 
+    def _binding(self, draw_panel, panel_id: str, external=None) -> PanelBinding:
+        """
+        Bind a panel to its draw method, drawn in place at its grid position.
+
+        Text that runs past the panel edge (e.g. a long reality challenge)
+        keeps overdrawing the neighbouring empty cell as before (see
+        PanelBinding.draw); other panels are cached as bitmaps.
+        """
+        def draw(canvas: Image, data: Dict, placement) -> None:
+            if panel_id == 'header':
+                draw_panel(canvas, ImageDraw.Draw(canvas), data)
+            else:
+                draw_panel(canvas, ImageDraw.Draw(canvas), data, placement.x, placement.y)
+
+        return PanelBinding(inputs=PANEL_INPUTS[panel_id], external=external, draw=draw)
+
     def _draw_text(self, draw: ImageDraw, text: str, pos: tuple, font, color: str, align='left'):
         """Draw text with alignment."""
         try:
@@ -488,43 +512,16 @@ class LayoutCompositorPhase1:
 
     def _get_wrapped_lines(self, draw: ImageDraw, text: str, max_width: int, font) -> list:
         """Calculate wrapped lines without drawing (for height calculation)."""
-        words = text.split()
-        lines = []
-        current_line = []
-
-        for word in words:
-            current_line.append(word)
-            line_text = ' '.join(current_line)
-
-            try:
-                bbox = draw.textbbox((0, 0), line_text, font=font)
-                line_width = bbox[2] - bbox[0]
-            except:
-                line_width = len(line_text) * 8
-
-            if line_width > max_width:
-                if len(current_line) > 1:
-                    current_line.pop()
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-                else:
-                    lines.append(line_text)
-                    current_line = []
-
-        if current_line:
-            lines.append(' '.join(current_line))
-
-        return lines
+        return text_layout.lines(text, font, max_width)
 
     def _draw_wrapped_text(self, draw: ImageDraw, text: str, x: int, y: int,
                           max_width: int, font, color: str):
         """Draw text with word wrapping."""
-        lines = self._get_wrapped_lines(draw, text, max_width, font)
+        boxes = text_layout.wrap(text, font, max_width)
 
         # Draw lines - use 8px grid aligned line height (24 = 3*8px)
         line_height = 24  # Tighter for value-density
-        for i, line in enumerate(lines):
-            draw.text((x, y + i * line_height), line, font=font, fill=color)
+        text_layout.draw(draw, boxes, x, y, font, color, line_height)
 
     def _load_fonts(self) -> Dict[str, ImageFont.FreeTypeFont]:
         """Load fonts following Jony Ive's hierarchy: Clarity above all."""
@@ -538,21 +535,4 @@ class LayoutCompositorPhase1:
             'huge': 72           # Project name (HERO size!)
         }
 
-        fonts = {}
-        for name, size in font_sizes.items():
-            try:
-                # Try macOS system fonts first
-                if 'bold' in name:
-                    fonts[name] = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", size)
-                else:
-                    fonts[name] = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", size)
-            except:
-                try:
-                    # Fallback to Linux fonts
-                    fonts[name] = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", size)
-                except:
-                    # Last resort: PIL default (but log warning)
-                    print(f"⚠️  Warning: Using default font for {name} - may be too small!")
-                    fonts[name] = ImageFont.load_default()
-
-        return fonts
+        return {name: get_font('helvetica', size) for name, size in font_sizes.items()}
@@ -2,21 +2,54 @@
 Layout Compositor Phase 2
 Assembles 3x3 grid showing decision paths, autonomy, timeline, and meta-recursion
 Uses ONLY real data from git commits, no mock data
+
+Panels are independent 300x300 images, so the layout engine renders them
+concurrently on a thread pool, memoizes them on the fields they read and
+pastes them in grid order (output is identical to sequential rendering).
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 from agents.decision_path_renderer import DecisionPathRenderer
 from agents.autonomy_spectrum_renderer import AutonomySpectrumRenderer
 from agents.contrast_comparison_renderer import ContrastComparisonRenderer
 from agents.timeline_breakdown_renderer import TimelineBreakdownRenderer
 from agents.meta_recursion_renderer import MetaRecursionRenderer
 from agents.icon_fetcher import IconFetcher
+from agents.font_registry import get_font
+from agents.layout_engine import LayoutEngine, LayoutSpec, PanelBinding, Slot
+
+
+LAYOUT = LayoutSpec(
+    name='phase2',
+    columns=(300, 300, 300),
+    rows=(300, 300, 300, 300),
+    background='#22223B',
+    slots=(
+        Slot('header', 0, 0, col_span=3),
+        # ROW 1
+        Slot('decision_icons', 0, 1),
+        Slot('contrast', 1, 1),
+        Slot('decision_mock_data', 2, 1),
+        # ROW 2
+        Slot('autonomy', 0, 2),
+        Slot('timeline', 1, 2),
+        Slot('results', 2, 2),
+        # ROW 3
+        Slot('tech_stack', 0, 3),
+        Slot('reality', 1, 3),
+        Slot('meta', 2, 3),
+    ),
+)
 
 
 class LayoutCompositorPhase2:
     """Composes Phase 2 output: Architecture through Real Decisions"""
 
-    def __init__(self):
+    def __init__(self, max_workers: int = 4):
+        """
+        Args:
+            max_workers: Threads rendering panels concurrently (1 = sequential)
+        """
         self.colors = {
             'bg': '#22223B',
             'header_bg': '#1A1A1A',
@@ -32,6 +65,29 @@ class LayoutCompositorPhase2:
         self.meta_renderer = MetaRecursionRenderer()
         self.icon_fetcher = IconFetcher()
 
+        # Panels are memoized on the project fields they read ([] = static panel)
+        self.engine = LayoutEngine(LAYOUT, {
+            'header': PanelBinding(self._render_header, ['name', 'tagline', 'meta.commits_analyzed']),
+            'decision_icons': PanelBinding(lambda data, size: self._render_icon_decision(
+                data['decision_icon_rendering']) if 'decision_icon_rendering' in data else None,
+                ['decision_icon_rendering']),
+            'contrast': PanelBinding(lambda data, size: self.contrast_renderer.render(
+                width=size[0], height=size[1]), []),
+            'decision_mock_data': PanelBinding(lambda data, size: self._render_mock_fail_decision(
+                data['decision_mock_data_fail']) if 'decision_mock_data_fail' in data else None,
+                ['decision_mock_data_fail']),
+            'autonomy': PanelBinding(lambda data, size: self.autonomy_renderer.render(
+                data['agent_autonomy'], *size) if 'agent_autonomy' in data else None,
+                ['agent_autonomy']),
+            'timeline': PanelBinding(lambda data, size: self.timeline_renderer.render(
+                data.get('hours', 10), *size), ['hours']),
+            'results': PanelBinding(lambda data, size: self._render_results(data),
+                                    ['results', 'meta.commits_analyzed']),
+            'tech_stack': PanelBinding(lambda data, size: self._render_tech_stack(data), ['tech_stack']),
+            'reality': PanelBinding(lambda data, size: self._render_reality(data), []),
+            'meta': PanelBinding(lambda data, size: self.meta_renderer.render(*size), []),
+        }, owner=self.colors, max_workers=max_workers)
+
     def compose(self, project_data, output_path):
         """
         Compose Phase 2 layout
@@ -50,71 +106,27 @@ class LayoutCompositorPhase2:
         │ 4 tools     │ Expect/Real │ RECURSION   │
         └─────────────┴─────────────┴─────────────┘
         """
-        # Canvas
-        img = Image.new('RGB', (900, 1200), self._hex_to_rgb(self.colors['bg']))
-
-        # HEADER (900x300px)
-        self._draw_header(img, project_data)
-
-        # ROW 1 (y=300, 3 panels @ 300x300)
-        # Panel 1: Icon Rendering Decision Path
-        if 'decision_icon_rendering' in project_data:
-            panel1 = self._render_icon_decision(project_data['decision_icon_rendering'])
-            img.paste(panel1, (0, 300))
-
-        # Panel 2: Contrast Journey
-        panel2 = self.contrast_renderer.render(width=300, height=300)
-        img.paste(panel2, (300, 300))
-
-        # Panel 3: Mock Data Fail Decision
-        if 'decision_mock_data_fail' in project_data:
-            panel3 = self._render_mock_fail_decision(project_data['decision_mock_data_fail'])
-            img.paste(panel3, (600, 300))
-
-        # ROW 2 (y=600, 3 panels @ 300x300)
-        # Panel 4: Autonomy Spectrum
-        if 'agent_autonomy' in project_data:
-            panel4 = self.autonomy_renderer.render(project_data['agent_autonomy'], 300, 300)
-            img.paste(panel4, (0, 600))
-
-        # Panel 5: Timeline Breakdown
-        total_hours = project_data.get('hours', 10)
-        panel5 = self.timeline_renderer.render(total_hours, 300, 300)
-        img.paste(panel5, (300, 600))
-
-        # Panel 6: Results
-        panel6 = self._render_results(project_data)
-        img.paste(panel6, (600, 600))
-
-        # ROW 3 (y=900, 3 panels @ 300x300)
-        # Panel 7: Tech Stack
-        panel7 = self._render_tech_stack(project_data)
-        img.paste(panel7, (0, 900))
-
-        # Panel 8: Reality
-        panel8 = self._render_reality(project_data)
-        img.paste(panel8, (300, 900))
-
-        # Panel 9: Meta Recursion
-        panel9 = self.meta_renderer.render(300, 300)
-        img.paste(panel9, (600, 900))
+        # Header and panels (rendered concurrently, pasted in grid order)
+        img = self.engine.compose(project_data)
 
         # Save
-        img.save(output_path, quality=95, optimize=True)
+        self.engine.save(img, output_path)
         print(f"✅ Phase 2 generated: {output_path}")
 
         return True
 
+    def _render_header(self, project_data, size):
+        """Render header panel (900x300px; the bottom edge row is overdrawn by row 1)"""
+        panel = Image.new('RGB', (size[0], size[1] + 1), self._hex_to_rgb(self.colors['header_bg']))
+        self._draw_header(panel, project_data)
+        return panel
+
     def _draw_header(self, img, project_data):
         """Draw header panel (900x300px)"""
         draw = ImageDraw.Draw(img)
 
-        try:
-            font_title = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 52)  # Slightly bigger
-            font_sub = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 20)  # More readable
-        except:
-            font_title = ImageFont.load_default()
-            font_sub = ImageFont.load_default()
+        font_title = get_font('display', 52)  # Slightly bigger
+        font_sub = get_font('display', 20)  # More readable
 
         # Background
         draw.rectangle([(0, 0), (900, 300)], fill=self._hex_to_rgb(self.colors['header_bg']))
@@ -203,12 +215,9 @@ class LayoutCompositorPhase2:
         panel = Image.new('RGB', (300, 300), self._hex_to_rgb(self.colors['bg']))
         draw = ImageDraw.Draw(panel)
 
-        try:
-            font_title = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 20)
-            font_big = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 56)  # Even bigger
-            font_label = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 15)
-        except:
-            font_title = font_big = font_label = ImageFont.load_default()
+        font_title = get_font('display', 20)
+        font_big = get_font('display', 56)  # Even bigger
+        font_label = get_font('display', 15)
 
         draw.text((20, 20), "RESULTS", fill=self._hex_to_rgb(self.colors['text']), font=font_title)
 
@@ -237,11 +246,8 @@ class LayoutCompositorPhase2:
         panel = Image.new('RGB', (300, 300), self._hex_to_rgb(self.colors['bg']))
         draw = ImageDraw.Draw(panel)
 
-        try:
-            font_title = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 20)
-            font_tech = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 18)
-        except:
-            font_title = font_tech = ImageFont.load_default()
+        font_title = get_font('display', 20)
+        font_tech = get_font('display', 18)
 
         draw.text((20, 20), "TECH STACK", fill=self._hex_to_rgb(self.colors['text']), font=font_title)
 
@@ -271,13 +277,10 @@ class LayoutCompositorPhase2:
         panel = Image.new('RGB', (300, 300), self._hex_to_rgb(self.colors['bg']))
         draw = ImageDraw.Draw(panel)
 
-        try:
-            font_title = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 20)
-            font_label = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 15)
-            font_big = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 40)  # Bigger
-            font_worth = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 24)  # For punchline
-        except:
-            font_title = font_label = font_big = font_worth = ImageFont.load_default()
+        font_title = get_font('display', 20)
+        font_label = get_font('display', 15)
+        font_big = get_font('display', 40)  # Bigger
+        font_worth = get_font('display', 24)  # For punchline
 
         draw.text((20, 20), "REALITY", fill=self._hex_to_rgb(self.colors['text']), font=font_title)
 
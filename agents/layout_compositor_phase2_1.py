@@ -7,10 +7,62 @@ Grid: 2x3 = 6 panels @ 600x533px each
 Style: Canva 2025 (gradients, shapes, generous whitespace)
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 from agents.story_panel_renderer import StoryPanelRenderer
 from agents.tech_stack_panel_renderer import TechStackPanelRenderer
 from agents.gradient_renderer import GradientRenderer
+from agents.font_registry import get_font
+from agents.layout_engine import LayoutEngine, LayoutSpec, PanelBinding, Slot
+
+
+DEFAULT_TECH_STACK = ['Python', 'PIL', 'cairosvg', 'Git']
+
+# Three 533px panel rows below the 200px header run past the 1600px
+# canvas; the bottom row is cropped to 334px
+LAYOUT = LayoutSpec(
+    name='phase2.1',
+    columns=(600, 600),
+    rows=(200, 533, 533, 533),
+    canvas=(1200, 1600),
+    background='#1A1A2E',
+    slots=(
+        Slot('header', 0, 0, col_span=2),
+        Slot('mistake', 0, 1),
+        Slot('catch', 1, 1),
+        Slot('insight', 0, 2),
+        Slot('tech_stack', 1, 2),
+        Slot('numbers', 0, 3),
+        Slot('meta', 1, 3),
+    ),
+)
+
+# Static story panels (rendered once per process from the panel cache)
+STORY_PANELS = {
+    'mistake': {
+        'type': 'fail',
+        'emoji': '❌',
+        'title': 'Built with mock data',
+        'subtitle': 'Created Phase 2 with invented decision paths. User caught it immediately.'
+    },
+    'catch': {
+        'type': 'success',
+        'emoji': '✅',
+        'title': 'User: Never use mock',
+        'subtitle': 'Replaced ALL with real git commits. 28 commits analyzed, 100% traceable data.'
+    },
+    'insight': {
+        'type': 'insight',
+        'emoji': '💡',
+        'title': 'Mistake IS research',
+        'subtitle': 'The failure became a decision path to visualize. Arkify documents its own learning.'
+    },
+    'meta': {
+        'type': 'meta',
+        'emoji': '∞',
+        'title': 'This panel documents itself',
+        'subtitle': 'Infinite recursion as a feature. You are a researcher of your own thoughts.'
+    },
+}
 
 
 class LayoutCompositorPhase21:
@@ -27,6 +79,28 @@ class LayoutCompositorPhase21:
             'accent': '#06FFA5'
         }
 
+        bindings = {
+            panel: PanelBinding(lambda data, size, story=story: self.story_renderer.render(story, *size), [])
+            for panel, story in STORY_PANELS.items()
+        }
+        bindings.update({
+            'header': PanelBinding(self._render_header, []),
+            # Tech Stack (with REAL icons!): keyed on the cached icon versions
+            'tech_stack': PanelBinding(
+                lambda data, size: self.tech_renderer.render(data.get('tech_stack', DEFAULT_TECH_STACK), *size),
+                ['tech_stack'],
+                external=lambda data: self.tech_renderer.icon_fetcher.icon_versions(
+                    data.get('tech_stack', DEFAULT_TECH_STACK)[:4])),
+            # By Numbers
+            'numbers': PanelBinding(lambda data, size: self.story_renderer.render({
+                'type': 'dark',
+                'number': str(data.get('meta', {}).get('commits_analyzed', 28)),
+                'title': 'Commits analyzed',
+                'subtitle': '5 decision paths extracted from real git history'
+            }, *size), ['meta.commits_analyzed']),
+        })
+        self.engine = LayoutEngine(LAYOUT, bindings, owner=self.colors)
+
     def compose(self, project_data, output_path):
         """
         Compose Phase 2.1 layout
@@ -46,88 +120,26 @@ class LayoutCompositorPhase21:
         │ By Numbers      │ The Meta           │
         └─────────────────┴────────────────────┘
         """
-        # Canvas (portrait format for mobile)
-        canvas_width = 1200
-        canvas_height = 1600
-        img = Image.new('RGB', (canvas_width, canvas_height), self._hex_to_rgb(self.colors['bg']))
-
-        # HEADER (1200x200px)
-        self._draw_header(img, project_data)
-
-        # Panel dimensions
-        panel_width = 600
-        panel_height = 533
-
-        # ROW 1 (y=200)
-        # Panel 1: The Mistake
-        panel1 = self.story_renderer.render({
-            'type': 'fail',
-            'emoji': '❌',
-            'title': 'Built with mock data',
-            'subtitle': 'Created Phase 2 with invented decision paths. User caught it immediately.'
-        }, panel_width, panel_height)
-        img.paste(panel1, (0, 200))
-
-        # Panel 2: The Catch
-        panel2 = self.story_renderer.render({
-            'type': 'success',
-            'emoji': '✅',
-            'title': 'User: Never use mock',
-            'subtitle': 'Replaced ALL with real git commits. 28 commits analyzed, 100% traceable data.'
-        }, panel_width, panel_height)
-        img.paste(panel2, (600, 200))
-
-        # ROW 2 (y=733)
-        # Panel 3: The Insight
-        panel3 = self.story_renderer.render({
-            'type': 'insight',
-            'emoji': '💡',
-            'title': 'Mistake IS research',
-            'subtitle': 'The failure became a decision path to visualize. Arkify documents its own learning.'
-        }, panel_width, panel_height)
-        img.paste(panel3, (0, 733))
-
-        # Panel 4: Tech Stack (with REAL icons!)
-        tech_stack = project_data.get('tech_stack', ['Python', 'PIL', 'cairosvg', 'Git'])
-        panel4 = self.tech_renderer.render(tech_stack, panel_width, panel_height)
-        img.paste(panel4, (600, 733))
-
-        # ROW 3 (y=1266)
-        # Panel 5: By Numbers
-        commits = project_data.get('meta', {}).get('commits_analyzed', 28)
-        panel5 = self.story_renderer.render({
-            'type': 'dark',
-            'number': str(commits),
-            'title': 'Commits analyzed',
-            'subtitle': '5 decision paths extracted from real git history'
-        }, panel_width, panel_height)
-        img.paste(panel5, (0, 1266))
-
-        # Panel 6: The Meta
-        panel6 = self.story_renderer.render({
-            'type': 'meta',
-            'emoji': '∞',
-            'title': 'This panel documents itself',
-            'subtitle': 'Infinite recursion as a feature. You are a researcher of your own thoughts.'
-        }, panel_width, panel_height)
-        img.paste(panel6, (600, 1266))
+        img = self.engine.compose(project_data)
 
         # Save
-        img.save(output_path, quality=95, optimize=True)
+        self.engine.save(img, output_path)
         print(f"✅ Phase 2.1 generated: {output_path}")
 
         return True
 
+    def _render_header(self, project_data, size):
+        """Render header panel (1200x200px)"""
+        panel = Image.new('RGB', size, self._hex_to_rgb(self.colors['bg']))
+        self._draw_header(panel, project_data)
+        return panel
+
     def _draw_header(self, img, project_data):
         """Draw header with viral hook"""
         draw = ImageDraw.Draw(img)
 
-        try:
-            font_hook = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 56)
-            font_sub = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 22)
-        except:
-            font_hook = ImageFont.load_default()
-            font_sub = ImageFont.load_default()
+        font_hook = get_font('display', 56)
+        font_sub = get_font('display', 22)
 
         # Gradient background for header
         header_gradient = self.gradient_renderer.create_preset_gradient(
@@ -0,0 +1,329 @@
+"""
+Layout Engine
+Declarative grid layouts shared by every compositor.
+
+Each compositor used to hard-code its canvas size, panel coordinates and
+header drawing, and each had its own copy of caching, threading and PNG
+saving. A layout is now data: a LayoutSpec names a grid (column widths,
+row heights, gutters, margin) and the slots panels occupy (with column /
+row spans). Placements are computed and validated (spans inside the grid,
+no two slots overlapping) once, when the spec is created.
+
+Panels are bound to renderers with PanelBinding; the LayoutEngine renders
+all slots through one pipeline:
+
+- panels with declared inputs are memoized in the panel cache
+- panels drawn in place (PanelBinding.draw) keep their overdraw: one
+  that draws outside its slot is drawn straight onto the canvas, in slot
+  order, instead of being cached as a clipped bitmap
+- panels render concurrently when max_workers > 1
+- the canvas is saved optimized, or as a fast draft (watch mode)
+
+Usage:
+    from agents.layout_engine import LayoutEngine, LayoutSpec, PanelBinding, Slot
+
+    SPEC = LayoutSpec(
+        name='phase0', columns=(400, 400), rows=(400, 400), background='#f8f9fa',
+        slots=(Slot('header', 0, 0), Slot('tech_stack', 1, 0),
+               Slot('metrics', 0, 1), Slot('learning', 1, 1)))
+
+    engine = LayoutEngine(SPEC, {
+        'header': PanelBinding(render_header, inputs=['name', 'tagline']),
+        ...
+    })
+    canvas = engine.compose(data)
+    engine.save(canvas, 'output/project.png')   # engine.draft = True: fast draft PNG
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from PIL import Image, ImageChops
+
+from .panel_cache import panel_cache, select_inputs
+
+
+# Cached in place of a bitmap for draw-bindings whose drawing leaves the slot
+OVERFLOW = object()
+
+
+class LayoutError(ValueError):
+    """Invalid layout spec (span outside the grid, overlapping slots, unbound panel)."""
+
+
+@dataclass(frozen=True)
+class Slot:
+    """A panel's cell in the grid (top-left cell plus spans)."""
+
+    panel: str
+    col: int
+    row: int
+    col_span: int = 1
+    row_span: int = 1
+
+
+@dataclass(frozen=True)
+class Placement:
+    """Pixel box of a slot on the canvas."""
+
+    panel: str
+    x: int
+    y: int
+    width: int
+    height: int
+
+    @property
+    def position(self) -> Tuple[int, int]:
+        return (self.x, self.y)
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return (self.width, self.height)
+
+
+@dataclass(frozen=True)
+class LayoutSpec:
+    """
+    Grid layout: tracks, gutters and the slots panels occupy.
+
+    Slots are pasted in order, so a panel that draws past its box is
+    overdrawn by the slots after it. The canvas defaults to the grid's
+    extent; an explicit canvas smaller than the grid crops the last
+    tracks.
+
+    Raises:
+        LayoutError: If a slot leaves the grid or overlaps another slot
+    """
+
+    name: str
+    columns: Tuple[int, ...]
+    rows: Tuple[int, ...]
+    slots: Tuple[Slot, ...]
+    gutter: int = 0
+    margin: int = 0
+    canvas: Optional[Tuple[int, int]] = None
+    background: str = '#000000'
+    placements: Tuple[Placement, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'placements', self._place())
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """Canvas size in pixels."""
+        if self.canvas is not None:
+            return self.canvas
+        return (self._extent(self.columns), self._extent(self.rows))
+
+    def placement(self, panel: str) -> Placement:
+        """Placement of a panel's slot."""
+        for placement in self.placements:
+            if placement.panel == panel:
+                return placement
+        raise KeyError(panel)
+
+    def _extent(self, tracks: Tuple[int, ...]) -> int:
+        return 2 * self.margin + sum(tracks) + self.gutter * (len(tracks) - 1)
+
+    def _offsets(self, tracks: Tuple[int, ...]) -> List[int]:
+        offsets, position = [], self.margin
+        for track in tracks:
+            offsets.append(position)
+            position += track + self.gutter
+        return offsets
+
+    def _place(self) -> Tuple[Placement, ...]:
+        col_x, row_y = self._offsets(self.columns), self._offsets(self.rows)
+        canvas_width, canvas_height = self.size
+        occupied: Dict[Tuple[int, int], str] = {}
+        placements = []
+
+        for slot in self.slots:
+            if any(other.panel == slot.panel for other in placements):
+                raise LayoutError(f"{self.name}: panel '{slot.panel}' has two slots")
+            if (slot.col < 0 or slot.row < 0 or slot.col_span < 1 or slot.row_span < 1
+                    or slot.col + slot.col_span > len(self.columns)
+                    or slot.row + slot.row_span > len(self.rows)):
+                raise LayoutError(f"{self.name}: slot '{slot.panel}' lies outside the "
+                                  f"{len(self.columns)}x{len(self.rows)} grid")
+
+            for cell in [(col, row)
+                         for col in range(slot.col, slot.col + slot.col_span)
+                         for row in range(slot.row, slot.row + slot.row_span)]:
+                if cell in occupied:
+                    raise LayoutError(f"{self.name}: slots '{occupied[cell]}' and "
+                                      f"'{slot.panel}' overlap at cell {cell}")
+                occupied[cell] = slot.panel
+
+            last_col, last_row = slot.col + slot.col_span - 1, slot.row + slot.row_span - 1
+            x, y = col_x[slot.col], row_y[slot.row]
+            placement = Placement(slot.panel, x, y,
+                                  col_x[last_col] + self.columns[last_col] - x,
+                                  row_y[last_row] + self.rows[last_row] - y)
+            if x >= canvas_width or y >= canvas_height:
+                raise LayoutError(f"{self.name}: slot '{slot.panel}' starts outside the "
+                                  f"{canvas_width}x{canvas_height} canvas")
+            placements.append(placement)
+
+        return tuple(placements)
+
+
+@dataclass
+class PanelBinding:
+    """
+    How a panel is drawn: either render (own bitmap) or draw (in place).
+
+    Attributes:
+        render: render(data, size) -> panel image (None leaves the slot empty).
+            The image is pasted at the slot's origin and may be larger than
+            the slot.
+        inputs: Dotted data fields the panel reads; the panel is memoized on
+            their values. None renders it every time.
+        external: external(data) -> inputs outside the data (e.g. icon
+            versions); returning None makes that render uncacheable.
+        draw: draw(canvas, data, placement) draws the panel onto a canvas at
+            its placement, like a compositor drawing every panel on one
+            canvas. The slot (plus its inclusive right/bottom edge) is cached
+            as a bitmap; if the drawing reaches outside it (e.g. text running
+            past the edge), the panel is drawn on the canvas itself so the
+            overdraw is kept.
+    """
+
+    render: Optional[Callable[[Dict[str, Any], Tuple[int, int]], Optional[Image.Image]]] = None
+    inputs: Optional[Sequence[str]] = None
+    external: Optional[Callable[[Dict[str, Any]], Any]] = None
+    draw: Optional[Callable[[Image.Image, Dict[str, Any], Placement], None]] = None
+
+    def __post_init__(self):
+        if (self.render is None) == (self.draw is None):
+            raise LayoutError("PanelBinding needs exactly one of render or draw")
+
+
+class LayoutEngine:
+    """Render a LayoutSpec's panels with their bindings and assemble the canvas."""
+
+    def __init__(self,
+                 spec: LayoutSpec,
+                 bindings: Dict[str, PanelBinding],
+                 owner: Any = None,
+                 max_workers: int = 1):
+        """
+        Args:
+            spec: Default layout
+            bindings: Panel name -> binding (a superset of the spec's panels)
+            owner: Settings that change how panels look (e.g. colors); part
+                of every panel cache key
+            max_workers: Threads rendering panels concurrently (1 = sequential)
+
+        Raises:
+            LayoutError: If a slot of the spec has no binding
+        """
+        self.bindings = bindings
+        self.owner = owner
+        self.max_workers = max_workers
+        self.spec = self._checked(spec)
+
+        # Draft saves skip PNG optimization (same pixels, larger file; watch mode)
+        self.draft = False
+
+        # Panel scheduler (pool created on first compose)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def compose(self, data: Dict[str, Any], spec: Optional[LayoutSpec] = None) -> Image.Image:
+        """
+        Render every slot and paste the panels in slot order.
+
+        Args:
+            data: Data passed to the panel renderers
+            spec: Layout to use instead of the default (e.g. a per-story panel order)
+
+        Returns:
+            Assembled canvas (RGB)
+        """
+        spec = self._checked(spec) if spec is not None else self.spec
+        canvas = Image.new('RGB', spec.size, spec.background)
+
+        panels = self._render_panels([
+            (lambda placement=placement: self._render_panel(spec, placement, data))
+            for placement in spec.placements
+        ])
+        for placement, panel in zip(spec.placements, panels):
+            if panel is OVERFLOW:
+                self.bindings[placement.panel].draw(canvas, data, placement)
+            elif panel is not None:
+                canvas.paste(panel, placement.position)
+
+        return canvas
+
+    def save(self, canvas: Image.Image, output_path, dpi: Optional[Tuple[int, int]] = None):
+        """
+        Save a canvas as PNG (a fast, unoptimized draft if self.draft).
+
+        Args:
+            canvas: Image to save
+            output_path: Destination
+            dpi: Optional DPI metadata
+        """
+        options: Dict[str, Any] = {'compress_level': 1} if self.draft else {'quality': 95, 'optimize': True}
+        if dpi is not None:
+            options['dpi'] = dpi
+        canvas.save(output_path, 'PNG', **options)
+
+    def _checked(self, spec: LayoutSpec) -> LayoutSpec:
+        unbound = [slot.panel for slot in spec.slots if slot.panel not in self.bindings]
+        if unbound:
+            raise LayoutError(f"{spec.name}: no binding for panel(s) {', '.join(unbound)}")
+        return spec
+
+    def _render_panel(self, spec: LayoutSpec, placement: Placement, data: Dict[str, Any]) -> Optional[Image.Image]:
+        binding = self.bindings[placement.panel]
+
+        def render():
+            if binding.draw is not None:
+                return self._draw_isolated(spec, placement, binding, data)
+            return binding.render(data, placement.size)
+
+        if binding.inputs is None:
+            return render()
+
+        external = binding.external(data) if binding.external is not None else {}
+        owner = (spec.name, placement.panel, placement.size, self.owner)
+        return panel_cache.get_or_render(owner, select_inputs(data, binding.inputs), render,
+                                         external, cacheable=external is not None)
+
+    @staticmethod
+    def _draw_isolated(spec: LayoutSpec, placement: Placement, binding: PanelBinding, data: Dict[str, Any]):
+        """Draw a panel on an empty canvas; its slot bitmap, or OVERFLOW if it drew outside the slot."""
+        empty = Image.new('RGB', spec.size, spec.background)
+        scratch = empty.copy()
+        binding.draw(scratch, data, placement)
+
+        width, height = spec.size
+        box = (placement.x, placement.y,
+               min(placement.x + placement.width + 1, width),
+               min(placement.y + placement.height + 1, height))
+        drawn = ImageChops.difference(scratch, empty).getbbox()
+        if drawn is not None and (drawn[0] < box[0] or drawn[1] < box[1]
+                                  or drawn[2] > box[2] or drawn[3] > box[3]):
+            return OVERFLOW
+        return scratch.crop(box)
+
+    def _render_panels(self, renders: List[Callable[[], Optional[Image.Image]]]):
+        """
+        Start rendering panels (on the thread pool if max_workers > 1).
+
+        Returns:
+            Iterator of panel images in the order of renders
+            (re-raises the first panel error when reached)
+        """
+        if self.max_workers <= 1:
+            return iter([render() for render in renders])
+
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix='layout-panel')
+
+        return self._executor.map(lambda render: render(), renders)
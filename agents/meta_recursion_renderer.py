@@ -6,7 +6,8 @@ This panel documents itself being created.
 Real data from: This conversation, Oct 26 2025, 05:30-06:00
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
+from agents.font_registry import get_font
 
 
 class MetaRecursionRenderer:
@@ -48,16 +49,10 @@ class MetaRecursionRenderer:
         img = Image.new('RGB', (width, height), self._hex_to_rgb(self.colors['bg']))
         draw = ImageDraw.Draw(img)
 
-        try:
-            font_title = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 22)
-            font_big = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 48)  # For infinity symbol
-            font_label = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 14)
-            font_small = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 11)
-        except:
-            font_title = ImageFont.load_default()
-            font_big = ImageFont.load_default()
-            font_label = ImageFont.load_default()
-            font_small = ImageFont.load_default()
+        font_title = get_font('display', 22)
+        font_big = get_font('display', 48)  # For infinity symbol
+        font_label = get_font('display', 14)
+        font_small = get_font('display', 11)
 
         # Title
         draw.text((20, 20), "META-LEARNING", fill=self._hex_to_rgb(self.colors['text']), font=font_title)
@@ -7,9 +7,12 @@ Every Panel Agent must inherit from this base and implement render().
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from PIL import Image, ImageDraw, ImageFont
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from agents.font_registry import get_font
+from agents.panel_cache import panel_cache, select_inputs
+from agents.text_layout import text_layout
 
 
 @dataclass
@@ -148,6 +151,37 @@ class PanelAgentBase(ABC):
 
     # === Provided Methods (Agents CAN use) ===
 
+    def render_cached(self, available_data: Dict[str, Any]) -> Image.Image:
+        """
+        render(), memoized on the fields declared in negotiate().data_requested.
+
+        The panel is only redrawn when one of those fields (or an external
+        input, see external_inputs()) changed since it was last rendered
+        with the same agent settings.
+
+        Returns:
+            Panel image (shared with the panel cache: paste it, don't draw on it)
+        """
+        message = self.negotiate(available_data)
+        external = self.external_inputs(available_data)
+        return panel_cache.get_or_render(
+            owner=(type(self).__name__, asdict(self.design_system)),
+            inputs=select_inputs(available_data, message.data_requested or []),
+            render=lambda: self.render(available_data),
+            external=external,
+            cacheable=external is not None,
+        )
+
+    def external_inputs(self, available_data: Dict[str, Any]) -> Optional[Any]:
+        """
+        State outside the project data that render() depends on.
+
+        Returns:
+            Any JSON-serializable value ({} when there is none), or None if
+            the panel cannot be cached right now
+        """
+        return {}
+
     def validate(self, panel_image: Image.Image) -> ValidationResult:
         """
         Validate panel against design system contract.
@@ -254,47 +288,18 @@ class PanelAgentBase(ABC):
         font = self.fonts.get(font_key, self.fonts['small'])
         color_hex = self.design_system.colors.get(color, color)
 
-        lines = self._get_wrapped_lines(draw, text, max_width, font)
-
-        line_height = self.design_system.line_height
-        for i, line in enumerate(lines):
-            draw.text((x, y + i * line_height), line, font=font, fill=color_hex)
+        boxes = text_layout.wrap(text, font, max_width)
 
-        return len(lines) * line_height
+        return text_layout.draw(draw, boxes, x, y, font, color_hex,
+                                self.design_system.line_height)
 
     def _get_wrapped_lines(self,
                            draw: ImageDraw.Draw,
                            text: str,
                            max_width: int,
                            font: ImageFont.FreeTypeFont) -> List[str]:
-        """Calculate wrapped lines without drawing."""
-        words = text.split()
-        lines = []
-        current_line = []
-
-        for word in words:
-            current_line.append(word)
-            line_text = ' '.join(current_line)
-
-            try:
-                bbox = draw.textbbox((0, 0), line_text, font=font)
-                line_width = bbox[2] - bbox[0]
-            except:
-                line_width = len(line_text) * 8
-
-            if line_width > max_width:
-                if len(current_line) > 1:
-                    current_line.pop()
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-                else:
-                    lines.append(line_text)
-                    current_line = []
-
-        if current_line:
-            lines.append(' '.join(current_line))
-
-        return lines
+        """Calculate wrapped lines without drawing (shares layout with draw_wrapped_text)."""
+        return text_layout.lines(text, font, max_width)
 
     def align_to_grid(self, value: int) -> int:
         """
@@ -319,21 +324,5 @@ class PanelAgentBase(ABC):
             'huge': 72
         }
 
-        fonts = {}
-        for name, size in font_map.items():
-            try:
-                # Try macOS system fonts
-                fonts[name] = ImageFont.truetype(
-                    "/System/Library/Fonts/Helvetica.ttc", size
-                )
-            except:
-                try:
-                    # Fallback to Linux fonts
-                    fonts[name] = ImageFont.truetype(
-                        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", size
-                    )
-                except:
-                    # Last resort
-                    fonts[name] = ImageFont.load_default()
-
-        return fonts
+        # Shared registry: faces are opened once per process, not per agent
+        return {name: get_font('helvetica', size) for name, size in font_map.items()}
@@ -0,0 +1,145 @@
+"""
+Panel Cache
+Memoized panel bitmaps, keyed on the data each panel actually reads.
+
+A breakdown is a grid of panels, and most edits touch one of them: a new
+`learning` sentence changes the learning panel and nothing else. Panel
+agents already declare their inputs in negotiate() (data_requested, e.g.
+['learning', 'reality.challenges']); the cache keys each rendered panel
+on the values of exactly those fields, so a re-render recomposes the
+unchanged panels from memory and redraws only the invalidated ones.
+
+Keys also carry the panel's owner (agent class and design-system
+settings) and any inputs that live outside the project data (icon
+versions for tech stack panels). The cache is process-wide, thread-safe
+and LRU-bounded; cached images are shared, so callers paste them and
+never draw on them.
+
+Usage:
+    from agents.panel_cache import panel_cache, select_inputs
+
+    panel = panel_cache.get_or_render(
+        'learning', select_inputs(data, ['learning', 'reality.challenges']),
+        lambda: agent.render(data))
+    canvas.paste(panel, (300, 400))
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+from PIL import Image
+
+from agents.render_cache import canonical_json
+
+
+_MISSING = object()
+
+
+def select_inputs(data: Dict[str, Any], fields: Iterable[str]) -> Dict[str, Any]:
+    """
+    Values of dotted field paths ('reality.challenges') in data.
+
+    Fields that are absent are left out, so a missing field and one set
+    to null produce different keys.
+    """
+    selected = {}
+    for field in fields:
+        value: Any = data
+        for part in field.split('.'):
+            value = value.get(part, _MISSING) if isinstance(value, dict) else _MISSING
+            if value is _MISSING:
+                break
+        if value is not _MISSING:
+            selected[field] = value
+    return selected
+
+
+def icon_file_version(icon: Dict[str, Any]) -> Optional[list]:
+    """[size, mtime] of an icon's SVG file (its content can change behind an unchanged path)."""
+    try:
+        stat = Path(icon['path']).stat()
+    except (KeyError, OSError):
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def icon_file_versions(data: Dict[str, Any], limit: int = 4) -> list:
+    """icon_file_version of the first limit icons in data['icons'] (external input of tech stack panels)."""
+    return [icon_file_version(icon) for icon in data.get('icons', [])[:limit]]
+
+
+class PanelCache:
+    """LRU of rendered panel images keyed by owner + declared inputs."""
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Args:
+            max_entries: Panels kept in memory (a 300x400 panel is ~360 KB)
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Image.Image]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(owner: Any, inputs: Dict[str, Any], external: Any = None) -> str:
+        """Hash of a panel's owner, its input field values and external inputs."""
+        payload = {'owner': owner, 'inputs': inputs, 'external': external}
+        return hashlib.sha1(canonical_json(payload).encode('utf-8')).hexdigest()
+
+    def get_or_render(self,
+                      owner: Any,
+                      inputs: Dict[str, Any],
+                      render: Callable[[], Image.Image],
+                      external: Any = None,
+                      cacheable: bool = True) -> Image.Image:
+        """
+        Cached panel for these inputs, rendering it on a miss.
+
+        Args:
+            owner: Who draws the panel and how (class name, sizes, design settings)
+            inputs: Field values the panel reads (see select_inputs)
+            render: Draws the panel
+            external: Inputs outside the project data (e.g. icon versions)
+            cacheable: False renders without caching (e.g. unresolved icons)
+
+        Returns:
+            Panel image (shared: do not draw on it)
+        """
+        if not cacheable:
+            return render()
+
+        key = self.key(owner, inputs, external)
+        with self._lock:
+            panel = self._entries.get(key)
+            if panel is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return panel
+            self.misses += 1
+
+        panel = render()
+
+        with self._lock:
+            self._entries[key] = panel
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return panel
+
+    def clear(self):
+        """Drop every cached panel."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Entry count and hit/miss counters."""
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+# Process-wide cache shared by panel agents and compositors
+panel_cache = PanelCache()
@@ -36,6 +36,7 @@ class RealityPanelAgent(PanelAgentBase):
         - reality.cost (secondary)
         - reality.surprises (key insights)
         - reality.challenges (context)
+        - reality.timeline_note (mic drop aside)
         """
         return PanelAgentMessage(
             agent_id=self.agent_id,
@@ -45,7 +46,8 @@ class RealityPanelAgent(PanelAgentBase):
                 "reality.timeline",
                 "reality.cost",
                 "reality.surprises",
-                "reality.challenges"
+                "reality.challenges",
+                "reality.timeline_note"
             ],
             visual_weight=0.6,  # HIGH (this is the payoff panel)
             color_emphasis="electric_green",
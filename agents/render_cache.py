@@ -0,0 +1,230 @@
+"""
+Render Cache
+Content-addressed cache of finished breakdown images.
+
+Identical inputs used to be re-rendered from scratch on every run
+(nightly batches, CI regenerating docs/phase-outputs). The cache keys a
+finished PNG by a SHA-256 over everything that decides its pixels:
+
+- the project data, canonicalized (sorted keys, dates as ISO strings)
+- the pipeline name and the source of the agents package (any code
+  change to a compositor, renderer, agent or the design-system contract
+  starts a new cache)
+- the icons the render draws (content hash per icon; see
+  IconFetcher.icon_versions)
+
+A hit copies the stored PNG to the output path and skips the render.
+Renders that drew a stand-in for an icon that could not be fetched are
+not stored, so they are retried once the icon is available. Entries
+live in output/.render_cache/ as <key>.png plus a <key>.json sidecar;
+the directory is kept under max_bytes by evicting the least recently
+used entries (a hit refreshes an entry's mtime).
+
+Usage:
+    from agents.render_cache import RenderCache
+
+    cache = RenderCache()
+    key = cache.key('phase0', project_data, project['tech_stack'][:4])
+    output_path = cache.restore(key)
+    if output_path is None:
+        output_path = render(project_data)
+        cache.put(key, output_path)
+
+    python arkify.py examples/ai-todo-app.yaml --no-cache
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+# Bump when the cache layout or key recipe changes
+RENDER_CACHE_VERSION = 2
+
+AGENTS_DIR = Path(__file__).resolve().parent
+
+_code_version: Optional[str] = None
+_code_version_lock = threading.Lock()
+
+
+def code_version() -> str:
+    """SHA-256 over the agents package source (computed once per process)."""
+    global _code_version
+    with _code_version_lock:
+        if _code_version is None:
+            digest = hashlib.sha256()
+            for path in sorted(AGENTS_DIR.glob('*.py')):
+                digest.update(path.name.encode('utf-8'))
+                digest.update(path.read_bytes())
+            _code_version = digest.hexdigest()
+        return _code_version
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def canonical_json(data: Any) -> str:
+    """Stable JSON for hashing (sorted keys, no whitespace, dates as ISO strings)."""
+    return json.dumps(data, sort_keys=True, separators=(',', ':'),
+                      ensure_ascii=False, default=_json_default)
+
+
+class RenderCache:
+    """
+    Size-bounded on-disk LRU of rendered PNGs.
+
+    Safe to share a directory between processes: entries are written
+    atomically and a vanished entry is just a miss.
+    """
+
+    def __init__(self,
+                 cache_dir: str = 'output/.render_cache',
+                 max_bytes: int = 256 * 1024 * 1024,
+                 icon_cache_dir: str = 'output/.icon_cache'):
+        """
+        Args:
+            cache_dir: Directory holding cached PNGs
+            max_bytes: Total PNG size kept before least recently used entries are evicted
+            icon_cache_dir: Icon cache whose state is part of the key
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.icon_cache_dir = icon_cache_dir
+        self._icon_fetcher = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def icon_fetcher(self):
+        """IconFetcher used only for slug mapping and icon cache lookups (created on first use)."""
+        if self._icon_fetcher is None:
+            from agents.icon_fetcher import IconFetcher
+            self._icon_fetcher = IconFetcher(cache_dir=self.icon_cache_dir)
+        return self._icon_fetcher
+
+    def key(self, pipeline: str, project_data: Dict[str, Any], icon_names: List[str]) -> Optional[str]:
+        """
+        Cache key of a render.
+
+        Args:
+            pipeline: Pipeline name
+            project_data: Parsed YAML data
+            icon_names: Technologies whose icons the render draws
+
+        Returns:
+            Hex key, or None if the render cannot be cached (an icon is unresolved)
+        """
+        icons = self.icon_fetcher.icon_versions(icon_names) if icon_names else {}
+        if icons is None:
+            return None
+
+        # Key inputs only: no agent, renderer or PIL import on the cache-hit path
+        payload = {
+            'version': RENDER_CACHE_VERSION,
+            'pipeline': pipeline,
+            'code': code_version(),
+            'icons': icons,
+            'project': project_data,
+        }
+        return hashlib.sha256(canonical_json(payload).encode('utf-8')).hexdigest()
+
+    def restore(self, key: Optional[str], output_path: Optional[Path] = None) -> Optional[Path]:
+        """
+        Copy a cached render to its output path.
+
+        Args:
+            key: Cache key (None is a miss)
+            output_path: Destination (default: where the cached render was first written)
+
+        Returns:
+            Output path on a hit, None on a miss
+        """
+        if key is None:
+            return None
+
+        png_path = self.cache_dir / f"{key}.png"
+        try:
+            meta = json.loads((self.cache_dir / f"{key}.json").read_text())
+            output_path = Path(output_path or meta['output_path'])
+            png_bytes = png_path.read_bytes()
+            os.utime(png_path)  # LRU: mark as recently used
+        except (OSError, ValueError, KeyError):
+            self._count(hit=False)
+            return None
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_atomic(output_path, png_bytes)
+        self._count(hit=True)
+        return output_path
+
+    def put(self, key: Optional[str], output_path: Path):
+        """Store a finished render (no-op for key None); evicts old entries if over max_bytes."""
+        if key is None:
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(self.cache_dir / f"{key}.png", Path(output_path).read_bytes())
+            self._write_atomic(self.cache_dir / f"{key}.json", json.dumps({
+                'output_path': str(output_path),
+                'created_at': time.time(),
+            }).encode('utf-8'))
+        except OSError as e:
+            print(f"    ⚠️  Could not write render cache entry: {e}")
+            return
+
+        self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        for png_path in self.cache_dir.glob('*.png'):
+            try:
+                stat = png_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, png_path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, png_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            for path in (png_path, png_path.with_suffix('.json')):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            total -= size
+
+    def clear(self):
+        """Delete every entry."""
+        for pattern in ('*.png', '*.json'):
+            for path in self.cache_dir.glob(pattern):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def _count(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes):
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
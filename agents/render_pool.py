@@ -0,0 +1,135 @@
+"""
+Render Pool
+Multi-process rendering with warm workers.
+
+Rendering is CPU-bound (Pillow and Python loops), so one process uses one
+core. The pool starts N worker processes; each builds its pipeline
+(orchestrator/compositor, fonts, icon fetcher) once in its initializer and
+then renders job after job with warm in-process caches (font registry,
+gradient LRU, rasterized icons, text layouts).
+
+Jobs are YAML paths and results are JobResults carrying the output file
+path, so no Image objects are pickled between processes. Submission is
+bounded (max_pending in flight), so a huge job list or a lazy generator of
+inputs never piles up in the executor queue.
+
+Usage:
+    from agents.render_pool import RenderPool
+
+    with RenderPool('phase1', workers=32) as pool:
+        for result in pool.imap(yaml_paths):
+            print(result.input_path, result.output_path)
+"""
+
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional
+
+from agents.batch_runner import PIPELINES, JobResult, Pipeline
+
+
+# Per-worker state (set by _init_worker in each process)
+_worker_pipeline: Optional[Pipeline] = None
+
+
+def _init_worker(pipeline_name: str, quiet: bool, use_cache: bool = True):
+    """Build the pipeline once per worker and warm process-wide caches."""
+    global _worker_pipeline
+
+    if quiet:
+        sys.stdout = open(os.devnull, 'w')
+
+    from agents.font_registry import FAMILY_CANDIDATES, font_registry
+
+    # Probe the font search path (directory walk, fc-match) up front
+    for family in FAMILY_CANDIDATES:
+        for weight in ('regular', 'bold'):
+            font_registry.resolve(family, weight)
+
+    _worker_pipeline = Pipeline(pipeline_name, use_cache=use_cache)
+    _worker_pipeline.warm()
+
+
+def _render_job(input_path: str) -> JobResult:
+    """Render one YAML file in a worker."""
+    return _worker_pipeline.render_file(Path(input_path))
+
+
+class RenderPool:
+    """
+    Pool of warm render processes.
+
+    Results come back in completion order.
+    """
+
+    def __init__(self,
+                 pipeline: str = 'phase0',
+                 workers: Optional[int] = None,
+                 quiet: bool = True,
+                 max_pending: Optional[int] = None,
+                 mp_context=None,
+                 use_cache: bool = True):
+        """
+        Args:
+            pipeline: Key of batch_runner.PIPELINES
+            workers: Worker processes (default: CPU count)
+            quiet: Silence the agents' progress output in workers
+            max_pending: Jobs in flight before imap() waits (default: 2 per worker)
+            mp_context: multiprocessing context (default: platform default)
+            use_cache: Serve unchanged inputs from the render cache
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 2
+
+        # Fail early on an unknown pipeline name (instead of in every worker)
+        if pipeline not in PIPELINES:
+            raise ValueError(f"Unknown pipeline '{pipeline}' (choose from {', '.join(PIPELINES)})")
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(pipeline, quiet, use_cache)
+        )
+
+    def imap(self, input_paths: Iterable[Path]) -> Iterator[JobResult]:
+        """
+        Render inputs, yielding JobResults as they complete.
+
+        At most max_pending jobs are submitted at a time; the next input is
+        only taken from input_paths once a slot frees up.
+        """
+        pending: Dict[Future, Path] = {}
+
+        for input_path in input_paths:
+            while len(pending) >= self.max_pending:
+                yield from self._collect(pending)
+            pending[self._executor.submit(_render_job, str(input_path))] = Path(input_path)
+
+        while pending:
+            yield from self._collect(pending)
+
+    def close(self, cancel: bool = False):
+        """Shut the workers down (cancel=True drops queued jobs)."""
+        self._executor.shutdown(wait=True, cancel_futures=cancel)
+
+    def __enter__(self) -> 'RenderPool':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close(cancel=exc_info[0] is not None)
+
+    @staticmethod
+    def _collect(pending: Dict[Future, Path]) -> Iterator[JobResult]:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            input_path = pending.pop(future)
+            try:
+                yield future.result()
+            except BrokenProcessPool as e:
+                yield JobResult(input_path, None, 0.0, error=f"Worker process died: {e}")
+            except Exception as e:
+                yield JobResult(input_path, None, 0.0, error=f"{type(e).__name__}: {e}")
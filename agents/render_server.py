@@ -0,0 +1,329 @@
+"""
+Render Server
+Resident render daemon with a local HTTP API (TCP or Unix socket).
+
+Every `python arkify*.py` run pays interpreter startup, imports and agent
+construction before drawing anything. The server keeps pipelines (and
+with them fonts, gradients, icon and layout caches) warm in worker
+threads and renders projects posted to it.
+
+API:
+    POST /render?pipeline=phase0&format=png     body: project YAML or JSON
+        200 image/png            (format=png, default)
+        200 application/json     {"path": ..., "seconds": ...}  (format=path)
+        400 invalid payload / unknown pipeline
+        503 queue full (retry later)
+        504 render did not finish within the request timeout
+    GET /health
+        200 application/json     queue depth, counters, latency percentiles
+
+Requests are handled concurrently but renders go through a bounded queue
+served by a fixed number of render threads; when the queue is full, new
+requests are rejected immediately with 503 instead of piling up.
+
+Usage:
+    python arkify.py serve --port 8765
+    python arkify.py serve --socket /tmp/arkify.sock
+
+    curl --data-binary @examples/ai-todo-app.yaml localhost:8765/render > out.png
+    curl --unix-socket /tmp/arkify.sock --data-binary @p.yaml 'http://x/render?format=path'
+"""
+
+import json
+import os
+import queue
+import signal
+import socketserver
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+import yaml
+
+from agents.batch_runner import PIPELINES, Pipeline, validate_project
+
+
+MAX_BODY_BYTES = 1024 * 1024
+
+
+class RenderService:
+    """
+    Bounded render queue served by warm worker threads.
+
+    Each worker owns its pipelines (agents are not shared between
+    threads); renders of the same project name are serialized because the
+    pipelines write output/<project-name>[-<pipeline>].png.
+    """
+
+    def __init__(self,
+                 workers: int = 2,
+                 queue_size: int = 16,
+                 default_pipeline: str = 'phase0',
+                 warm_pipelines: Tuple[str, ...] = ('phase0',),
+                 use_cache: bool = True):
+        """
+        Args:
+            workers: Render threads
+            queue_size: Jobs waiting before submit() rejects
+            default_pipeline: Pipeline used when a request does not name one
+            warm_pipelines: Pipelines each worker builds before serving
+            use_cache: Serve unchanged projects from the render cache
+        """
+        self.default_pipeline = default_pipeline
+        self.use_cache = use_cache
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._name_locks: Dict[str, threading.Lock] = {}
+        self._name_locks_lock = threading.Lock()
+
+        self._stats_lock = threading.Lock()
+        self._latencies: deque = deque(maxlen=1000)
+        self.rendered = 0
+        self.failed = 0
+        self.rejected = 0
+
+        ready = []
+        self._threads = []
+        for i in range(workers):
+            event = threading.Event()
+            thread = threading.Thread(target=self._worker, args=(warm_pipelines, event),
+                                      name=f'render-{i}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+            ready.append(event)
+
+        for event in ready:
+            event.wait()
+
+    def submit(self, project_data: Dict[str, Any], pipeline: Optional[str] = None) -> Future:
+        """
+        Queue a render.
+
+        Returns:
+            Future resolving to (output Path, PNG bytes)
+
+        Raises:
+            ValueError: Unknown pipeline or invalid project data
+            queue.Full: Too many jobs waiting
+        """
+        pipeline = pipeline or self.default_pipeline
+        if pipeline not in PIPELINES:
+            raise ValueError(f"Unknown pipeline '{pipeline}' (choose from {', '.join(PIPELINES)})")
+        validate_project(project_data, PIPELINES[pipeline][2])
+
+        future: Future = Future()
+        try:
+            self._queue.put_nowait((pipeline, project_data, future, time.perf_counter()))
+        except queue.Full:
+            with self._stats_lock:
+                self.rejected += 1
+            raise
+        return future
+
+    def name_lock(self, project_data: Dict[str, Any]) -> threading.Lock:
+        """Lock guarding the output files of a project name."""
+        name = str(project_data['project'].get('name', '')).lower()
+        with self._name_locks_lock:
+            return self._name_locks.setdefault(name, threading.Lock())
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, counters and render latency percentiles (ms)."""
+        with self._stats_lock:
+            latencies = sorted(self._latencies)
+            stats = {
+                'queued': self._queue.qsize(),
+                'workers': len(self._threads),
+                'rendered': self.rendered,
+                'failed': self.failed,
+                'rejected': self.rejected,
+            }
+        if latencies:
+            stats['p50_ms'] = round(latencies[len(latencies) // 2] * 1000, 1)
+            stats['p95_ms'] = round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000, 1)
+        return stats
+
+    def _worker(self, warm_pipelines: Tuple[str, ...], ready: threading.Event):
+        pipelines: Dict[str, Pipeline] = {}
+        for name in warm_pipelines:
+            try:
+                pipelines[name] = Pipeline(name, use_cache=self.use_cache)
+                pipelines[name].warm()
+            except Exception as e:
+                # Retried lazily on the first job for this pipeline (its error then reaches the client)
+                print(f"⚠️  Could not warm pipeline '{name}': {type(e).__name__}: {e}", file=sys.stderr)
+        ready.set()
+
+        while True:
+            name, project_data, future, queued_at = self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                if name not in pipelines:
+                    pipelines[name] = Pipeline(name, use_cache=self.use_cache)
+                with self.name_lock(project_data):
+                    output_path = pipelines[name].render(project_data)
+                    png_bytes = Path(output_path).read_bytes()
+            except Exception as e:
+                with self._stats_lock:
+                    self.failed += 1
+                future.set_exception(e)
+                continue
+
+            with self._stats_lock:
+                self.rendered += 1
+                self._latencies.append(time.perf_counter() - queued_at)
+            future.set_result((Path(output_path), png_bytes))
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """HTTP front end for a RenderService (server.service)."""
+
+    server_version = 'ArkifyRenderServer/1.0'
+
+    def do_GET(self):
+        if urlparse(self.path).path == '/health':
+            self._send_json(200, dict(self.server.service.stats(), status='ok'))
+        else:
+            self._send_json(404, {'error': 'Not found'})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != '/render':
+            self._send_json(404, {'error': 'Not found'})
+            return
+
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        response_format = params.get('format', 'png')
+        if response_format not in ('png', 'path'):
+            self._send_json(400, {'error': "format must be 'png' or 'path'"})
+            return
+
+        length = int(self.headers.get('Content-Length') or 0)
+        if length <= 0 or length > MAX_BODY_BYTES:
+            self._send_json(400, {'error': f'Body must be 1..{MAX_BODY_BYTES} bytes of YAML/JSON'})
+            return
+
+        try:
+            # JSON is a subset of YAML: one parser for both content types
+            project_data = yaml.safe_load(self.rfile.read(length))
+            future = self.server.service.submit(project_data, params.get('pipeline'))
+        except (ValueError, yaml.YAMLError) as e:
+            self._send_json(400, {'error': str(e)})
+            return
+        except queue.Full:
+            self._send_json(503, {'error': 'Render queue full'}, headers={'Retry-After': '1'})
+            return
+
+        start = time.perf_counter()
+        try:
+            output_path, png_bytes = future.result(timeout=self.server.request_timeout)
+        except FutureTimeoutError:
+            self._send_json(504, {'error': 'Render timed out'})
+            return
+        except Exception as e:
+            self._send_json(500, {'error': f"{type(e).__name__}: {e}"})
+            return
+
+        if response_format == 'path':
+            self._send_json(200, {'path': str(output_path.resolve()),
+                                  'seconds': round(time.perf_counter() - start, 4)})
+        else:
+            self._send(200, 'image/png', png_bytes)
+
+    def _send_json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        self._send(status, 'application/json', json.dumps(payload).encode('utf-8'), headers)
+
+    def _send(self, status: int, content_type: str, body: bytes, headers: Optional[Dict[str, str]] = None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port) address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else 'unix'
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """ThreadingHTTPServer equivalent on a Unix domain socket."""
+
+    daemon_threads = True
+
+    def server_bind(self):
+        socketserver.UnixStreamServer.server_bind(self)
+        self.server_name = 'localhost'
+        self.server_port = 0
+
+
+def create_server(service: RenderService,
+                  host: str = '127.0.0.1',
+                  port: int = 8765,
+                  socket_path: Optional[str] = None,
+                  request_timeout: float = 60.0):
+    """
+    Create (but do not start) an HTTP server for a RenderService.
+
+    Args:
+        service: Render queue and workers
+        host, port: TCP address (ignored if socket_path is given)
+        socket_path: Unix domain socket path
+        request_timeout: Seconds a request waits for its render
+
+    Returns:
+        Server object (call serve_forever())
+    """
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = UnixHTTPServer(socket_path, RenderRequestHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), RenderRequestHandler)
+        server.daemon_threads = True
+
+    server.service = service
+    server.request_timeout = request_timeout
+    return server
+
+
+def serve(host: str = '127.0.0.1',
+          port: int = 8765,
+          socket_path: Optional[str] = None,
+          workers: int = 2,
+          queue_size: int = 16,
+          pipeline: str = 'phase0',
+          verbose: bool = False,
+          use_cache: bool = True):
+    """Run the render daemon until interrupted."""
+    print(f"🔥 Warming {workers} render worker(s) ({pipeline})...")
+    service = RenderService(workers=workers, queue_size=queue_size, default_pipeline=pipeline,
+                            warm_pipelines=(pipeline,), use_cache=use_cache)
+    server = create_server(service, host, port, socket_path)
+
+    address = socket_path or f"http://{host}:{server.server_port}"
+    print(f"✅ Arkify render server listening on {address}")
+    print("   POST /render  (YAML/JSON body)   GET /health")
+    sys.stdout.flush()
+
+    if not verbose:
+        # Agents print progress per render; keep the daemon's stdout quiet
+        sys.stdout = open(os.devnull, 'w')
+
+    # Shut down cleanly (and remove the socket file) on SIGTERM too
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if socket_path and os.path.exists(socket_path):
+            os.unlink(socket_path)
@@ -169,7 +169,7 @@ class ShapeDecorator:
 
 if __name__ == '__main__':
     import os
-    from PIL import ImageFont
+    from agents.font_registry import get_font
 
     # Test shapes
     decorator = ShapeDecorator()
@@ -178,10 +178,7 @@ if __name__ == '__main__':
     img = Image.new('RGB', (600, 400), '#22223B')
     draw = ImageDraw.Draw(img)
 
-    try:
-        font = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 32)
-    except:
-        font = ImageFont.load_default()
+    font = get_font('display', 32)
 
     # Test rounded rectangle
     decorator.draw_rounded_rectangle(
@@ -0,0 +1,90 @@
+"""
+Startup Profile
+Per-module import time report for the CLI entry points.
+
+`python arkify.py --profile-startup <args>` re-runs the same command
+under `python -X importtime` and summarizes what the interpreter spent
+importing: total import time, the slowest modules by cumulative time
+(a module plus everything it pulled in) and by self time.
+
+Usage:
+    python arkify.py --profile-startup --help
+    python arkify.py --profile-startup examples/ai-todo-app.yaml
+"""
+
+import re
+import subprocess
+import sys
+import time
+from typing import List, NamedTuple, Tuple
+
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$')
+
+
+class ImportTiming(NamedTuple):
+    """One line of `-X importtime` output (times in microseconds)."""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> Tuple[List[ImportTiming], List[str]]:
+    """
+    Split `-X importtime` stderr into timings and the command's own stderr.
+
+    Returns:
+        (timings, other stderr lines)
+    """
+    timings: List[ImportTiming] = []
+    other: List[str] = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            timings.append(ImportTiming(module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+        elif not line.startswith('import time: self [us]'):
+            other.append(line)
+    return timings, other
+
+
+def print_report(timings: List[ImportTiming], wall_seconds: float, top: int = 15):
+    """Print the import time summary (to stderr, next to the command's output)."""
+    total_us = sum(t.cumulative_us for t in timings if t.depth == 0)
+    out = sys.stderr
+
+    print("\n" + "=" * 64, file=out)
+    print(f"  ⏱️  STARTUP PROFILE: {len(timings)} modules, "
+          f"{total_us / 1000:.1f} ms importing, {wall_seconds * 1000:.0f} ms total", file=out)
+    print("=" * 64, file=out)
+
+    print("  Slowest (cumulative):", file=out)
+    for t in sorted((t for t in timings if t.depth == 0), key=lambda t: t.cumulative_us, reverse=True)[:top]:
+        print(f"    {t.cumulative_us / 1000:8.1f} ms  {t.module}", file=out)
+
+    print("  Slowest (self):", file=out)
+    for t in sorted(timings, key=lambda t: t.self_us, reverse=True)[:top]:
+        print(f"    {t.self_us / 1000:8.1f} ms  {t.module}", file=out)
+
+
+def profile_startup(script: str, argv: List[str], top: int = 15) -> int:
+    """
+    Run `python -X importtime script *argv` and report import times.
+
+    The command's stdout passes through unchanged.
+
+    Returns:
+        The command's exit code
+    """
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', script, *argv],
+                            stderr=subprocess.PIPE, text=True)
+    wall_seconds = time.perf_counter() - start
+
+    timings, other = parse_importtime(result.stderr)
+    for line in other:
+        print(line, file=sys.stderr)
+
+    print_report(timings, wall_seconds, top)
+    return result.returncode
@@ -4,9 +4,11 @@ Renders narrative-driven panels with emotional hooks.
 Uses gradients, big typography, and emojis for impact.
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 from agents.gradient_renderer import GradientRenderer
 from agents.shape_decorator import ShapeDecorator
+from agents.font_registry import get_font
+from agents.text_layout import text_layout
 
 
 class StoryPanelRenderer:
@@ -46,13 +48,10 @@ class StoryPanelRenderer:
         draw = ImageDraw.Draw(img)
 
         # Load fonts
-        try:
-            font_emoji = ImageFont.truetype('/System/Library/Fonts/Apple Color Emoji.ttc', 80)
-            font_title = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 36)
-            font_subtitle = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 20)
-            font_number = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 96)
-        except:
-            font_emoji = font_title = font_subtitle = font_number = ImageFont.load_default()
+        font_emoji = get_font('emoji', 80)
+        font_title = get_font('display', 36)
+        font_subtitle = get_font('display', 20)
+        font_number = get_font('display', 96)
 
         # Content positioning
         y = 80
@@ -77,56 +76,22 @@ class StoryPanelRenderer:
         # Title (main hook)
         title = story_data.get('title', '')
         if title:
-            # Word wrap for long titles
-            words = title.split()
-            lines = []
-            current_line = []
-
-            for word in words:
-                test_line = ' '.join(current_line + [word])
-                bbox = draw.textbbox((0, 0), test_line, font=font_title)
-                if bbox[2] - bbox[0] < width - 80:  # 40px margin each side
-                    current_line.append(word)
-                else:
-                    if current_line:
-                        lines.append(' '.join(current_line))
-                    current_line = [word]
-
-            if current_line:
-                lines.append(' '.join(current_line))
+            # Word wrap for long titles: lines narrower than width - 80 (40px margin each side)
+            lines = text_layout.wrap(title, font_title, width - 81)
 
             # Draw title lines
-            for line in lines:
-                draw.text((40, y), line, fill='#FFFFFF', font=font_title)
-                y += 45
+            y += text_layout.draw(draw, lines, 40, y, font_title, '#FFFFFF', 45)
 
             y += 20  # Space before subtitle
 
         # Subtitle (supporting text)
         subtitle = story_data.get('subtitle', '')
         if subtitle:
-            # Word wrap subtitle
-            words = subtitle.split()
-            lines = []
-            current_line = []
-
-            for word in words:
-                test_line = ' '.join(current_line + [word])
-                bbox = draw.textbbox((0, 0), test_line, font=font_subtitle)
-                if bbox[2] - bbox[0] < width - 80:
-                    current_line.append(word)
-                else:
-                    if current_line:
-                        lines.append(' '.join(current_line))
-                    current_line = [word]
-
-            if current_line:
-                lines.append(' '.join(current_line))
-
-            # Draw subtitle lines
-            for line in lines:
-                draw.text((40, y), line, fill='#FFFFFFCC', font=font_subtitle)  # Slightly transparent
-                y += 30
+            # Word wrap subtitle (same margins as the title)
+            lines = text_layout.wrap(subtitle, font_subtitle, width - 81)
+
+            # Draw subtitle lines (slightly transparent)
+            y += text_layout.draw(draw, lines, 40, y, font_subtitle, '#FFFFFFCC', 30)
 
         return img
 
@@ -8,7 +8,7 @@ Autonomy Level: 40%
 - Chooses grouping strategy (frontend/backend/infra)
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from PIL import Image, ImageDraw
 from agents.panel_agent_base import PanelAgentBase, PanelAgentMessage
 from agents.icon_fetcher import IconFetcher
@@ -48,6 +48,10 @@ class TechStackPanelAgent(PanelAgentBase):
             animation_intent="icon_pop"
         )
 
+    def external_inputs(self, available_data: Dict[str, Any]) -> Optional[Any]:
+        """Versions of the cached icons (None while any still has to be fetched)."""
+        return self.icon_fetcher.icon_versions(available_data.get('tech_stack', []))
+
     def render(self, assigned_data: Dict[str, Any]) -> Image.Image:
         """
         Phase 2: Create Tech Stack panel (300x400px).
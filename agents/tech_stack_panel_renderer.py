@@ -4,10 +4,12 @@ Displays tech stack with REAL brand icons in 2x2 grid.
 Uses gradients and generous whitespace for Canva aesthetic.
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import ImageDraw
+from agents.icon_atlas import icon_atlases
 from agents.icon_fetcher import IconFetcher
 from agents.gradient_renderer import GradientRenderer
 from agents.shape_decorator import ShapeDecorator
+from agents.font_registry import get_font
 
 
 class TechStackPanelRenderer:
@@ -44,12 +46,8 @@ class TechStackPanelRenderer:
         draw = ImageDraw.Draw(img)
 
         # Load fonts
-        try:
-            font_title = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 32)
-            font_tech = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 20)
-        except:
-            font_title = ImageFont.load_default()
-            font_tech = ImageFont.load_default()
+        font_title = get_font('display', 32)
+        font_tech = get_font('display', 20)
 
         # Title
         draw.text((40, 40), "TECH STACK", fill='#FFFFFF', font=font_title)
@@ -60,6 +58,10 @@ class TechStackPanelRenderer:
 
         # 2x2 Grid layout
         icon_size = 100
+
+        # Real logos come from one sprite sheet (initials fallbacks are drawn below)
+        atlas = icon_atlases.for_icons(
+            [icon for icon in icons_data if icon.get('source') != 'fallback'], icon_size)
         grid_start_x = 80
         grid_start_y = 120
         spacing_x = 200
@@ -86,26 +88,11 @@ class TechStackPanelRenderer:
                 radius=16
             )
 
-            # Place icon
-            if icon_data.get('success') and icon_data.get('png_path'):
-                try:
-                    icon_img = Image.open(icon_data['png_path'])
-                    icon_img = icon_img.resize((icon_size, icon_size), Image.Resampling.LANCZOS)
-
-                    # Convert RGBA to RGB if needed
-                    if icon_img.mode == 'RGBA':
-                        # Create white background
-                        bg = Image.new('RGB', icon_img.size, '#FFFFFF')
-                        bg.paste(icon_img, mask=icon_img.split()[3])
-                        icon_img = bg
-
-                    img.paste(icon_img, (x, y))
-                except Exception as e:
-                    print(f"⚠️ Could not load icon for {tech_stack[i]}: {e}")
-                    # Fallback: Draw colored box with letter
-                    self._draw_fallback_icon(draw, x, y, icon_size, tech_stack[i])
-            else:
-                # Fallback
+            # Place icon (crop from the atlas onto the white background)
+            placed = (icon_data.get('source') != 'fallback'
+                      and atlas.paste(img, icon_data['slug'], (x, y)))
+            if not placed:
+                # Fallback: Draw colored box with letter
                 self._draw_fallback_icon(draw, x, y, icon_size, tech_stack[i])
 
             # Tech name below icon
@@ -140,10 +127,7 @@ class TechStackPanelRenderer:
         )
 
         # Draw letter
-        try:
-            fallback_font = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 48)
-        except:
-            fallback_font = ImageFont.load_default()
+        fallback_font = get_font('display', 48)
 
         bbox = draw.textbbox((0, 0), letter, font=fallback_font)
         text_width = bbox[2] - bbox[0]
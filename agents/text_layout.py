@@ -0,0 +1,221 @@
+"""
+Text Layout Engine
+Linear-time word wrapping from cached advance widths.
+
+The old wrap loops re-measured the whole growing line with draw.textbbox
+after every word, which is quadratic in paragraph length. Here each unique
+word is measured once per font; a line's position is the running sum of
+word advances plus the space between them (including any kerning against
+the space), so wrapping a paragraph is a single pass over its words.
+
+Lines are accepted by their ink extent, like the textbbox loops: the
+first word's left ink edge to the last word's right ink edge. That sum is
+exact to a fraction of a pixel; candidates within INK_SLACK of max_width
+are measured with font.getbbox, so glyphs never overhang max_width.
+
+Layouts are returned as LineBox lists and memoized, so a panel that first
+measures a paragraph (to get its height) and then draws it only lays it
+out once.
+
+Usage:
+    from agents.text_layout import text_layout
+
+    boxes = text_layout.wrap(text, font, max_width=268)
+    text_layout.draw(draw, boxes, x=16, y=64, font=font, fill='#FFFFFF', line_height=24)
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import List, NamedTuple, Tuple
+from PIL import ImageDraw, ImageFont
+
+
+# Candidate lines whose estimated ink width is this close to max_width are
+# measured exactly (sub-pixel glyph positions round either way)
+INK_SLACK = 2.0
+
+class LineBox(NamedTuple):
+    """One wrapped line: its text and advance width in pixels."""
+    text: str
+    width: float
+
+
+class TextLayout:
+    """
+    Word wrapping with per-font memoized word widths.
+
+    Thread-safe: shared by parallel panel renderers.
+    """
+
+    def __init__(self, max_layouts_per_font: int = 256):
+        """
+        Args:
+            max_layouts_per_font: Wrapped paragraphs remembered per font
+        """
+        self.max_layouts_per_font = max_layouts_per_font
+
+        # font -> {word: (advance, trailing space advance, leading space advance, ink left, ink right)}
+        self._words: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+        # font -> OrderedDict[(text, max_width), List[LineBox]]
+        self._layouts: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+        self._spaces: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def wrap(self, text: str, font: ImageFont.ImageFont, max_width: float) -> List[LineBox]:
+        """
+        Wrap text into lines whose ink is no wider than max_width.
+
+        A single word wider than max_width gets a line of its own
+        (same line breaks as the previous textbbox-based loops).
+
+        Args:
+            text: Paragraph to wrap (split on whitespace)
+            font: Font used for measuring
+            max_width: Maximum line width in pixels
+
+        Returns:
+            List of LineBox
+        """
+        key = (text, max_width)
+        with self._lock:
+            layouts = self._layouts.get(font)
+            if layouts is None:
+                layouts = OrderedDict()
+                self._layouts[font] = layouts
+            boxes = layouts.get(key)
+            if boxes is not None:
+                layouts.move_to_end(key)
+                return boxes
+
+        boxes = self._wrap(text.split(), font, max_width)
+
+        with self._lock:
+            layouts[key] = boxes
+            if len(layouts) > self.max_layouts_per_font:
+                layouts.popitem(last=False)
+
+        return boxes
+
+    def lines(self, text: str, font: ImageFont.ImageFont, max_width: float) -> List[str]:
+        """Wrap text and return only the line strings."""
+        return [box.text for box in self.wrap(text, font, max_width)]
+
+    def draw(self,
+             draw: ImageDraw.ImageDraw,
+             boxes: List[LineBox],
+             x: int,
+             y: int,
+             font: ImageFont.ImageFont,
+             fill,
+             line_height: int) -> int:
+        """
+        Draw previously wrapped lines.
+
+        Returns:
+            Total height of the drawn block
+        """
+        for i, box in enumerate(boxes):
+            draw.text((x, y + i * line_height), box.text, font=font, fill=fill)
+        return len(boxes) * line_height
+
+    def measure(self, word: str, font: ImageFont.ImageFont) -> float:
+        """Advance width of a single word (memoized per font)."""
+        return self._word_metrics(word, font)[0]
+
+    # === Internals ===
+
+    def _wrap(self, words: List[str], font: ImageFont.ImageFont, max_width: float) -> List[LineBox]:
+        space = self._space_width(font)
+
+        lines: List[LineBox] = []
+        current: List[str] = []
+        current_width = 0.0
+        current_trailing = 0.0  # advance of the space after the last word
+        current_left = 0.0  # left ink edge of the first word
+
+        for word in words:
+            advance, trailing, leading, ink_left, ink_right = self._word_metrics(word, font)
+
+            if current:
+                # last word + space (kerned on both sides) + word
+                candidate = current_width + current_trailing + leading - space + advance
+                ink_width = candidate - advance + ink_right - current_left
+                if abs(ink_width - max_width) <= INK_SLACK:
+                    ink_width = self._ink(' '.join(current + [word]), font)
+                fits = ink_width <= max_width
+            else:
+                candidate = advance
+                fits = ink_right - ink_left <= max_width
+
+            if not fits:
+                if current:
+                    lines.append(LineBox(' '.join(current), current_width))
+                    current = [word]
+                    current_width = advance
+                    current_trailing = trailing
+                    current_left = ink_left
+                else:
+                    lines.append(LineBox(word, advance))
+            else:
+                if not current:
+                    current_left = ink_left
+                current.append(word)
+                current_width = candidate
+                current_trailing = trailing
+
+        if current:
+            lines.append(LineBox(' '.join(current), current_width))
+
+        return lines
+
+    def _word_metrics(self, word: str, font: ImageFont.ImageFont) -> Tuple[float, float, float, float, float]:
+        cache = self._words.get(font)
+        if cache is None:
+            with self._lock:
+                cache = self._words.setdefault(font, {})
+
+        metrics = cache.get(word)
+        if metrics is None:
+            advance = self._length(word, font)
+            trailing = self._length(word + ' ', font) - advance
+            leading = self._length(' ' + word, font) - advance
+            ink_left, ink_right = self._ink_bounds(word, font)
+            metrics = (advance, trailing, leading, ink_left, ink_right)
+            cache[word] = metrics
+
+        return metrics
+
+    def _space_width(self, font: ImageFont.ImageFont) -> float:
+        width = self._spaces.get(font)
+        if width is None:
+            width = self._length(' ', font)
+            with self._lock:
+                self._spaces[font] = width
+        return width
+
+    @staticmethod
+    def _length(text: str, font: ImageFont.ImageFont) -> float:
+        try:
+            return font.getlength(text)
+        except Exception:
+            # Rough estimate for fonts without advance metrics
+            return len(text) * 8
+
+    @classmethod
+    def _ink_bounds(cls, text: str, font: ImageFont.ImageFont) -> Tuple[float, float]:
+        """Left and right ink edge of text drawn at x=0 (as draw.textbbox measures it)."""
+        try:
+            bbox = font.getbbox(text)
+            return bbox[0], bbox[2]
+        except Exception:
+            return 0, cls._length(text, font)
+
+    @classmethod
+    def _ink(cls, text: str, font: ImageFont.ImageFont) -> float:
+        left, right = cls._ink_bounds(text, font)
+        return right - left
+
+
+# Process-wide layout engine shared by all agents and renderers
+text_layout = TextLayout()
@@ -4,7 +4,8 @@ Visualizes where time actually goes: fails vs working vs polish
 Shows: 60% fails (red), 30% working (yellow), 10% polish (green)
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
+from agents.font_registry import get_font
 
 
 class TimelineBreakdownRenderer:
@@ -35,14 +36,9 @@ class TimelineBreakdownRenderer:
         draw = ImageDraw.Draw(img)
 
         # Load fonts
-        try:
-            font_title = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 20)
-            font_label = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 14)
-            font_small = ImageFont.truetype('/System/Library/Fonts/SFNSDisplay.ttf', 11)
-        except:
-            font_title = ImageFont.load_default()
-            font_label = ImageFont.load_default()
-            font_small = ImageFont.load_default()
+        font_title = get_font('display', 20)
+        font_label = get_font('display', 14)
+        font_small = get_font('display', 11)
 
         # Title
         draw.text((20, 20), f"TIMELINE: {total_hours}H",
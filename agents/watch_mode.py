@@ -0,0 +1,152 @@
+"""
+Watch Mode
+Re-render a breakdown whenever its YAML (or the icon cache) changes.
+
+Authors iterate on a YAML file by re-running the CLI, paying interpreter
+startup, imports and a full render per edit. Watch mode keeps one warm
+process: it polls the watched files (a few stat() calls per interval;
+editors that save by rename are handled), waits until a burst of saves
+has settled (debounce), then reloads and renders again. Panels whose
+inputs did not change come from the panel cache, so an edit to one field
+redraws one panel; the CLIs also save drafts (no PNG optimization pass),
+which leaves the composite and one fast encode per edit.
+
+Usage:
+    python arkify.py examples/ai-todo-app.yaml --watch
+    python arkify-phase1.py examples/indie-saas-phase1.yaml --watch
+
+    from agents.watch_mode import watch
+
+    watch([yaml_path, 'output/.icon_cache'], lambda: pipeline.render(load_project(yaml_path)))
+"""
+
+import contextlib
+import io
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from agents.panel_cache import panel_cache
+
+
+ICON_CACHE_DIR = 'output/.icon_cache'
+
+Signature = Optional[Tuple[int, int, int]]
+
+
+def icon_cache_paths(cache_dir: str = ICON_CACHE_DIR) -> List[Path]:
+    """Paths whose changes mean new icons: the cache directory, its index and the offline bundle."""
+    paths = [Path(cache_dir), Path(cache_dir) / 'index.json']
+    if os.environ.get('ARKIFY_ICON_BUNDLE'):
+        paths.append(Path(os.environ['ARKIFY_ICON_BUNDLE']))
+    return paths
+
+
+class FileWatcher:
+    """
+    Polling change detector for a handful of files and directories.
+
+    A path's signature is (inode, size, mtime); a directory's mtime
+    changes when entries are added or removed.
+    """
+
+    def __init__(self, paths: Iterable[str], interval: float = 0.02, debounce: float = 0.05):
+        """
+        Args:
+            paths: Files or directories to watch (may not exist yet)
+            interval: Seconds between polls
+            debounce: Quiet period after the last change before reporting
+        """
+        self.paths = [Path(path) for path in paths]
+        self.interval = interval
+        self.debounce = debounce
+        self._last = self.snapshot()
+
+    def snapshot(self) -> Dict[Path, Signature]:
+        """Current signature of every watched path (None if missing)."""
+        signatures: Dict[Path, Signature] = {}
+        for path in self.paths:
+            try:
+                stat = path.stat()
+                signatures[path] = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+            except OSError:
+                signatures[path] = None
+        return signatures
+
+    def wait(self, timeout: Optional[float] = None) -> List[Path]:
+        """
+        Block until watched paths changed and then stayed quiet for debounce seconds.
+
+        Returns:
+            Changed paths (empty if timeout expired first)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        changed: List[Path] = []
+        quiet_since = None
+
+        while True:
+            current = self.snapshot()
+            new = [path for path in self.paths if current[path] != self._last[path]]
+            self._last = current
+
+            now = time.monotonic()
+            if new:
+                changed.extend(path for path in new if path not in changed)
+                quiet_since = now
+            elif changed and now - quiet_since >= self.debounce:
+                return changed
+
+            if deadline is not None and now >= deadline and not changed:
+                return []
+            time.sleep(self.interval)
+
+
+def watch(paths: Iterable[str],
+          render: Callable[[], Any],
+          interval: float = 0.02,
+          debounce: float = 0.05,
+          quiet: bool = True):
+    """
+    Render now, then again after every settled change of paths, until Ctrl-C.
+
+    A failing render (e.g. half-typed YAML) is reported and the watch goes
+    on; the next save tries again.
+
+    Args:
+        paths: Files / directories to watch
+        render: Loads the input and renders it, returning the output path
+        interval: Poll interval in seconds
+        debounce: Quiet period that ends a burst of saves
+        quiet: Hide the agents' per-render progress output
+    """
+    watcher = FileWatcher(paths, interval, debounce)
+    print(f"👀 Watching {', '.join(str(path) for path in watcher.paths)} (Ctrl-C to stop)")
+
+    try:
+        _render_once(render, [], quiet)
+        while True:
+            _render_once(render, watcher.wait(), quiet)
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+
+
+def _render_once(render: Callable[[], Any], changed: List[Path], quiet: bool):
+    before = panel_cache.stats()
+    start = time.perf_counter()
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output) if quiet else contextlib.nullcontext():
+            output_path = render()
+    except Exception as e:
+        print(output.getvalue(), end='')
+        print(f"❌ {type(e).__name__}: {e}")
+        return
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    after = panel_cache.stats()
+    redrawn = after['misses'] - before['misses']
+    reused = after['hits'] - before['hits']
+    trigger = f"{', '.join(path.name for path in changed)} changed → " if changed else ""
+    panels = f" (panels: {redrawn} redrawn, {reused} reused)" if redrawn or reused else ""
+    print(f"🔄 {trigger}{output_path} in {elapsed_ms:.0f} ms{panels}")
@@ -6,17 +6,19 @@ Phase 1: Enhanced Story with 3x3 Grid
 Generate beautiful 3x3 project breakdowns with Future Dust palette.
 
 Usage:
-    python arkify-phase1.py examples/indie-saas-phase1.yaml
+    python arkify-phase1.py examples/indie-saas-phase1.yaml [--no-cache] [--watch]
 
 Output:
     output/project-name-phase1.png (900x1200px)
 """
 
 import sys
-import yaml
 from pathlib import Path
 
-from agents.orchestrator_phase1 import OrchestratorPhase1
+from agents.batch_runner import PIPELINES, MissingFieldsError, Pipeline, field_help, load_project
+
+# Minimal required fields (same as batch / serve with --pipeline phase1)
+REQUIRED_FIELDS = PIPELINES['phase1'][2]
 
 
 def main():
@@ -24,7 +26,7 @@ def main():
 
     # Parse command line arguments
     if len(sys.argv) < 2:
-        print("Usage: python arkify-phase1.py <input.yaml>")
+        print("Usage: python arkify-phase1.py <input.yaml> [--no-cache] [--watch]")
         print("\nExamples:")
         print("  python arkify-phase1.py examples/indie-saas-phase1.yaml")
         print("  python arkify-phase1.py examples/ai-todo-app.yaml")
@@ -36,46 +38,46 @@ def main():
         sys.exit(1)
 
     input_file = Path(sys.argv[1])
+    use_cache = '--no-cache' not in sys.argv[2:]
 
     if not input_file.exists():
         print(f"Error: Input file '{input_file}' not found")
         sys.exit(1)
 
-    # Load project data
+    # Load and validate project data (same checks as batch, serve and --watch)
     print(f"📖 Loading project data from {input_file}...")
     try:
-        with open(input_file, 'r') as f:
-            project_data = yaml.safe_load(f)
-    except Exception as e:
-        print(f"❌ Error loading YAML: {e}")
-        sys.exit(1)
-
-    # Validate minimal required fields (Phase 0 compatibility)
-    required_fields = ['name', 'learning']
-    project = project_data.get('project', {})
-
-    missing_fields = [f for f in required_fields if f not in project]
-    if missing_fields:
-        print(f"❌ Missing required fields: {', '.join(missing_fields)}")
+        project_data = load_project(input_file, REQUIRED_FIELDS)
+    except MissingFieldsError as e:
+        print(f"❌ {e}")
         print("\nMinimal required fields:")
-        print("  - name: Project name")
-        print("  - learning: Key lesson learned")
+        print('\n'.join(field_help(REQUIRED_FIELDS)))
         print("\nOptional Phase 1 fields:")
         print("  - tagline: One-line description")
         print("  - results: {users, revenue, signups}")
         print("  - expectations: {timeline, cost}")
         print("  - reality: {timeline, cost, challenges}")
         sys.exit(1)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
 
     # Initialize Phase 1 orchestrator
     print("🎬 Initializing Arkify Phase 1 orchestrator...")
     print("   Using Future Dust palette (WGSN 2025 Color of the Year)")
-    orchestrator = OrchestratorPhase1()
+    watch_mode = '--watch' in sys.argv[2:]
+    pipeline = Pipeline('phase1', use_cache=use_cache, draft=watch_mode)
+
+    if watch_mode:
+        from agents.watch_mode import icon_cache_paths, watch
+        watch([input_file, *icon_cache_paths()],
+              lambda: pipeline.render(load_project(input_file, REQUIRED_FIELDS)))
+        return
 
     # Generate breakdown
     print("✨ Generating Phase 1 project breakdown...")
     try:
-        output_path = orchestrator.generate(project_data)
+        output_path = pipeline.render(project_data)
         print(f"✅ Success! Generated: {output_path}")
         print(f"\n📏 Size: 900x1200px (LinkedIn 4:5 ratio)")
         print(f"🎨 Palette: Future Dust")
@@ -4,7 +4,7 @@ Arkify Phase 2.1 Generator (Canva Style)
 Generates Phase 2.1 output with gradients, real icons, and story-driven layout.
 
 Usage:
-    python3 arkify-phase2_1.py examples/arkify-phase2_1-real.yaml
+    python3 arkify-phase2_1.py examples/arkify-phase2_1-real.yaml [--no-cache]
 
 Output:
     - output/arkify-phase2.1.png (1200x1600px)
@@ -20,15 +20,18 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from agents.layout_compositor_phase2_1 import LayoutCompositorPhase21
+from agents.batch_runner import pipeline_icon_names
+from agents.render_cache import RenderCache
 
 
-def generate_phase21(yaml_path, output_path):
+def generate_phase21(yaml_path, output_path, use_cache=True):
     """
     Generate Phase 2.1 breakdown
 
     Args:
         yaml_path: Path to YAML input file
         output_path: Path for output PNG
+        use_cache: Reuse the cached render of unchanged input
 
     Returns:
         bool: Success status
@@ -63,8 +66,16 @@ def generate_phase21(yaml_path, output_path):
     print("   [7/7] Panel 6: The Meta (∞ recursion)")
     print()
 
-    compositor = LayoutCompositorPhase21()
-    success = compositor.compose(project_data, output_path)
+    cache = RenderCache() if use_cache else None
+    if cache is not None and cache.restore(cache.key('phase2.1', data, pipeline_icon_names('phase2.1', project_data)),
+                                           Path(output_path)):
+        print("♻️  Unchanged input, reused cached render")
+        success = True
+    else:
+        compositor = LayoutCompositorPhase21()
+        success = compositor.compose(project_data, output_path)
+        if success and cache is not None:
+            cache.put(cache.key('phase2.1', data, pipeline_icon_names('phase2.1', project_data)), output_path)
 
     if success:
         file_size = os.path.getsize(output_path) / 1024  # KB
@@ -92,16 +103,17 @@ def generate_phase21(yaml_path, output_path):
 
 if __name__ == '__main__':
     if len(sys.argv) < 2:
-        print("Usage: python3 arkify-phase2_1.py examples/arkify-phase2_1-real.yaml")
+        print("Usage: python3 arkify-phase2_1.py examples/arkify-phase2_1-real.yaml [--no-cache]")
         sys.exit(1)
 
     yaml_path = sys.argv[1]
+    use_cache = '--no-cache' not in sys.argv[2:]
     output_path = 'output/arkify-phase2.1.png'
 
     # Ensure output dir exists
     os.makedirs('output', exist_ok=True)
 
-    success = generate_phase21(yaml_path, output_path)
+    success = generate_phase21(yaml_path, output_path, use_cache)
 
     if success:
         # Also save to phase-outputs
@@ -8,67 +8,251 @@ Generate beautiful 2x2 project breakdown graphics from YAML input.
 Usage:
     python arkify.py examples/ai-todo-app.yaml
 
+    # Unchanged inputs are served from output/.render_cache; force a fresh render
+    python arkify.py examples/ai-todo-app.yaml --no-cache
+
+    # Re-render on every save of the YAML (warm process, only changed panels redrawn)
+    python arkify.py examples/ai-todo-app.yaml --watch
+
+    # Batch mode: many breakdowns in one process
+    python arkify.py batch examples/ 'projects/**/*.yaml' nightly.txt
+    python arkify.py batch nightly.txt --workers 32 --pipeline phase1
+
+    # Resident render daemon (warm agents, HTTP or Unix socket)
+    python arkify.py serve --port 8765
+
+    # Import time per module for any command
+    python arkify.py --profile-startup examples/ai-todo-app.yaml
+
+    # Offline icon bundles (for render nodes without network access)
+    python arkify.py icons pack icons.zip examples/ [python react ...]
+    python arkify.py icons list icons.zip
+    python arkify.py icons unpack icons.zip [output/.icon_cache]
+    ARKIFY_ICON_BUNDLE=icons.zip python arkify.py examples/ai-todo-app.yaml
+
 Output:
     output/project-name.png
 """
 
+import os
 import sys
-import yaml
 from pathlib import Path
 
-from agents.orchestrator import MiniOrchestrator
+# Heavy modules (argparse, yaml, PIL, agents) are imported by the command that needs
+# them, so `--help` and the subcommands' argument errors return instantly.
+
+
+def icons_main(argv):
+    """`arkify.py icons ...`: pack, list and unpack offline icon bundles."""
+    import argparse
+    from agents.icon_bundle import IconBundle, collect_tech_names, pack_icon_bundle
+    from agents.icon_fetcher import IconFetcher
+
+    parser = argparse.ArgumentParser(prog='arkify.py icons',
+                                     description='Offline icon bundles')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    pack = subparsers.add_parser('pack', help='Warm the icon cache and write a bundle')
+    pack.add_argument('bundle', help='Bundle file to write (zip)')
+    pack.add_argument('sources', nargs='+',
+                      help='YAML files, directories of YAML files, or tech names / slugs')
+    pack.add_argument('--cache-dir', default='output/.icon_cache', help='Icon cache directory')
+    pack.add_argument('--timeout', type=float, default=60.0, help='Download deadline (seconds)')
+
+    show = subparsers.add_parser('list', help='List bundle contents')
+    show.add_argument('bundle', help='Bundle file')
+
+    unpack = subparsers.add_parser('unpack', help='Extract a bundle into the icon cache')
+    unpack.add_argument('bundle', help='Bundle file')
+    unpack.add_argument('cache_dir', nargs='?', default='output/.icon_cache',
+                        help='Icon cache directory (default: output/.icon_cache)')
+
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == 'pack':
+            names = collect_tech_names(args.sources)
+            if not names:
+                print("❌ No technologies found")
+                sys.exit(1)
+
+            print(f"📦 Packing {len(names)} technologies into {args.bundle}...")
+            fetcher = IconFetcher(cache_dir=args.cache_dir, batch_timeout=args.timeout)
+            summary = pack_icon_bundle(args.bundle, names, fetcher=fetcher)
+            print(f"✅ {len(summary['icons'])} icons, {summary['bytes']:,} bytes: {summary['path']}")
+            if summary['missing']:
+                print(f"   Not on SimpleIcons (fallback): {', '.join(summary['missing'])}")
+            if summary['failed']:
+                print(f"   ⚠️  Failed to download: {', '.join(summary['failed'])}")
+                sys.exit(1)
+
+        elif args.command == 'list':
+            bundle = IconBundle(args.bundle)
+            for slug in bundle.slugs():
+                print(f"  {slug}")
+            for slug in bundle.missing():
+                print(f"  {slug} (missing)")
+
+        elif args.command == 'unpack':
+            count = IconBundle(args.bundle).unpack(args.cache_dir)
+            print(f"✅ Unpacked {count} icons into {args.cache_dir}")
+
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+def batch_main(argv):
+    """`arkify.py batch ...`: render many YAML inputs in one process."""
+    import argparse
+    from agents.batch_runner import PIPELINES, BatchRunner, resolve_inputs
+
+    parser = argparse.ArgumentParser(prog='arkify.py batch',
+                                     description='Render many breakdowns in one process')
+    parser.add_argument('inputs', nargs='+',
+                        help='Directories, glob patterns, manifest files (one path per line) or YAML files')
+    parser.add_argument('--pipeline', choices=list(PIPELINES), default='phase0',
+                        help='Orchestrator / compositor to render with (default: phase0)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Render processes (default: 1 = this process; 0 = one per CPU)')
+    parser.add_argument('--quiet', action='store_true', help='Only print one line per job')
+    parser.add_argument('--fail-fast', action='store_true', help='Stop at the first failing job')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-render unchanged inputs instead of reusing cached renders')
+    args = parser.parse_args(argv)
+
+    try:
+        input_paths = resolve_inputs(args.inputs)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    print(f"🎬 Rendering {len(input_paths)} breakdowns ({args.pipeline}, {workers} worker(s))...")
+    runner = BatchRunner(pipeline=args.pipeline, quiet=args.quiet,
+                         fail_fast=args.fail_fast, workers=workers, use_cache=not args.no_cache)
+    results = runner.run(input_paths)
+    runner.print_report(results)
+
+    if not all(r.ok for r in results):
+        sys.exit(1)
+
+
+def serve_main(argv):
+    """`arkify.py serve ...`: run the resident render daemon."""
+    import argparse
+    from agents.batch_runner import PIPELINES
+    from agents.render_server import serve
+
+    parser = argparse.ArgumentParser(prog='arkify.py serve',
+                                     description='Render daemon: POST /render, GET /health')
+    parser.add_argument('--host', default='127.0.0.1', help='TCP host (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='TCP port (default: 8765)')
+    parser.add_argument('--socket', help='Listen on this Unix socket instead of TCP')
+    parser.add_argument('--workers', type=int, default=2, help='Render threads (default: 2)')
+    parser.add_argument('--queue-size', type=int, default=16,
+                        help='Waiting renders before requests get 503 (default: 16)')
+    parser.add_argument('--pipeline', choices=list(PIPELINES), default='phase0',
+                        help='Default pipeline for requests (default: phase0)')
+    parser.add_argument('--verbose', action='store_true', help='Keep agent progress output')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-render unchanged projects instead of reusing cached renders')
+    args = parser.parse_args(argv)
+
+    serve(host=args.host, port=args.port, socket_path=args.socket, workers=args.workers,
+          queue_size=args.queue_size, pipeline=args.pipeline, verbose=args.verbose,
+          use_cache=not args.no_cache)
+
+
+def print_usage():
+    """Print CLI usage."""
+    print("Usage: python arkify.py <input.yaml> [--no-cache] [--watch]")
+    print("       python arkify.py batch <dir|glob|manifest> ...")
+    print("       python arkify.py serve [--port 8765 | --socket PATH]")
+    print("       python arkify.py icons {pack,list,unpack} ...")
+    print("       python arkify.py --profile-startup <any of the above>")
+    print("\nExamples:")
+    print("  python arkify.py examples/ai-todo-app.yaml")
+    print("  python arkify.py examples/ai-todo-app.yaml --no-cache")
+    print("  python arkify.py examples/ai-todo-app.yaml --watch")
+    print("  python arkify.py examples/saas-mvp.yaml")
+    print("  python arkify.py examples/weekend-hack.yaml")
+    print("  python arkify.py batch examples/ --quiet")
+    print("  python arkify.py icons pack icons.zip examples/")
 
 
 def main():
     """Main entry point for Arkify CLI."""
 
+    # Re-run the command under `-X importtime` and report per-module import times
+    if '--profile-startup' in sys.argv[1:]:
+        from agents.startup_profile import profile_startup
+        argv = [arg for arg in sys.argv[1:] if arg != '--profile-startup']
+        sys.exit(profile_startup(sys.argv[0], argv))
+
     # Parse command line arguments
     if len(sys.argv) < 2:
-        print("Usage: python arkify.py <input.yaml>")
-        print("\nExamples:")
-        print("  python arkify.py examples/ai-todo-app.yaml")
-        print("  python arkify.py examples/saas-mvp.yaml")
-        print("  python arkify.py examples/weekend-hack.yaml")
+        print_usage()
+        sys.exit(1)
+
+    if sys.argv[1] in ('-h', '--help'):
+        print_usage()
+        return
+
+    if sys.argv[1] == 'batch':
+        batch_main(sys.argv[2:])
+        return
+
+    if sys.argv[1] == 'serve':
+        serve_main(sys.argv[2:])
+        return
+
+    if sys.argv[1] == 'icons':
+        icons_main(sys.argv[2:])
+        return
+
+    flags = {arg for arg in sys.argv[1:] if arg in ('--no-cache', '--watch')}
+    args = [arg for arg in sys.argv[1:] if arg not in flags]
+    use_cache = '--no-cache' not in flags
+    if not args:
+        print_usage()
         sys.exit(1)
 
-    input_file = Path(sys.argv[1])
+    input_file = Path(args[0])
 
     if not input_file.exists():
         print(f"Error: Input file '{input_file}' not found")
         sys.exit(1)
 
-    # Load project data
+    from agents.batch_runner import REQUIRED_FIELDS, MissingFieldsError, Pipeline, field_help, load_project
+
+    # Load and validate project data (same checks as batch, serve and --watch)
     print(f"📖 Loading project data from {input_file}...")
     try:
-        with open(input_file, 'r') as f:
-            project_data = yaml.safe_load(f)
-    except Exception as e:
-        print(f"❌ Error loading YAML: {e}")
-        sys.exit(1)
-
-    # Validate minimal required fields
-    required_fields = ['name', 'hours', 'cost', 'tech_stack', 'learning']
-    project = project_data.get('project', {})
-
-    missing_fields = [f for f in required_fields if f not in project]
-    if missing_fields:
-        print(f"❌ Missing required fields: {', '.join(missing_fields)}")
+        project_data = load_project(input_file, REQUIRED_FIELDS)
+    except MissingFieldsError as e:
+        print(f"❌ {e}")
         print("\nRequired fields in project:")
-        print("  - name: Project name")
-        print("  - hours: Total hours spent")
-        print("  - cost: Total cost in currency")
-        print("  - tech_stack: List of technologies")
-        print("  - learning: Key lesson learned")
+        print('\n'.join(field_help(REQUIRED_FIELDS)))
+        sys.exit(1)
+    except ValueError as e:
+        print(f"❌ {e}")
         sys.exit(1)
 
     # Initialize orchestrator
     print("🎬 Initializing Arkify orchestrator...")
-    orchestrator = MiniOrchestrator()
+    pipeline = Pipeline('phase0', use_cache=use_cache, draft='--watch' in flags)
+
+    if '--watch' in flags:
+        from agents.watch_mode import icon_cache_paths, watch
+        watch([input_file, *icon_cache_paths()],
+              lambda: pipeline.render(load_project(input_file, REQUIRED_FIELDS)))
+        return
 
     # Generate breakdown
     print("✨ Generating project breakdown...")
     try:
-        output_path = orchestrator.generate(project_data)
+        output_path = pipeline.render(project_data)
         print(f"✅ Success! Generated: {output_path}")
         print(f"\n📱 Share it on LinkedIn, Twitter, or your blog!")
     except Exception as e:
@@ -6,7 +6,7 @@ Canvas: 1200x1600px (Instagram 3:4 portrait ratio)
 Real data only - no mock data
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 import os
 import sys
 
@@ -15,6 +15,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'agents'))
 
 from gradient_renderer import GradientRenderer
 from shape_decorator import ShapeDecorator
+from font_registry import get_font
 
 
 class Claude47MetaInfographicV2:
@@ -454,12 +455,8 @@ class Claude47MetaInfographicV2:
         return img
 
     def _get_font(self, size):
-        """Load font with fallback"""
-        try:
-            return ImageFont.truetype('/System/Library/Fonts/SFNS.ttf', size)
-        except Exception as e:
-            print(f"Warning: Could not load SFNS.ttf (size {size}): {e}")
-            return ImageFont.load_default()
+        """Load font from the shared registry (SF Pro on macOS)"""
+        return get_font('display', size)
 
     def _hex_to_rgb(self, hex_color):
         """Convert hex to RGB tuple"""
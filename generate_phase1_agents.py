@@ -11,7 +11,6 @@ Total canvas: 900x1200px
 
 import sys
 from pathlib import Path
-from PIL import Image
 
 # Add agents directory to path
 sys.path.insert(0, str(Path.cwd()))
@@ -26,6 +25,71 @@ from agents.tech_stack_panel_agent import TechStackPanelAgent
 from agents.learning_panel_agent import LearningPanelAgent
 from agents.results_panel_agent import ResultsPanelAgent
 from agents.timeline_panel_agent import TimelinePanelAgent
+from agents.layout_engine import LayoutEngine, LayoutSpec, PanelBinding, Slot
+
+
+LAYOUT = LayoutSpec(
+    name='phase1-agents',
+    columns=(300, 300, 300),
+    rows=(400, 400, 400),
+    background='#22223B',
+    slots=(
+        # ROW 0: Header (full width)
+        Slot('header', 0, 0, col_span=3),
+        # ROW 1: Tech Stack, Learning, Timeline
+        Slot('tech_stack', 0, 1),
+        Slot('learning', 1, 1),
+        Slot('timeline', 2, 1),    # NEW!
+        # ROW 2: Expected, Reality, Results
+        Slot('expected', 0, 2),
+        Slot('reality', 1, 2),
+        Slot('results', 2, 2),
+    ),
+)
+
+
+def build_agents():
+    """Create the panel agents, keyed by their LAYOUT slot."""
+    return {
+        'header': HeaderPanelAgent(full_width=True),
+        'tech_stack': TechStackPanelAgent(),
+        'learning': LearningPanelAgent(),
+        'timeline': TimelinePanelAgent(),
+        'expected': ExpectedPanelAgent(),
+        'reality': RealityPanelAgent(),
+        'results': ResultsPanelAgent(),
+    }
+
+
+def render_panel(agent, project_data):
+    """Render one agent's panel (from the panel cache when its inputs are unchanged)."""
+    print(f'Rendering {agent.agent_id}...')
+    return agent.render_cached(project_data)
+
+
+def build_engine(agents=None) -> LayoutEngine:
+    """Layout engine drawing each slot with its panel agent."""
+    agents = agents or build_agents()
+    return LayoutEngine(LAYOUT, {
+        panel: PanelBinding(lambda data, size, agent=agent: render_panel(agent, data))
+        for panel, agent in agents.items()
+    })
+
+
+def compose(project_data, engine=None):
+    """
+    Compose the 900x1200px canvas from the panel agents.
+
+    Panels come from the panel cache keyed on each agent's declared
+    inputs, so calling this again after an edit only redraws the panels
+    whose data changed.
+    """
+    engine = engine or build_engine()
+    canvas = engine.compose(project_data)
+    for placement in LAYOUT.placements:
+        print(f'  ✅ {placement.panel} placed at pixel {placement.position} - size: {placement.size}')
+
+    return canvas
 
 
 def main():
@@ -38,57 +102,13 @@ def main():
     print('🎨 Generating Arkify Phase 1 with 7 autonomous agents...')
     print()
 
-    # Create canvas (900x1200px)
-    canvas = Image.new('RGB', (900, 1200), '#22223B')
-
-    # === ROW 0: HEADER (full width) ===
-    print('Rendering header_panel_agent (full width)...')
-    header_agent = HeaderPanelAgent(full_width=True)
-    header_panel = header_agent.render(project_data)
-    canvas.paste(header_panel, (0, 0))
-    print(f'  ✅ Header placed at (0, 0) - size: {header_panel.size}')
-    print()
-
-    # === ROW 1: Tech Stack, Learning, Timeline ===
-    panels_row1 = [
-        (TechStackPanelAgent(), 0),   # Column 0
-        (LearningPanelAgent(), 1),    # Column 1
-        (TimelinePanelAgent(), 2),    # Column 2 - NEW!
-    ]
-
-    for agent, col in panels_row1:
-        print(f'Rendering {agent.agent_id}...')
-        panel = agent.render(project_data)
-
-        x = col * 300
-        y = 400  # Row 1 starts at 400px (after header)
-
-        canvas.paste(panel, (x, y))
-        print(f'  ✅ Placed at ({col}, 1) -> pixel ({x}, {y})')
-
-    print()
-
-    # === ROW 2: Expected, Reality, Results ===
-    panels_row2 = [
-        (ExpectedPanelAgent(), 0),    # Column 0
-        (RealityPanelAgent(), 1),     # Column 1
-        (ResultsPanelAgent(), 2),     # Column 2
-    ]
-
-    for agent, col in panels_row2:
-        print(f'Rendering {agent.agent_id}...')
-        panel = agent.render(project_data)
-
-        x = col * 300
-        y = 800  # Row 2 starts at 800px
-
-        canvas.paste(panel, (x, y))
-        print(f'  ✅ Placed at ({col}, 2) -> pixel ({x}, {y})')
+    engine = build_engine()
+    canvas = compose(project_data, engine)
 
     # Save final output
     output_path = Path('output/arkify-phase1-final.png')
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    canvas.save(output_path)
+    engine.save(canvas, output_path)
 
     print()
     print('=' * 60)
@@ -4,9 +4,11 @@ Arkify Claude 4.7 Infographic Generator V3
 Retro-Futuristic Terminal Archaeology Aesthetic
 """
 
-from PIL import Image, ImageDraw, ImageFont, ImageFilter
+from PIL import Image, ImageDraw, ImageFilter
 import os
 
+from agents.font_registry import get_font as registry_font
+
 # Canvas
 WIDTH, HEIGHT = 1200, 1600
 PANEL_WIDTH = 600
@@ -24,10 +26,9 @@ FAIL_RED = "#FF0040"         # Bright error red
 SUCCESS_GREEN = "#00FF41"    # Phosphor green for success
 
 # Typography - Retro Terminal Fonts
-# Using system monospace for terminal aesthetic
-FONT_DIR = "/System/Library/Fonts/"
-FONT_MONO = os.path.join(FONT_DIR, "Monaco.dfont")  # Classic Mac terminal font
-FONT_SYSTEM = os.path.join(FONT_DIR, "Supplemental/Arial.ttf")
+# Using system monospace for terminal aesthetic (Monaco on macOS)
+FONT_MONO = 'mono'
+FONT_SYSTEM = 'arial'
 
 def add_scanlines(img, intensity=0.3):
     """Add CRT scanline effect"""
@@ -53,13 +54,8 @@ def draw_ascii_border(draw, x, y, w, h, color):
     draw.text((x, y + h - 20), "└" + "─" * int(w/12) + "┘", fill=color, font=get_font(16))
 
 def get_font(size, mono=False):
-    """Get font with fallback"""
-    try:
-        if mono:
-            return ImageFont.truetype(FONT_MONO, size)
-        return ImageFont.truetype(FONT_SYSTEM, size)
-    except:
-        return ImageFont.load_default()
+    """Get font from the shared registry"""
+    return registry_font(FONT_MONO if mono else FONT_SYSTEM, size)
 
 def draw_header(draw):
     """Draw retro terminal header"""
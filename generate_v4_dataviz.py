@@ -4,10 +4,12 @@ Arkify Claude 4.7 Infographic Generator V4
 Modern Data Visualization Aesthetic - HEAVY on graphs/charts
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 import math
 import os
 
+from agents.font_registry import get_font as registry_font
+
 # Canvas
 WIDTH, HEIGHT = 1200, 1600
 PANEL_WIDTH = 600
@@ -26,16 +28,11 @@ GRAY = "#8E8E93"              # iOS gray
 DARK_GRAY = "#48484A"
 
 # Typography
-FONT_DIR = "/System/Library/Fonts/"
-FONT_PATH = os.path.join(FONT_DIR, "Supplemental/Arial.ttf")
+FONT_FAMILY = 'arial'
 
 def get_font(size, bold=False):
-    """Get font with fallback"""
-    try:
-        font_file = os.path.join(FONT_DIR, "Supplemental/Arial Bold.ttf" if bold else "Supplemental/Arial.ttf")
-        return ImageFont.truetype(font_file, size)
-    except:
-        return ImageFont.load_default()
+    """Get font from the shared registry"""
+    return registry_font(FONT_FAMILY, size, weight='bold' if bold else 'regular')
 
 def draw_rounded_rectangle(draw, coords, radius, fill, outline=None, width=1):
     """Draw rounded rectangle"""
@@ -3,32 +3,303 @@ Git-Based KPI Extraction
 
 Extracts authentic development metrics from Git history.
 Use this for generating accurate Phase breakdowns.
+
+All history KPIs come from one streaming `git log --numstat` pass: the
+log is read line by line and folded into a HistoryStats aggregate, so a
+200k-commit repository costs one traversal and memory proportional to
+the number of distinct files and authors, not to the history length.
+
+The aggregate is persisted per repository (output/.kpi_cache), keyed by
+the commit SHAs of all ref tips. The next run only walks the commits
+added since (new tips ^old tips) and merges them in; if an old tip is no
+longer reachable (rebase, force-push, deleted branch) the snapshot is
+rebuilt from scratch.
+
+Phase KPIs cover a revision range (previous tag..phase tag, since a
+date, one branch). get_tag_series() reports every consecutive tag pair
+from a single --topo-order walk instead of one traversal per phase.
+
+Development hours are estimated from activity: each author's commits
+are clustered into sessions (a gap longer than session_gap_hours starts
+a new one) and every session counts from its first to its last commit
+plus a lead-in for the work before its first commit. Idle weeks between
+commits no longer count as development time.
 """
 
+import hashlib
+import json
+import re
 import subprocess
+import threading
+from array import array
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+# One header line per commit (record separator + unit-separated fields),
+# followed by that commit's numstat lines. %aN/%aE apply .mailmap.
+RECORD_MARK = '\x1e'
+FIELD_SEP = '\x1f'
+LOG_FORMAT = RECORD_MARK + FIELD_SEP.join(['%H', '%P', '%at', '%ai', '%aN', '%aE', '%s'])
+
+# Latest commit subjects kept for summaries
+MESSAGE_LIMIT = 10
+
+# Bump when the HistoryStats snapshot layout changes
+SNAPSHOT_VERSION = 3
+
+# Rename in numstat output: 'src/{old => new}/x.py' or 'old.py => new.py'
+BRACE_RENAME = re.compile(r'\{([^{}]*) => ([^{}]*)\}')
+
+
+class CommitHeader(NamedTuple):
+    """Fields of one LOG_FORMAT header line."""
+    sha: str
+    parents: List[str]
+    timestamp: int
+    date: str
+    author: str
+    email: str
+    subject: str
+
+
+def _parse_header(line: str) -> CommitHeader:
+    sha, parents, timestamp, date, author, email, subject = line[1:].split(FIELD_SEP, 6)
+    return CommitHeader(sha, parents.split(), int(timestamp), date, author, email, subject)
+
+
+def parse_numstat(line: str) -> Optional[Tuple[int, int, str]]:
+    """
+    Parse one numstat line.
+
+    Returns:
+        (added, removed, path) with 0 for binary files and renames
+        resolved to the destination path, or None for other lines
+    """
+    parts = line.split('\t', 2)
+    if len(parts) != 3:
+        return None
+    added, removed, path = parts
+    return (int(added) if added != '-' else 0,
+            int(removed) if removed != '-' else 0,
+            _renamed_path(path))
+
+
+@dataclass
+class HistoryStats:
+    """KPI aggregate over a set of commits (author dates as '%ai' strings)."""
+    commits: int = 0
+    authors: Dict[str, int] = field(default_factory=dict)
+    files: Set[str] = field(default_factory=set)
+    lines_added: int = 0
+    lines_removed: int = 0
+    first_timestamp: Optional[int] = None
+    first_date: Optional[str] = None
+    last_timestamp: Optional[int] = None
+    last_date: Optional[str] = None
+    messages: List[str] = field(default_factory=list)
+    timestamps: Dict[str, array] = field(default_factory=dict)  # author -> epoch seconds ('q')
+
+    def add_commit(self, timestamp: int, date: str, author: str, subject: str):
+        """Count one commit header."""
+        self.commits += 1
+        self.authors[author] = self.authors.get(author, 0) + 1
+        if author not in self.timestamps:
+            self.timestamps[author] = array('q')
+        self.timestamps[author].append(timestamp)
+        if self.first_timestamp is None or timestamp < self.first_timestamp:
+            self.first_timestamp, self.first_date = timestamp, date
+        if self.last_timestamp is None or timestamp > self.last_timestamp:
+            self.last_timestamp, self.last_date = timestamp, date
+        if len(self.messages) < MESSAGE_LIMIT and subject.strip():
+            self.messages.append(subject)
+
+    def add_numstat(self, line: str):
+        """Count one '<added>\\t<removed>\\t<path>' line ('-' for binary files)."""
+        entry = parse_numstat(line)
+        if entry is None:
+            return
+        added, removed, path = entry
+        self.lines_added += added
+        self.lines_removed += removed
+        self.files.add(path)
+
+    def add_header(self, header: CommitHeader):
+        """Count one parsed commit header."""
+        self.add_commit(header.timestamp, header.date, header.author, header.subject)
+
+    def merge(self, newer: 'HistoryStats'):
+        """
+        Fold in the stats of a disjoint, more recent set of commits.
+
+        Args:
+            newer: Stats of commits not counted in self
+        """
+        self.commits += newer.commits
+        for author, count in newer.authors.items():
+            self.authors[author] = self.authors.get(author, 0) + count
+        self.files.update(newer.files)
+        self.lines_added += newer.lines_added
+        self.lines_removed += newer.lines_removed
+        if newer.first_timestamp is not None and (
+                self.first_timestamp is None or newer.first_timestamp < self.first_timestamp):
+            self.first_timestamp, self.first_date = newer.first_timestamp, newer.first_date
+        if newer.last_timestamp is not None and (
+                self.last_timestamp is None or newer.last_timestamp > self.last_timestamp):
+            self.last_timestamp, self.last_date = newer.last_timestamp, newer.last_date
+        self.messages = (newer.messages + self.messages)[:MESSAGE_LIMIT]
+        for author, timestamps in newer.timestamps.items():
+            self.timestamps.setdefault(author, array('q')).extend(timestamps)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable snapshot."""
+        return {
+            'commits': self.commits,
+            'authors': self.authors,
+            'files': sorted(self.files),
+            'lines_added': self.lines_added,
+            'lines_removed': self.lines_removed,
+            'first_timestamp': self.first_timestamp,
+            'first_date': self.first_date,
+            'last_timestamp': self.last_timestamp,
+            'last_date': self.last_date,
+            'messages': self.messages,
+            'timestamps': {author: ts.tolist() for author, ts in self.timestamps.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'HistoryStats':
+        """Inverse of to_dict()."""
+        return cls(**dict(data,
+                          files=set(data['files']),
+                          timestamps={author: array('q', ts) for author, ts in data['timestamps'].items()}))
+
+    @property
+    def first_commit_time(self) -> datetime:
+        """Author date of the oldest commit."""
+        if self.first_date is None:
+            raise RuntimeError("No commits in history")
+        return datetime.fromisoformat(self.first_date)
+
+    @property
+    def last_commit_time(self) -> datetime:
+        """Author date of the newest commit."""
+        if self.last_date is None:
+            raise RuntimeError("No commits in history")
+        return datetime.fromisoformat(self.last_date)
+
+
+class SessionEstimate(NamedTuple):
+    """Activity-based development time."""
+    hours: float
+    sessions: int
+
+
+def estimate_session_hours(timestamps: Dict[str, Sequence[int]],
+                           gap_hours: float = 2.0,
+                           lead_in_hours: float = 0.5) -> SessionEstimate:
+    """
+    Estimate development hours by clustering commits into work sessions.
+
+    Args:
+        timestamps: Commit times (epoch seconds) per author, any order
+        gap_hours: A longer pause between an author's commits ends a session
+        lead_in_hours: Time credited before each session's first commit
+
+    Returns:
+        SessionEstimate (hours summed over authors, number of sessions)
+    """
+    gap = gap_hours * 3600
+    series = [ts for ts in timestamps.values() if len(ts)]
+    if not series:
+        return SessionEstimate(0.0, 0)
+
+    if HAS_NUMPY:
+        # All authors in one array: sorted per author, concatenated; the
+        # step from one author's block to the next always opens a session
+        times = np.concatenate([np.sort(np.asarray(ts, dtype=np.int64)) for ts in series])
+        steps = np.diff(times)
+        new_session = steps > gap
+        boundaries = np.cumsum([len(ts) for ts in series])[:-1] - 1
+        new_session[boundaries] = True
+        sessions = int(np.count_nonzero(new_session)) + 1
+        active = int(steps[~new_session].sum())
+    else:
+        sessions, active = 0, 0
+        for ts in series:
+            ordered = sorted(ts)
+            sessions += 1
+            for previous, current in zip(ordered, ordered[1:]):
+                if current - previous > gap:
+                    sessions += 1
+                else:
+                    active += current - previous
+
+    return SessionEstimate((active + sessions * lead_in_hours * 3600) / 3600, sessions)
+
+
+def _renamed_path(path: str) -> str:
+    """Destination path of a numstat entry (renames are shown as old => new)."""
+    if ' => ' not in path:
+        return path
+    if BRACE_RENAME.search(path):
+        return BRACE_RENAME.sub(r'\2', path, count=1).replace('//', '/')
+    return path.split(' => ', 1)[1]
 
 
 class GitKPIExtractor:
     """Extract development KPIs from Git repository history."""
 
-    def __init__(self, repo_path: Optional[Path] = None):
+    def __init__(self,
+                 repo_path: Optional[Path] = None,
+                 cache_dir: Optional[str] = 'output/.kpi_cache',
+                 session_gap_hours: float = 2.0,
+                 session_lead_in_hours: float = 0.5,
+                 timeout: Optional[float] = None):
         """
         Initialize Git KPI extractor.
 
         Args:
             repo_path: Path to git repository (defaults to current directory)
+            cache_dir: Directory for persisted history snapshots (None disables)
+            session_gap_hours: Pause between commits that ends a work session
+            session_lead_in_hours: Work credited before each session's first commit
+            timeout: Seconds before a git command is killed (None waits forever)
         """
         self.repo_path = repo_path or Path.cwd()
-
-    def _run_git_command(self, cmd: List[str]) -> str:
+        self.timeout = timeout
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.session_gap_hours = session_gap_hours
+        self.session_lead_in_hours = session_lead_in_hours
+        self._stats: Optional[HistoryStats] = None
+
+        # How the last history_stats() was obtained: 'cached', 'incremental' or 'full'
+        self.stats_source: Optional[str] = None
+
+    @property
+    def cache_path(self) -> Optional[Path]:
+        """Snapshot file of this repository (None if caching is disabled)."""
+        if self.cache_dir is None:
+            return None
+        resolved = Path(self.repo_path).resolve()
+        digest = hashlib.sha1(str(resolved).encode('utf-8')).hexdigest()[:12]
+        return self.cache_dir / f"{resolved.name}-{digest}.json"
+
+    def _run_git_command(self, cmd: List[str], stdin: Optional[str] = None) -> str:
         """
         Run git command and return output.
 
         Args:
             cmd: Git command as list of arguments
+            stdin: Text passed on standard input (e.g. for --stdin)
 
         Returns:
             Command output as string
@@ -40,13 +311,234 @@ class GitKPIExtractor:
             result = subprocess.run(
                 ['git'] + cmd,
                 cwd=self.repo_path,
+                input=stdin,
                 capture_output=True,
                 text=True,
-                check=True
+                check=True,
+                timeout=self.timeout
             )
             return result.stdout.strip()
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Git command failed: {e.stderr}") from e
+        except subprocess.TimeoutExpired as e:
+            raise RuntimeError(f"Git command timed out after {self.timeout}s: git {cmd[0]}") from e
+
+    def _stream_git_command(self, cmd: List[str], stdin: Optional[str] = None) -> Iterator[str]:
+        """
+        Run git command and yield its output line by line.
+
+        Args:
+            cmd: Git command as list of arguments
+            stdin: Text passed on standard input (e.g. for --stdin)
+
+        Yields:
+            Output lines without trailing newline
+
+        Raises:
+            RuntimeError: If git command fails or times out
+        """
+        process = subprocess.Popen(
+            ['git'] + cmd,
+            cwd=self.repo_path,
+            stdin=subprocess.PIPE if stdin is not None else subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            errors='replace'
+        )
+        # Collect stderr concurrently so a chatty git can't block on a full pipe
+        stderr_chunks: List[str] = []
+        stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(process.stderr.read()),
+                                         daemon=True)
+        stderr_reader.start()
+        timed_out = threading.Event()
+        killer = threading.Timer(self.timeout, lambda: (timed_out.set(), process.kill())) if self.timeout else None
+        if killer:
+            killer.start()
+        if stdin is not None:
+            # git reads all revisions from --stdin before it starts writing
+            process.stdin.write(stdin)
+            process.stdin.close()
+        try:
+            for line in process.stdout:
+                yield line.rstrip('\n')
+        finally:
+            process.stdout.close()
+            returncode = process.wait()
+            if killer:
+                killer.cancel()
+            stderr_reader.join()
+            process.stderr.close()
+        if timed_out.is_set():
+            raise RuntimeError(f"Git command timed out after {self.timeout}s: git {cmd[0]}")
+        if returncode != 0:
+            raise RuntimeError(f"Git command failed: {''.join(stderr_chunks)}")
+
+    def _stream_log(self,
+                    revisions: Optional[List[str]] = None,
+                    options: Optional[List[str]] = None) -> Iterator[str]:
+        """
+        Stream `git log --numstat` in LOG_FORMAT.
+
+        Args:
+            revisions: Revisions, e.g. ['v0.2', '^v0.1'] (default: --all).
+                       Pseudo-options such as --all or --branches are kept
+                       on the command line, everything else goes through
+                       --stdin (repos with thousands of refs overflow argv)
+            options: Extra git log options (e.g. ['--since=2025-01-01'])
+
+        Yields:
+            Output lines
+        """
+        if revisions is None:
+            revisions = ['--all']
+        flags = [r for r in revisions if r.startswith('--')]
+        revs = [r for r in revisions if not r.startswith('--')]
+        if not flags and not revs:
+            return
+
+        cmd = ['log', f'--pretty=tformat:{LOG_FORMAT}', '--numstat'] + (options or []) + flags
+        if revs:
+            yield from self._stream_git_command(cmd + ['--stdin'], stdin='\n'.join(revs) + '\n')
+        else:
+            yield from self._stream_git_command(cmd)
+
+    def collect_stats(self,
+                      revisions: Optional[List[str]] = None,
+                      since: Optional[str] = None) -> HistoryStats:
+        """
+        Compute history KPIs in one streaming `git log --numstat` pass.
+
+        Args:
+            revisions: Revisions for git log, e.g. ['v0.2', '^v0.1'] (default: --all)
+            since: Only commits after this date (any git date, e.g. '2025-01-01', '2 weeks ago')
+
+        Returns:
+            HistoryStats over the selected commits
+        """
+        stats = HistoryStats()
+        options = [f'--since={since}'] if since else []
+
+        for header, numstat in self.iter_commits(revisions, options):
+            stats.add_header(header)
+            for line in numstat:
+                stats.add_numstat(line)
+
+        return stats
+
+    def iter_commits(self,
+                     revisions: Optional[List[str]] = None,
+                     options: Optional[List[str]] = None) -> Iterator[Tuple[CommitHeader, List[str]]]:
+        """
+        Stream commits with their numstat lines (one git log pass).
+
+        Args:
+            revisions: Revisions for git log (default: --all)
+            options: Extra git log options (e.g. ['--topo-order'])
+
+        Yields:
+            (CommitHeader, numstat lines) per commit, in git log order
+        """
+        header: Optional[CommitHeader] = None
+        numstat: List[str] = []
+        for line in self._stream_log(revisions, options):
+            if line.startswith(RECORD_MARK):
+                if header is not None:
+                    yield header, numstat
+                header, numstat = _parse_header(line), []
+            elif line:
+                numstat.append(line)
+        if header is not None:
+            yield header, numstat
+
+    def history_stats(self, refresh: bool = False) -> HistoryStats:
+        """
+        History KPIs of all refs (computed once per extractor).
+
+        With a cache directory, the persisted snapshot is reused when the
+        ref tips are unchanged and extended with only the new commits
+        otherwise.
+
+        Args:
+            refresh: Re-check the repository instead of using the previous result
+
+        Returns:
+            HistoryStats over `--all`
+        """
+        if self._stats is None or refresh:
+            self._stats = self._update_stats()
+        return self._stats
+
+    def get_tips(self) -> List[str]:
+        """
+        Commit SHAs of all refs and HEAD (annotated tags peeled).
+
+        Returns:
+            Sorted unique SHAs (empty for a repository without commits)
+        """
+        output = self._run_git_command(['log', '--all', '--no-walk', '--pretty=format:%H'])
+        return sorted(set(output.split())) if output else []
+
+    def _update_stats(self) -> HistoryStats:
+        if self.cache_path is None:
+            self.stats_source = 'full'
+            return self.collect_stats()
+
+        tips = self.get_tips()
+        snapshot = self._read_snapshot()
+
+        if snapshot is not None and snapshot['tips'] == tips:
+            self.stats_source = 'cached'
+            return HistoryStats.from_dict(snapshot['stats'])
+
+        if snapshot is not None and self._tips_reachable(snapshot['tips']):
+            stats = HistoryStats.from_dict(snapshot['stats'])
+            stats.merge(self.collect_stats(tips + [f'^{sha}' for sha in snapshot['tips']]))
+            self.stats_source = 'incremental'
+        else:
+            stats = self.collect_stats()
+            self.stats_source = 'full'
+
+        self._write_snapshot(tips, stats)
+        return stats
+
+    def _tips_reachable(self, old_tips: List[str]) -> bool:
+        """Whether every previously counted commit is still in --all (no rewrite)."""
+        if not old_tips:
+            return True
+        try:
+            output = self._run_git_command(['rev-list', '--max-count=1', '--stdin', '--not', '--all'],
+                                           stdin='\n'.join(old_tips) + '\n')
+        except RuntimeError:
+            # Old tip objects were garbage-collected
+            return False
+        return not output
+
+    def _read_snapshot(self) -> Optional[Dict[str, Any]]:
+        try:
+            data = json.loads(self.cache_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get('version') != SNAPSHOT_VERSION:
+            return None
+        return data
+
+    def _write_snapshot(self, tips: List[str], stats: HistoryStats):
+        """Persist the snapshot (atomic replace)."""
+        path = self.cache_path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps({
+                'version': SNAPSHOT_VERSION,
+                'repo_path': str(Path(self.repo_path).resolve()),
+                'tips': tips,
+                'stats': stats.to_dict(),
+            }))
+            tmp_path.replace(path)
+        except OSError as e:
+            print(f"    ⚠️  Could not write KPI cache: {e}")
 
     def get_first_commit_time(self) -> datetime:
         """
@@ -55,10 +547,7 @@ class GitKPIExtractor:
         Returns:
             Datetime of first commit
         """
-        timestamp_str = self._run_git_command([
-            'log', '--all', '--pretty=format:%ai', '--reverse'
-        ]).split('\n')[0]
-        return datetime.fromisoformat(timestamp_str)
+        return self.history_stats().first_commit_time
 
     def get_latest_commit_time(self) -> datetime:
         """
@@ -67,10 +556,7 @@ class GitKPIExtractor:
         Returns:
             Datetime of latest commit
         """
-        timestamp_str = self._run_git_command([
-            'log', '--all', '--pretty=format:%ai', '-1'
-        ])
-        return datetime.fromisoformat(timestamp_str)
+        return self.history_stats().last_commit_time
 
     def get_total_commits(self) -> int:
         """
@@ -79,8 +565,7 @@ class GitKPIExtractor:
         Returns:
             Total commit count
         """
-        output = self._run_git_command(['rev-list', '--all', '--count'])
-        return int(output)
+        return self.history_stats().commits
 
     def get_commits_by_author(self) -> Dict[str, int]:
         """
@@ -89,13 +574,7 @@ class GitKPIExtractor:
         Returns:
             Dict mapping author name to commit count
         """
-        output = self._run_git_command([
-            'log', '--all', '--pretty=format:%an'
-        ])
-        authors: Dict[str, int] = {}
-        for author in output.split('\n'):
-            authors[author] = authors.get(author, 0) + 1
-        return authors
+        return dict(self.history_stats().authors)
 
     def get_files_changed(self) -> int:
         """
@@ -104,11 +583,7 @@ class GitKPIExtractor:
         Returns:
             Total files changed count
         """
-        output = self._run_git_command([
-            'log', '--all', '--pretty=format:', '--name-only'
-        ])
-        unique_files = set(f for f in output.split('\n') if f.strip())
-        return len(unique_files)
+        return len(self.history_stats().files)
 
     def get_lines_added_removed(self) -> Dict[str, int]:
         """
@@ -117,25 +592,8 @@ class GitKPIExtractor:
         Returns:
             Dict with 'added' and 'removed' line counts
         """
-        output = self._run_git_command([
-            'log', '--all', '--pretty=tformat:', '--numstat'
-        ])
-
-        added = 0
-        removed = 0
-
-        for line in output.split('\n'):
-            if not line.strip():
-                continue
-            parts = line.split('\t')
-            if len(parts) >= 2:
-                try:
-                    added += int(parts[0]) if parts[0] != '-' else 0
-                    removed += int(parts[1]) if parts[1] != '-' else 0
-                except ValueError:
-                    continue
-
-        return {'added': added, 'removed': removed}
+        stats = self.history_stats()
+        return {'added': stats.lines_added, 'removed': stats.lines_removed}
 
     def get_commit_messages(self, limit: Optional[int] = None) -> List[str]:
         """
@@ -147,6 +605,9 @@ class GitKPIExtractor:
         Returns:
             List of commit messages
         """
+        if limit and limit <= MESSAGE_LIMIT:
+            return self.history_stats().messages[:limit]
+
         cmd = ['log', '--all', '--pretty=format:%s']
         if limit:
             cmd.append(f'-{limit}')
@@ -164,68 +625,199 @@ class GitKPIExtractor:
         Returns:
             Total hours between first and last commit
         """
-        first = self.get_first_commit_time()
-        latest = self.get_latest_commit_time()
-        duration = latest - first
-        return duration.total_seconds() / 3600
+        return _span_hours(self.history_stats())
 
-    def get_phase_kpis(self, phase_tag: Optional[str] = None) -> Dict[str, Any]:
+    def estimate_active_hours(self) -> SessionEstimate:
+        """
+        Estimate development hours from commit sessions (all refs).
+
+        Returns:
+            SessionEstimate with hours and session count
+        """
+        return self._estimate_sessions(self.history_stats())
+
+    def _estimate_sessions(self, stats: HistoryStats) -> SessionEstimate:
+        return estimate_session_hours(stats.timestamps, self.session_gap_hours, self.session_lead_in_hours)
+
+    def get_previous_tag(self, tag: str) -> Optional[str]:
+        """
+        Nearest tag reachable from tag's parents (the previous phase).
+
+        Returns:
+            Tag name, or None if tag starts the history
+        """
+        try:
+            return self._run_git_command(['describe', '--tags', '--abbrev=0', f'{tag}^']) or None
+        except RuntimeError:
+            return None
+
+    def get_phase_kpis(self,
+                       phase_tag: Optional[str] = None,
+                       since_tag: Optional[str] = None,
+                       since: Optional[str] = None,
+                       branch: Optional[str] = None) -> Dict[str, Any]:
         """
         Extract comprehensive KPIs for a development phase.
 
         Args:
-            phase_tag: Git tag marking phase completion (e.g., 'v0.0.1')
-                      If None, uses all commits
+            phase_tag: Git tag marking phase completion (e.g., 'v0.0.1').
+                      The phase starts after the previous tag (see since_tag).
+                      If None (and no other range is given), uses all commits
+            since_tag: Start of the range (exclusive); defaults to the tag
+                      preceding phase_tag
+            since: Only commits after this date (e.g. '2025-01-01', '2 weeks ago')
+            branch: Branch (or any revision) to report instead of all refs
 
         Returns:
             Dict with all phase KPIs
         """
-        first_commit = self.get_first_commit_time()
-        latest_commit = self.get_latest_commit_time()
-        total_hours = self.calculate_development_hours()
+        if phase_tag and since_tag is None:
+            since_tag = self.get_previous_tag(phase_tag)
+
+        if phase_tag or since_tag or since or branch:
+            revisions = [phase_tag or branch or '--all']
+            if since_tag:
+                revisions.append(f'^{since_tag}')
+            stats = self.collect_stats(revisions, since=since)
+            source = 'range'
+        else:
+            stats = self.history_stats()
+            source = self.stats_source
+
+        return self._format_kpis(stats, {
+            'phase_tag': phase_tag,
+            'since_tag': since_tag,
+            'since': since,
+            'branch': branch,
+            'stats_source': source,
+        })
+
+    def get_tag_series(self,
+                       tags: Optional[List[str]] = None,
+                       include_head: bool = False) -> List[Dict[str, Any]]:
+        """
+        KPIs for every consecutive tag pair from one history walk.
 
-        lines = self.get_lines_added_removed()
-        total_lines = lines['added'] - lines['removed']
+        Each commit is attributed to the first tag (in series order) that
+        contains it, so phases partition the history: Phase i holds the
+        commits of tags[i] that no earlier tag contains (tags[i-1]..tags[i]
+        for a linear series).
 
-        return {
-            'development': {
+        Args:
+            tags: Phase tags in order (default: all tags by creation date)
+            include_head: Append a 'HEAD' phase with commits after the last tag
+
+        Returns:
+            One get_phase_kpis()-style dict per phase
+        """
+        names = self.get_tags() if tags is None else list(tags)
+        if include_head:
+            names.append('HEAD')
+        if not names:
+            return []
+
+        shas = self._run_git_command(['rev-parse'] + [f'{name}^{{commit}}' for name in names]).split()
+        series = [HistoryStats() for _ in names]
+        unassigned = len(names)
+
+        # Tagged commits open their phase (the first tag wins on shared commits)
+        phase_of: Dict[str, int] = {}
+        for i, sha in enumerate(shas):
+            phase_of.setdefault(sha, i)
+
+        # --topo-order shows every commit after all of its children, so a
+        # commit's phase (earliest phase of any descendant tag) is known by
+        # the time it is read; `pending` only holds the walk's frontier
+        pending: Dict[str, int] = {}
+        for header, numstat in self.iter_commits(shas, ['--topo-order']):
+            phase = min(pending.pop(header.sha, unassigned), phase_of.get(header.sha, unassigned))
+            for parent in header.parents:
+                if phase < pending.get(parent, unassigned):
+                    pending[parent] = phase
+            series[phase].add_header(header)
+            for line in numstat:
+                series[phase].add_numstat(line)
+
+        results = []
+        for i, (name, stats) in enumerate(zip(names, series)):
+            results.append(self._format_kpis(stats, {
+                'phase_tag': name,
+                'since_tag': names[i - 1] if i else None,
+                'since': None,
+                'branch': None,
+                'stats_source': 'series',
+            }))
+        return results
+
+    def get_tags(self) -> List[str]:
+        """Tag names, oldest first (tagger date, or commit date for lightweight tags)."""
+        output = self._run_git_command(['for-each-ref', '--sort=creatordate',
+                                        '--format=%(refname:short)', 'refs/tags'])
+        return output.split('\n') if output else []
+
+    def _format_kpis(self, stats: HistoryStats, range_meta: Dict[str, Any]) -> Dict[str, Any]:
+        """KPI document for one HistoryStats (empty ranges report no dates)."""
+        if stats.commits:
+            first_commit = stats.first_commit_time
+            latest_commit = stats.last_commit_time
+            activity = self._estimate_sessions(stats)
+            development = {
                 'start_date': first_commit.strftime('%Y-%m-%d'),
                 'end_date': latest_commit.strftime('%Y-%m-%d'),
                 'start_time': first_commit.strftime('%H:%M'),
                 'end_time': latest_commit.strftime('%H:%M'),
-                'total_hours': round(total_hours, 1),
+                'total_hours': round(_span_hours(stats), 1),
                 'duration_days': (latest_commit - first_commit).days,
-            },
+                'active_hours': round(activity.hours, 1),
+                'sessions': activity.sessions,
+            }
+        else:
+            development = {
+                'start_date': None,
+                'end_date': None,
+                'start_time': None,
+                'end_time': None,
+                'total_hours': 0.0,
+                'duration_days': 0,
+                'active_hours': 0.0,
+                'sessions': 0,
+            }
+
+        return {
+            'development': development,
             'commits': {
-                'total': self.get_total_commits(),
-                'by_author': self.get_commits_by_author(),
-                'messages': self.get_commit_messages(limit=10),
+                'total': stats.commits,
+                'by_author': dict(stats.authors),
+                'messages': list(stats.messages),
             },
             'code': {
-                'files_changed': self.get_files_changed(),
-                'lines_added': lines['added'],
-                'lines_removed': lines['removed'],
-                'net_lines': total_lines,
+                'files_changed': len(stats.files),
+                'lines_added': stats.lines_added,
+                'lines_removed': stats.lines_removed,
+                'net_lines': stats.lines_added - stats.lines_removed,
             },
-            'meta': {
+            'meta': dict({
                 'extracted_at': datetime.now().isoformat(),
                 'repo_path': str(self.repo_path),
-                'phase_tag': phase_tag,
-            }
+            }, **range_meta)
         }
 
-    def generate_phase_summary(self) -> str:
+    def generate_phase_summary(self, phase_tag: Optional[str] = None) -> str:
         """
         Generate human-readable phase summary.
 
+        Args:
+            phase_tag: Git tag marking phase completion (None for all commits)
+
         Returns:
             Formatted summary string
         """
-        kpis = self.get_phase_kpis()
+        kpis = self.get_phase_kpis(phase_tag)
         dev = kpis['development']
         commits = kpis['commits']
         code = kpis['code']
 
+        recent = ''.join(f"   - {msg}\n" for msg in commits['messages'][:5])
         summary = f"""
 Phase Development Summary
 =========================
@@ -234,6 +826,7 @@ Phase Development Summary
    Start: {dev['start_date']} at {dev['start_time']}
    End:   {dev['end_date']} at {dev['end_time']}
    Duration: {dev['total_hours']} hours ({dev['duration_days']} days)
+   Active:   {dev['active_hours']} hours in {dev['sessions']} sessions
 
 💻 Commits:
    Total commits: {commits['total']}
@@ -246,29 +839,48 @@ Phase Development Summary
    Net lines: {code['net_lines']:,}
 
 Recent Commits:
-{''.join(f"   - {msg}\n" for msg in commits['messages'][:5])}
+{recent}
 """
         return summary.strip()
 
 
-def extract_kpis_for_yaml(repo_path: Optional[Path] = None) -> Dict[str, Any]:
+def _span_hours(stats: HistoryStats) -> float:
+    """Hours between the first and last commit of stats."""
+    if not stats.commits:
+        return 0.0
+    return (stats.last_commit_time - stats.first_commit_time).total_seconds() / 3600
+
+
+def extract_kpis_for_yaml(repo_path: Optional[Path] = None,
+                          cache_dir: Optional[str] = 'output/.kpi_cache',
+                          session_gap_hours: float = 2.0,
+                          session_lead_in_hours: float = 0.5) -> Dict[str, Any]:
     """
     Extract KPIs formatted for Arkify YAML input.
 
+    total_hours is the session-based estimate (see estimate_session_hours),
+    not the first-to-last commit span.
+
     Args:
         repo_path: Path to git repository
+        cache_dir: Directory for persisted history snapshots (None disables)
+        session_gap_hours: Pause between commits that ends a work session
+        session_lead_in_hours: Work credited before each session's first commit
 
     Returns:
         Dict suitable for project YAML extended fields
     """
-    extractor = GitKPIExtractor(repo_path)
+    extractor = GitKPIExtractor(repo_path, cache_dir=cache_dir,
+                                session_gap_hours=session_gap_hours,
+                                session_lead_in_hours=session_lead_in_hours)
     kpis = extractor.get_phase_kpis()
 
     return {
         'timeline': {
             'start_date': kpis['development']['start_date'],
             'end_date': kpis['development']['end_date'],
-            'total_hours': kpis['development']['total_hours'],
+            'total_hours': kpis['development']['active_hours'],
+            'sessions': kpis['development']['sessions'],
             'duration_days': kpis['development']['duration_days'],
         },
         'git_stats': {
@@ -278,7 +890,7 @@ def extract_kpis_for_yaml(repo_path: Optional[Path] = None) -> Dict[str, Any]:
         },
         'reality_check': {
             'commits_per_hour': round(
-                kpis['commits']['total'] / max(kpis['development']['total_hours'], 0.1),
+                kpis['commits']['total'] / max(kpis['development']['active_hours'], 0.1),
                 1
             ),
             'lines_per_commit': round(
@@ -294,5 +906,4 @@ if __name__ == '__main__':
     extractor = GitKPIExtractor()
     print(extractor.generate_phase_summary())
     print("\n\nYAML-Ready KPIs:")
-    import json
     print(json.dumps(extract_kpis_for_yaml(), indent=2))
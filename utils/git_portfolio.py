@@ -0,0 +1,324 @@
+"""
+Git Portfolio KPIs
+
+Combined development metrics over many repositories.
+
+Each repository is read by one streaming `git log --numstat` pass in a
+worker process (per-command timeout, failures reported per repo). The
+workers return compact per-commit columns, and the aggregator merges
+them into one KPI document:
+
+- Commits are de-duplicated by SHA, so forks, mirrors and repos sharing
+  history count every commit once (the first repo listed owns it).
+- Author identities use .mailmap (%aN/%aE) and are then merged across
+  repos: names and emails seen together belong to one person, shown
+  under their most frequent name.
+- Vendored paths (vendor/, third_party/, node_modules/, ...) are left
+  out of line and file counts.
+- Files are counted per history family (repos sharing a root commit),
+  so a fork's files are not counted twice.
+
+Usage:
+    from utils.git_portfolio import extract_portfolio_kpis
+
+    kpis = extract_portfolio_kpis(['~/src/api', '~/src/web'], workers=8)
+    project['extended']['git_stats'] = kpis['git_stats']
+
+    python3 -m utils.git_portfolio ~/src/api ~/src/web
+"""
+
+import fnmatch
+import os
+import time
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from utils.git_kpis import GitKPIExtractor, estimate_session_hours, parse_numstat
+
+
+# Paths excluded from line and file counts (fnmatch, '*' spans directories)
+VENDORED_PATTERNS = (
+    'vendor/*', '*/vendor/*',
+    'vendors/*', '*/vendors/*',
+    'third_party/*', '*/third_party/*',
+    'third-party/*', '*/third-party/*',
+    'node_modules/*', '*/node_modules/*',
+    'bower_components/*', '*/bower_components/*',
+)
+
+SHA_BYTES = 20
+
+
+def is_vendored(path: str, patterns: Sequence[str] = VENDORED_PATTERNS) -> bool:
+    """Whether a repository path matches one of the vendored patterns."""
+    return any(fnmatch.fnmatchcase(path, pattern) for pattern in patterns)
+
+
+@dataclass
+class RepoHistory:
+    """One repository's commits as compact columns (picklable worker result)."""
+    repo_path: str
+    seconds: float = 0.0
+    error: Optional[str] = None
+    shas: bytearray = field(default_factory=bytearray)        # 20 bytes per commit
+    timestamps: array = field(default_factory=lambda: array('q'))
+    added: array = field(default_factory=lambda: array('q'))
+    removed: array = field(default_factory=lambda: array('q'))
+    identity_ids: array = field(default_factory=lambda: array('l'))
+    identities: List[Tuple[str, str]] = field(default_factory=list)  # (name, email)
+    files: Set[str] = field(default_factory=set)
+    roots: Set[str] = field(default_factory=set)
+    first: Optional[Tuple[int, str]] = None   # (timestamp, '%ai' date)
+    last: Optional[Tuple[int, str]] = None
+
+    @property
+    def commits(self) -> int:
+        return len(self.timestamps)
+
+
+def collect_repo_history(repo_path: str,
+                         exclude: Sequence[str] = VENDORED_PATTERNS,
+                         timeout: Optional[float] = None) -> RepoHistory:
+    """
+    Read one repository (all refs) into a RepoHistory.
+
+    Errors are captured in RepoHistory.error instead of raised, so one
+    broken repository does not stop a portfolio run.
+    """
+    start = time.perf_counter()
+    history = RepoHistory(repo_path)
+    identity_index: Dict[Tuple[str, str], int] = {}
+
+    try:
+        extractor = GitKPIExtractor(Path(repo_path).expanduser(), cache_dir=None, timeout=timeout)
+        for header, numstat in extractor.iter_commits():
+            added = removed = 0
+            for line in numstat:
+                entry = parse_numstat(line)
+                if entry is None or is_vendored(entry[2], exclude):
+                    continue
+                added += entry[0]
+                removed += entry[1]
+                history.files.add(entry[2])
+
+            identity = (header.author, header.email)
+            if identity not in identity_index:
+                identity_index[identity] = len(history.identities)
+                history.identities.append(identity)
+
+            history.shas += bytes.fromhex(header.sha)
+            history.timestamps.append(header.timestamp)
+            history.added.append(added)
+            history.removed.append(removed)
+            history.identity_ids.append(identity_index[identity])
+            if not header.parents:
+                history.roots.add(header.sha)
+            if history.first is None or header.timestamp < history.first[0]:
+                history.first = (header.timestamp, header.date)
+            if history.last is None or header.timestamp > history.last[0]:
+                history.last = (header.timestamp, header.date)
+    except Exception as e:
+        history = RepoHistory(repo_path, error=f"{type(e).__name__}: {e}")
+
+    history.seconds = time.perf_counter() - start
+    return history
+
+
+class _UnionFind:
+    def __init__(self):
+        self.parent: Dict[Any, Any] = {}
+
+    def find(self, item: Any) -> Any:
+        self.parent.setdefault(item, item)
+        while self.parent[item] != item:
+            self.parent[item] = self.parent[self.parent[item]]
+            item = self.parent[item]
+        return item
+
+    def union(self, a: Any, b: Any):
+        self.parent[self.find(a)] = self.find(b)
+
+
+class PortfolioAggregator:
+    """
+    Extract and merge KPIs of many repositories.
+
+    Repositories are read in parallel worker processes; merging happens in
+    the calling process in input order.
+    """
+
+    def __init__(self,
+                 workers: Optional[int] = None,
+                 timeout: Optional[float] = 300.0,
+                 exclude: Sequence[str] = VENDORED_PATTERNS,
+                 session_gap_hours: float = 2.0,
+                 session_lead_in_hours: float = 0.5):
+        """
+        Args:
+            workers: Worker processes (default: CPU count; 1 = in this process)
+            timeout: Seconds before a repository's git command is killed
+            exclude: Vendored path patterns left out of line/file counts
+            session_gap_hours: Pause between commits that ends a work session
+            session_lead_in_hours: Work credited before each session's first commit
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.exclude = tuple(exclude)
+        self.session_gap_hours = session_gap_hours
+        self.session_lead_in_hours = session_lead_in_hours
+
+    def collect(self, repo_paths: Iterable[str]) -> List[RepoHistory]:
+        """
+        Read every repository.
+
+        Returns:
+            RepoHistory per repository, in input order
+        """
+        repo_paths = [str(path) for path in repo_paths]
+        workers = min(self.workers, len(repo_paths))
+        if workers <= 1:
+            return [collect_repo_history(path, self.exclude, self.timeout) for path in repo_paths]
+
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(collect_repo_history, path, self.exclude, self.timeout)
+                       for path in repo_paths]
+            histories = []
+            for path, future in zip(repo_paths, futures):
+                try:
+                    histories.append(future.result())
+                except Exception as e:
+                    histories.append(RepoHistory(path, error=f"{type(e).__name__}: {e}"))
+            return histories
+
+    def aggregate(self, histories: List[RepoHistory]) -> Dict[str, Any]:
+        """
+        Merge repository histories into one KPI document.
+
+        Returns:
+            Dict shaped like extract_kpis_for_yaml() (timeline, git_stats,
+            reality_check) plus authors and a per-repository report
+        """
+        ok = [h for h in histories if h.error is None]
+
+        # Identities: names and emails seen together are one person
+        people = _UnionFind()
+        for history in ok:
+            for name, email in history.identities:
+                people.find(('name', name.casefold()))
+                if email:
+                    people.union(('name', name.casefold()), ('email', email.casefold()))
+
+        # History families: repos sharing a root commit
+        families = _UnionFind()
+        for i, history in enumerate(ok):
+            families.find(i)
+            for root in history.roots:
+                families.union(i, ('root', root))
+
+        seen: Set[bytes] = set()
+        commits = added = removed = 0
+        name_counts: Dict[Any, Dict[str, int]] = {}
+        timestamps: Dict[Any, array] = {}
+        family_files: Dict[Any, Set[str]] = {}
+        report = []
+
+        for i, history in enumerate(ok):
+            person_of = [people.find(('name', name.casefold())) for name, _ in history.identities]
+            names = [name for name, _ in history.identities]
+            duplicates = 0
+
+            for c in range(history.commits):
+                sha = bytes(history.shas[c * SHA_BYTES:(c + 1) * SHA_BYTES])
+                if sha in seen:
+                    duplicates += 1
+                    continue
+                seen.add(sha)
+
+                commits += 1
+                added += history.added[c]
+                removed += history.removed[c]
+                identity_id = history.identity_ids[c]
+                person = person_of[identity_id]
+                counts = name_counts.setdefault(person, {})
+                counts[names[identity_id]] = counts.get(names[identity_id], 0) + 1
+                timestamps.setdefault(person, array('q')).append(history.timestamps[c])
+
+            family_files.setdefault(families.find(i), set()).update(history.files)
+            report.append({
+                'repo_path': history.repo_path,
+                'commits': history.commits,
+                'duplicate_commits': duplicates,
+                'seconds': round(history.seconds, 2),
+                'error': None,
+            })
+
+        report += [{'repo_path': h.repo_path, 'commits': 0, 'duplicate_commits': 0,
+                    'seconds': round(h.seconds, 2), 'error': h.error} for h in histories if h.error]
+
+        # Display name: the most frequent name of each person (ties alphabetical)
+        authors: Dict[str, int] = {}
+        for counts in name_counts.values():
+            display = min(counts, key=lambda name: (-counts[name], name))
+            authors[display] = authors.get(display, 0) + sum(counts.values())
+        authors = dict(sorted(authors.items(), key=lambda item: (-item[1], item[0])))
+
+        activity = estimate_session_hours(timestamps, self.session_gap_hours, self.session_lead_in_hours)
+        firsts = [h.first for h in ok if h.first]
+        lasts = [h.last for h in ok if h.last]
+        first = datetime.fromisoformat(min(firsts)[1]) if firsts else None
+        last = datetime.fromisoformat(max(lasts)[1]) if lasts else None
+        net_lines = added - removed
+
+        return {
+            'timeline': {
+                'start_date': first.strftime('%Y-%m-%d') if first else None,
+                'end_date': last.strftime('%Y-%m-%d') if last else None,
+                'total_hours': round(activity.hours, 1),
+                'sessions': activity.sessions,
+                'duration_days': (last - first).days if first else 0,
+            },
+            'git_stats': {
+                'total_commits': commits,
+                'files_changed': sum(len(files) for files in family_files.values()),
+                'lines_of_code': net_lines,
+                'lines_added': added,
+                'lines_removed': removed,
+                'repositories': len(ok),
+                'contributors': len(authors),
+            },
+            'reality_check': {
+                'commits_per_hour': round(commits / max(activity.hours, 0.1), 1),
+                'lines_per_commit': round(net_lines / max(commits, 1), 0),
+            },
+            'authors': authors,
+            'repositories': report,
+        }
+
+    def run(self, repo_paths: Iterable[str]) -> Dict[str, Any]:
+        """Collect and aggregate in one call."""
+        return self.aggregate(self.collect(repo_paths))
+
+
+def extract_portfolio_kpis(repo_paths: Iterable[str], **options) -> Dict[str, Any]:
+    """
+    Combined KPIs of many repositories, formatted for Arkify YAML input.
+
+    Args:
+        repo_paths: Repository directories
+        **options: PortfolioAggregator options (workers, timeout, exclude, ...)
+
+    Returns:
+        Dict with timeline, git_stats, reality_check, authors, repositories
+    """
+    return PortfolioAggregator(**options).run(repo_paths)
+
+
+if __name__ == '__main__':
+    import json
+    import sys
+
+    print(json.dumps(extract_portfolio_kpis(sys.argv[1:] or ['.']), indent=2))